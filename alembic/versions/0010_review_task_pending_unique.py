@@ -0,0 +1,31 @@
+"""Add partial unique index on pending review tasks.
+
+At most one PENDING review task may exist per (queue_type, subject_id).
+QueueManager.create_task inserts with ON CONFLICT DO NOTHING against it,
+replacing the SELECT-then-INSERT duplicate check.
+
+Revision ID: 0010_review_task_pending_unique
+Revises: 0009_detection_review_decisions
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_review_task_pending_unique"
+down_revision = "0009_detection_review_decisions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "review_task_pending_unique",
+        "review_tasks",
+        ["queue_type", "subject_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("review_task_pending_unique", table_name="review_tasks")
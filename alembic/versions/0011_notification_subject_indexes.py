@@ -0,0 +1,38 @@
+"""Index notification_subjects on review status and canonical contacts.
+
+Workflow and QC sampling filter by review_status ordered by created_at;
+the Deduplicator looks subjects up by canonical_email / canonical_phone.
+The contact indexes are partial (NOT NULL) and deliberately not unique —
+the same contact may legitimately appear on subjects in other projects.
+
+Revision ID: 0011_notification_subject_indexes
+Revises: 0010_review_task_pending_unique
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_notification_subject_indexes"
+down_revision = "0010_review_task_pending_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ns_status_created",
+        "notification_subjects",
+        ["review_status", "created_at"],
+    )
+    for column in ("canonical_email", "canonical_phone"):
+        op.create_index(
+            f"ix_ns_{column}",
+            "notification_subjects",
+            [column],
+            postgresql_where=sa.text(f"{column} IS NOT NULL"),
+            sqlite_where=sa.text(f"{column} IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    for name in ("ix_ns_canonical_phone", "ix_ns_canonical_email", "ix_ns_status_created"):
+        op.drop_index(name, table_name="notification_subjects")
@@ -5,7 +5,7 @@ appear in any response from these routes (enforced by PIIFilterMiddleware).
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -65,17 +65,37 @@ _DECISION_TARGET: dict[str, str] = {
 
 @router.get("/queues", summary="Counts per queue type")
 def get_queue_counts(qm: QueueManager = Depends(get_queue_manager)):
-    return {qt: len(qm.get_queue(qt)) for qt in sorted(VALID_QUEUE_TYPES)}
+    return {qt: qm.count_queue(qt) for qt in sorted(VALID_QUEUE_TYPES)}
 
 
 @router.get("/queues/{queue_type}", summary="List PENDING tasks for a queue")
-def get_queue(queue_type: str, qm: QueueManager = Depends(get_queue_manager)):
+def get_queue(
+    queue_type: str,
+    limit: int | None = Query(None, ge=1, description="Max number of tasks to return"),
+    offset: int = Query(0, ge=0, description="Number of oldest tasks to skip"),
+    qm: QueueManager = Depends(get_queue_manager),
+):
     if queue_type not in VALID_QUEUE_TYPES:
         raise HTTPException(status_code=400, detail=f"Invalid queue_type: {queue_type!r}")
-    tasks = qm.get_queue(queue_type)
+    tasks = qm.get_queue(queue_type, limit=limit, offset=offset)
     return [_serialize_task(t) for t in tasks]
 
 
+@router.post("/queues/{queue_type}/claim", summary="Claim the oldest PENDING task")
+def claim_next_task(
+    queue_type: str,
+    body: AssignBody,
+    qm: QueueManager = Depends(get_queue_manager),
+):
+    try:
+        task = qm.claim_next(queue_type, body.reviewer_id, body.role)
+    except (ValueError, PermissionError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"No PENDING tasks in queue {queue_type!r}")
+    return _serialize_task(task)
+
+
 @router.post("/tasks/{task_id}/assign", summary="Assign a review task")
 def assign_task(
     task_id: str,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, JSON, String, Text, UniqueConstraint, func, text as sql_text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint, func, text as sql_text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -260,6 +260,18 @@ class ReviewTask(Base):
     """
 
     __tablename__ = "review_tasks"
+    # At most one PENDING task per subject + queue; create_task relies on it
+    # for INSERT ... ON CONFLICT DO NOTHING.
+    __table_args__ = (
+        Index(
+            "review_task_pending_unique",
+            "queue_type",
+            "subject_id",
+            unique=True,
+            postgresql_where=sql_text("status = 'PENDING'"),
+            sqlite_where=sql_text("status = 'PENDING'"),
+        ),
+    )
 
     review_task_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     queue_type: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -304,6 +316,23 @@ class NotificationSubject(Base):
     """
 
     __tablename__ = "notification_subjects"
+    # Hot filters: workflow/sampling by status (ordered by created_at) and
+    # Deduplicator lookups by canonical email / phone.
+    __table_args__ = (
+        Index("ix_ns_status_created", "review_status", "created_at"),
+        Index(
+            "ix_ns_canonical_email",
+            "canonical_email",
+            postgresql_where=sql_text("canonical_email IS NOT NULL"),
+            sqlite_where=sql_text("canonical_email IS NOT NULL"),
+        ),
+        Index(
+            "ix_ns_canonical_phone",
+            "canonical_phone",
+            postgresql_where=sql_text("canonical_phone IS NOT NULL"),
+            sqlite_where=sql_text("canonical_phone IS NOT NULL"),
+        ),
+    )
 
     subject_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     project_id: Mapped[UUID | None] = mapped_column(ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +42,15 @@ _NON_LATIN_RANGES: tuple[tuple[int, int], ...] = (
     (0xAC00, 0xD7AF),  # Korean Hangul syllables
 )
 
+# One character class covering every range above; the scan runs in C
+_NON_LATIN_RE = re.compile(
+    "[" + "".join(f"\\u{start:04x}-\\u{end:04x}" for start, end in _NON_LATIN_RANGES) + "]"
+)
+
 
 def _has_non_latin_chars(text: str) -> bool:
     """Return True if *text* contains any character from a non-Latin script."""
-    for char in text:
-        cp = ord(char)
-        for start, end in _NON_LATIN_RANGES:
-            if start <= cp <= end:
-                return True
-    return False
+    return _NON_LATIN_RE.search(text) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -184,3 +185,13 @@ def normalize_name(raw: str) -> str:
 
     # 5. Title-case (handles apostrophes correctly: o'brien → O'Brien)
     return text.title()
+
+
+@lru_cache(maxsize=65536)
+def normalize_name_cached(raw: str) -> str:
+    """Memoised :func:`normalize_name`.
+
+    The same raw name recurs on every record extracted for one person;
+    ``normalize_name`` is pure, so results are cached on the raw string.
+    """
+    return normalize_name(raw)
@@ -29,12 +29,16 @@ BlockType = Literal["prose", "table_cell", "table_header"]
 _VALID_BLOCK_TYPES: frozenset[str] = frozenset({"prose", "table_cell", "table_header"})
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedBlock:
     """Canonical unit of content emitted by every reader.
 
     Readers must not pass raw strings downstream. All content must be
     wrapped in ExtractedBlock so provenance is always preserved.
+
+    Slotted: large tables emit one block per cell, so instances carry no
+    per-object __dict__.  Fields stay mutable (readers may annotate
+    col_header), but attributes outside the field contract are rejected.
     """
 
     # Core content
@@ -23,7 +23,16 @@ def classify_page(page: object) -> PageClass:
     Calls page.get_text() with no arguments (plain text, not dict mode)
     and counts whitespace-separated tokens to determine the label.
     """
-    word_count = len(page.get_text().split())
+    return classify_text(page.get_text())
+
+
+def classify_text(text: str) -> PageClass:
+    """Return the processing-path label for a page's plain text layer.
+
+    Lets callers that already hold page.get_text() (e.g. the onset scan)
+    classify without extracting the text a second time.
+    """
+    word_count = len(text.split())
     if word_count > 50:
         return "digital"
     if word_count > 5:
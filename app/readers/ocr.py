@@ -40,6 +40,7 @@ class OCREngine:
         lang: str = "en",
         det_model_dir: str | None = None,
         rec_model_dir: str | None = None,
+        rec_batch_num: int = 16,
     ) -> None:
         """Load PaddleOCR model weights.
 
@@ -55,6 +56,12 @@ class OCREngine:
             Path to a locally staged text recognition model directory.
             If None, PaddleOCR uses its own default cache location.
             Must be set to a local path in air-gap deployments.
+        rec_batch_num:
+            Number of detected text-line crops recognised per model call
+            (PaddleOCR default is 6).  A dense page yields dozens of
+            crops, so a larger batch amortises per-call dispatch over more
+            lines.  PaddleOCR 2.x ocr() accepts one image per call, so this
+            is the batching point available within a page.
         """
         self._lang = lang
         kwargs: dict[str, object] = {
@@ -62,6 +69,7 @@ class OCREngine:
             "lang": lang,
             "show_log": False,       # suppress PaddleOCR stdout chatter
             "use_gpu": False,        # CPU inference; GPU support is opt-in at deploy time
+            "rec_batch_num": rec_batch_num,
         }
         if det_model_dir is not None:
             kwargs["det_model_dir"] = det_model_dir
@@ -76,7 +84,7 @@ class OCREngine:
 
     def ocr_page_image(
         self,
-        image: object,      # PyMuPDF fitz.Pixmap
+        image: object,      # numpy ndarray or PyMuPDF fitz.Pixmap
         page_num: int,
         source_path: str,
     ) -> list[ExtractedBlock]:
@@ -85,8 +93,9 @@ class OCREngine:
         Parameters
         ----------
         image:
-            PyMuPDF Pixmap produced by ``page.get_pixmap()``.  Converted to
-            a numpy uint8 array of shape (H, W, channels) before inference.
+            Either a numpy uint8 array of shape (H, W, channels), passed to
+            PaddleOCR as-is, or a PyMuPDF Pixmap produced by
+            ``page.get_pixmap()``, which is converted to such an array.
         page_num:
             0-based page index forwarded to ``page_or_sheet`` on each block.
         source_path:
@@ -98,9 +107,12 @@ class OCREngine:
             One block per detected text line.  bbox is in pixel coordinates
             of the rendered image.  Whitespace-only detections are dropped.
         """
-        img_array = np.frombuffer(image.samples, dtype=np.uint8).reshape(
-            image.height, image.width, image.n
-        )
+        if isinstance(image, np.ndarray):
+            img_array = image
+        else:
+            img_array = np.frombuffer(image.samples, dtype=np.uint8).reshape(
+                image.height, image.width, image.n
+            )
         # cls=False: do not run angle classifier (model not loaded at init)
         result = self._ocr.ocr(img_array, cls=False)
 
@@ -14,6 +14,8 @@ from __future__ import annotations
 
 import re
 
+from app.readers.classifier import PageClass, classify_text
+
 ONSET_SIGNALS: list[str] = [
     r'\b(name|ssn|date of birth|dob|address|account|policy)\b',
     r'\d{3}-\d{2}-\d{4}',    # SSN pattern
@@ -26,7 +28,7 @@ _COMPILED_SIGNALS: list[re.Pattern[str]] = [
 ]
 
 
-def find_data_onset(doc: object) -> int:
+def find_data_onset(doc: object, labels: dict[int, PageClass] | None = None) -> int:
     """Return the page index where extraction should begin.
 
     Scans pages 0..N-1 in order. On the first page that contains any
@@ -36,10 +38,16 @@ def find_data_onset(doc: object) -> int:
     Returns 0 if no signals are found anywhere in the document.
     Memory rule: doc._forget_page(page_num) is called after each page
     to release memory immediately (CLAUDE.md § 2).
+
+    When labels is given, every scanned page is also classified from the
+    text already extracted here (classify_text) and recorded as
+    labels[page_num], so the reader need not classify those pages again.
     """
     for page_num in range(len(doc)):
         text = doc.load_page(page_num).get_text()
         doc._forget_page(page_num)
+        if labels is not None:
+            labels[page_num] = classify_text(text)
         if any(pattern.search(text) for pattern in _COMPILED_SIGNALS):
             return max(0, page_num - 1)
     return 0
@@ -3,34 +3,65 @@
 Architecture
 ------------
 Every page is classified by classifier.py before processing:
-  - digital   → text extracted directly via PyMuPDF get_text("dict")
+  - digital   → text extracted directly via PyMuPDF get_text("blocks")
   - scanned   → rendered to image, passed to PaddleOCR (ocr.py)
   - corrupted → sparse/degraded text layer; re-OCR'd with PaddleOCR
 
 Table extraction
 ----------------
 pdfplumber is permitted exclusively for table detection on each page
-(find_tables / extract_tables only). All other text comes from PyMuPDF.
+(find_tables + Table.extract only). All other text comes from PyMuPDF.
+pdfplumber is only consulted for pages whose PyMuPDF drawings contain
+enough lines/rectangles to form a ruled table.
 Table cells are emitted as ExtractedBlock with block_type="table_cell" or
 "table_header", a shared table_id, and col_header/row_index populated.
 
 Memory rule
 -----------
 doc._forget_page(n) is called immediately after each page is processed.
-The full document is never resident in memory at once.
+The full document is never resident in memory at once.  The file itself is
+memory-mapped (_mapped_pdf) and both PyMuPDF and pdfplumber read from the
+mapping, so the OS pages bytes in on demand instead of buffering them.
+
+OCR pipelining
+--------------
+Scanned/corrupted pages are rendered on the reading thread and OCR'd on a
+background thread (_OCRStage), so OCR inference on page n overlaps with
+rendering, classification and table detection of page n+1.  Pages are
+still emitted, stitched and checkpointed strictly in page order.
+
+Parallel mode
+-------------
+With max_workers > 1 the page range after onset is split into small
+contiguous shards (_PARALLEL_SHARD_PAGES pages each) fed to a pool of
+max_workers processes.  Each worker opens its own fitz and
+pdfplumber handles per shard and returns plain block dicts; its OCREngine,
+which is not thread-safe, is created once per worker process and reused
+across shards.  Stitching and checkpointing stay in the parent
+process and run strictly in page order.
 """
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import queue
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from multiprocessing import get_context
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
 import fitz  # PyMuPDF
+import numpy as np
 import pdfplumber
 
 from app.readers.base import BaseReader, ExtractedBlock
-from app.readers.classifier import classify_page
+from app.readers.classifier import PageClass, classify_page
 from app.readers.onset import find_data_onset
 from app.readers.stitcher import PageStitcher
 
@@ -39,6 +70,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rendered pages waiting on (or in) background OCR.
+# Bounds raster memory while still letting OCR overlap with PDF I/O.
+_OCR_QUEUE_DEPTH: int = 4
+
+# Render zoom for scanned pages (grayscale).  Corrupted pages keep 2× RGB.
+_OCR_ZOOM: float = 1.5
+
+# Table pre-check: edges contributed by each PyMuPDF drawing item type
+# ("l" line, "re" rectangle, "qu" quad).  One ruled cell needs four edges.
+_DRAWING_EDGES: dict[str, int] = {"l": 1, "re": 4, "qu": 4}
+_MIN_TABLE_EDGES: int = 4
+
+# Pages per work unit in parallel mode.  Many small shards are fed to the
+# worker pool so load stays balanced and results return in small steps.
+_PARALLEL_SHARD_PAGES: int = 8
+
+# Pages between checkpoint writes to the database.  The in-memory checkpoint
+# still advances every page; a crash re-processes at most this many pages.
+_CHECKPOINT_EVERY_PAGES: int = 25
+
+# OCREngine of the current parallel-mode worker process.  Created by the
+# worker's first scanned page and reused by every later shard it runs.
+_worker_ocr_engine: object | None = None
+
 
 def _bbox_overlaps(
     block_bbox: tuple[float, float, float, float],
@@ -50,6 +105,196 @@ def _bbox_overlaps(
     return not (bx1 <= tx0 or bx0 >= tx1 or by1 <= ty0 or by0 >= ty1)
 
 
+def _overlap_mask(
+    block_bboxes: list[tuple[float, float, float, float]],
+    table_bboxes: list[tuple[float, float, float, float]],
+) -> np.ndarray:
+    """Vectorised _bbox_overlaps: True for each block overlapping any table.
+
+    Evaluates every (block, table) pair in one broadcast comparison instead
+    of a Python-level loop; edge-touching boxes do not overlap.
+    """
+    bb = np.asarray(block_bboxes, dtype=np.float64).reshape(-1, 4)[:, None, :]
+    tb = np.asarray(table_bboxes, dtype=np.float64).reshape(-1, 4)[None, :, :]
+    disjoint = (
+        (bb[..., 2] <= tb[..., 0])
+        | (bb[..., 0] >= tb[..., 2])
+        | (bb[..., 3] <= tb[..., 1])
+        | (bb[..., 1] >= tb[..., 3])
+    )
+    return ~disjoint.all(axis=1)
+
+
+def _has_ruling_lines(page: object) -> bool:
+    """Return True if the page has enough vector edges to bound a table.
+
+    pdfplumber's default table strategy builds cells from drawn lines and
+    rectangle edges; a table needs at least _MIN_TABLE_EDGES of them.
+    page.get_cdrawings() is PyMuPDF's compiled, low-overhead path listing.
+    """
+    edges = 0
+    for path in page.get_cdrawings():
+        for item in path.get("items", ()):
+            edges += _DRAWING_EDGES.get(item[0], 0)
+            if edges >= _MIN_TABLE_EDGES:
+                return True
+    return False
+
+
+def _page_text(prose_blocks: list[ExtractedBlock]) -> str:
+    """Join prose block text into the page text fed to the stitcher."""
+    return "\n".join(b.text for b in prose_blocks)
+
+
+def _is_ready(prose: list[ExtractedBlock] | Future) -> bool:
+    return not isinstance(prose, Future) or prose.done()
+
+
+def _pixmap_array(pix: object) -> np.ndarray:
+    """Return a zero-copy uint8 view over a Pixmap's samples.
+
+    Shape is (H, W) for single-channel (grayscale) pixmaps, else (H, W, n).
+
+    Built on pix.samples_mv (a memoryview of MuPDF's buffer) rather than
+    pix.samples (a full bytes copy of the raster).  The view is only valid
+    while pix is alive, so callers must keep the Pixmap referenced until
+    OCR on the array has finished.  Reading the buffer makes no MuPDF
+    calls, so the OCR thread may consume the array.
+    """
+    samples = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+    if pix.n == 1:
+        # PaddleOCR expands 2-D (grayscale) arrays to BGR itself.
+        return samples.reshape(pix.height, pix.width)
+    return samples.reshape(pix.height, pix.width, pix.n)
+
+
+class _OCRStage:
+    """Background OCR consumer for the render → classify → OCR pipeline.
+
+    The reading thread owns every PyMuPDF/pdfplumber call (render, classify,
+    table and prose extraction) and pushes rendered scanned pages, as
+    zero-copy arrays over their Pixmaps, onto a bounded queue; a single
+    worker thread runs OCR inference so it overlaps with PDF I/O on the
+    following pages.  One worker keeps the OCREngine single-threaded, as it
+    requires.  The thread is started on first use.
+    """
+
+    def __init__(self, maxsize: int = _OCR_QUEUE_DEPTH) -> None:
+        self._queue: queue.Queue[tuple | None] = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        engine: object,
+        image: np.ndarray,
+        page_num: int,
+        source_path: str,
+        owner: object = None,
+    ) -> Future:
+        """Queue one page for OCR; returns a Future of its prose blocks.
+
+        owner is whatever object owns image's memory (the Pixmap behind a
+        _pixmap_array view); it is held until OCR of the page completes.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="pdf-ocr", daemon=True
+            )
+            self._thread.start()
+        future: Future = Future()
+        self._queue.put((future, engine, image, page_num, source_path, owner))
+        return future
+
+    def close(self) -> None:
+        """Stop the worker thread after it drains the queue."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, engine, image, page_num, source_path, _owner = item
+            try:
+                future.set_result(engine.ocr_page_image(image, page_num, source_path))
+            except BaseException as exc:  # noqa: BLE001 — re-raised by Future.result()
+                future.set_exception(exc)
+            # Release the raster (and its owning Pixmap) before blocking on
+            # the next queue item.
+            del item, image, _owner
+
+
+@contextmanager
+def _mapped_pdf(path: str) -> Iterator[tuple[mmap.mmap, memoryview]]:
+    """Memory-map path read-only; yield (mapping, view) for the PDF parsers.
+
+    PyMuPDF opens the zero-copy view (fitz.open(stream=view)); pdfplumber
+    reads the mapping as a seekable file.  Both must be closed before the
+    block exits — the view is released before the mapping is unmapped.
+    """
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            yield mm, view
+
+
+def _shard_pages(start: int, stop: int, shard_size: int) -> list[list[int]]:
+    """Split range(start, stop) into contiguous page lists of shard_size pages.
+
+    The last shard may be shorter.  Small shards keep workers load-balanced
+    when some pages are OCR-heavy and let results stream back in page order.
+    """
+    shard_size = max(1, shard_size)
+    return [
+        list(range(first, min(first + shard_size, stop)))
+        for first in range(start, stop, shard_size)
+    ]
+
+
+def _init_worker() -> None:
+    """ProcessPoolExecutor initializer: each worker starts without an engine."""
+    global _worker_ocr_engine
+    _worker_ocr_engine = None
+
+
+def _process_page_range(
+    path: str,
+    page_nums: list[int],
+) -> list[tuple[int, list[dict[str, Any]], str]]:
+    """Worker entry point for parallel mode: process a contiguous shard.
+
+    Opens private fitz/pdfplumber handles for the shard and returns
+    (page_num, block_dicts, prose_text) per page.  Blocks are returned as
+    dicts rather than ExtractedBlock objects to keep pickling cheap.  The
+    worker's OCREngine is kept in _worker_ocr_engine between shards.
+    """
+    global _worker_ocr_engine
+    reader = PDFReader(path)
+    results: list[tuple[int, list[dict[str, Any]], str]] = []
+    ocr_engine = _worker_ocr_engine
+    with _mapped_pdf(path) as (mm, view):
+        doc = fitz.open(stream=view, filetype="pdf")
+        try:
+            with pdfplumber.open(mm) as plumber_doc:
+                for page_num in page_nums:
+                    page = doc.load_page(page_num)
+                    table_blocks, prose_blocks, ocr_engine = reader._process_page(
+                        page, page_num, plumber_doc, ocr_engine
+                    )
+                    doc._forget_page(page_num)
+                    results.append((
+                        page_num,
+                        [asdict(b) for b in table_blocks + prose_blocks],
+                        _page_text(prose_blocks),
+                    ))
+        finally:
+            _worker_ocr_engine = ocr_engine
+            doc.close()
+    return results
+
+
 class PDFReader(BaseReader):
     """Stream a PDF file page-by-page and emit ExtractedBlock objects."""
 
@@ -58,6 +303,7 @@ class PDFReader(BaseReader):
         path: str | Path,
         db_session: Session | None = None,
         db_document_id: str | None = None,
+        max_workers: int | None = 1,
     ) -> None:
         """Create a PDFReader.
 
@@ -68,15 +314,27 @@ class PDFReader(BaseReader):
         db_session:
             Optional SQLAlchemy Session.  When provided together with
             db_document_id, checkpoint data is persisted to the Document
-            record's metadata_json after every completed page.
+            record's metadata_json every _CHECKPOINT_EVERY_PAGES completed
+            pages and once more when reading stops.
         db_document_id:
             UUID string of the Document ORM record for this file.  Required
             when db_session is provided; ignored otherwise.
+        max_workers:
+            Number of worker processes used to process pages.  1 (default)
+            keeps the sequential single-process path; None uses
+            os.cpu_count().  Each worker holds its own open document, so
+            peak memory grows with the worker count.
         """
         super().__init__(path)
+        # Stringified once: used for every block's source_path and handle.
+        self._source = str(self.path)
         self._checkpoint: dict[str, Any] = {}
         self._db_session = db_session
         self._db_document_id = db_document_id
+        self._ckpt_every = _CHECKPOINT_EVERY_PAGES
+        self._pages_since_flush = 0
+        self._page_labels: dict[int, PageClass] = {}
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
 
     @property
     def checkpoint(self) -> dict[str, Any]:
@@ -90,65 +348,213 @@ class PDFReader(BaseReader):
     def read(self) -> list[ExtractedBlock]:
         """Process all pages from onset_page onward and return blocks.
 
+        Thin wrapper over read_iter() for callers that need a list.
+        """
+        return list(self.read_iter())
+
+    def read_iter(self) -> Iterator[ExtractedBlock]:
+        """Yield blocks page by page from onset_page onward.
+
         Streams pages one at a time; doc._forget_page is called after each
-        page to release memory immediately (CLAUDE.md § 2 memory rule).
+        page to release memory immediately (CLAUDE.md § 2 memory rule), and
+        each page's blocks are yielded as soon as the page completes, so
+        the caller decides how many blocks stay resident.  The checkpoint
+        for a page is written before its blocks are yielded.
         """
-        doc = fitz.open(str(self.path))
-        onset_page = find_data_onset(doc)
+        try:
+            yield from self._iter_pages()
+        finally:
+            self._flush_checkpoint()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _iter_pages(self) -> Iterator[ExtractedBlock]:
+        """Body of read_iter(): dispatch to the sequential or parallel path."""
+        with _mapped_pdf(self._source) as (mm, view):
+            doc = fitz.open(stream=view, filetype="pdf")
+            # Pages the onset scan reads are classified from the same text.
+            self._page_labels = {}
+            onset_page = find_data_onset(doc, self._page_labels)
+            page_count = len(doc)
+
+            if self._max_workers > 1 and page_count - onset_page > 1:
+                doc.close()
+            else:
+                yield from self._iter_sequential(doc, mm, onset_page, page_count)
+                return
+        # Workers map the file themselves; release ours before fanning out.
+        yield from self._iter_parallel(onset_page, page_count)
+
+    def _iter_sequential(
+        self,
+        doc: object,
+        mm: mmap.mmap,
+        onset_page: int,
+        page_count: int,
+    ) -> Iterator[ExtractedBlock]:
+        """Process pages in this process, OCR overlapped on a background thread."""
+
         stitcher = PageStitcher()
         # OCR engine created lazily on first scanned/corrupted page
         ocr_engine = None
-        document_id = str(self.path)
-        all_blocks: list[ExtractedBlock] = []
-
-        with pdfplumber.open(str(self.path)) as plumber_doc:
-            for page_num in range(onset_page, len(doc)):
-                page = doc.load_page(page_num)
-                page_blocks, ocr_engine = self._process_page(
-                    page, page_num, plumber_doc, stitcher, ocr_engine
-                )
-                all_blocks.extend(page_blocks)
-                doc._forget_page(page_num)
-                self._write_checkpoint(document_id, page_num, all_blocks)
+        ocr_stage = _OCRStage()
+        document_id = self._source
+        # Pages whose OCR may still be running, in page order.
+        pending: deque[tuple[int, list[ExtractedBlock], list[ExtractedBlock] | Future]] = deque()
+
+        def emit_ready(block: bool) -> Iterator[ExtractedBlock]:
+            while pending and (block or _is_ready(pending[0][2])):
+                page_num, table_blocks, prose = pending.popleft()
+                if isinstance(prose, Future):
+                    prose_blocks = self._resolve_ocr(doc, page_num, table_blocks, prose)
+                else:
+                    prose_blocks = prose
+                # Feed prose text through the tail-buffer stitcher so
+                # cross-page PII boundaries are tracked downstream.
+                stitcher.stitch(page_num, _page_text(prose_blocks))
+                page_blocks = table_blocks + prose_blocks
+                self._write_checkpoint(document_id, page_num, page_blocks)
+                yield from page_blocks
 
-        doc.close()
-        return all_blocks
+        try:
+            with pdfplumber.open(mm) as plumber_doc:
+                for page_num in range(onset_page, page_count):
+                    page = doc.load_page(page_num)
+                    table_blocks, prose, ocr_engine = self._process_page(
+                        page, page_num, plumber_doc, ocr_engine, ocr_stage,
+                        label=self._page_labels.pop(page_num, None),
+                    )
+                    doc._forget_page(page_num)
+                    pending.append((page_num, table_blocks, prose))
+                    # Bound the number of rendered pages held in memory.
+                    yield from emit_ready(block=len(pending) > _OCR_QUEUE_DEPTH)
+                yield from emit_ready(block=True)
+        finally:
+            ocr_stage.close()
+            doc.close()
+
+    def _iter_parallel(self, onset_page: int, page_count: int) -> Iterator[ExtractedBlock]:
+        """Process pages onset_page..page_count-1 across worker processes.
+
+        Shards are consumed in page order so the stitcher sees pages
+        sequentially; the checkpoint is written for every page as it is
+        consumed, so it only ever advances over a contiguous prefix of
+        completed pages.  Unstarted shards are cancelled if the caller
+        stops iterating early.
+        """
+        source = self._source
+        shards = _shard_pages(onset_page, page_count, _PARALLEL_SHARD_PAGES)
+        stitcher = PageStitcher()
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+        with ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(shards)),
+            mp_context=get_context("forkserver"),
+            initializer=_init_worker,
+        ) as pool:
+            futures = [
+                pool.submit(_process_page_range, source, shard) for shard in shards
+            ]
+            try:
+                for future in futures:
+                    for page_num, block_dicts, prose_text in future.result():
+                        stitcher.stitch(page_num, prose_text)
+                        page_blocks = [ExtractedBlock(**d) for d in block_dicts]
+                        self._write_checkpoint(source, page_num, page_blocks)
+                        yield from page_blocks
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _resolve_ocr(
+        self,
+        doc: object,
+        page_num: int,
+        table_blocks: list[ExtractedBlock],
+        future: Future,
+    ) -> list[ExtractedBlock]:
+        """Wait for background OCR of one page; fall back to PyMuPDF text.
+
+        PaddleOCR may raise ImportError lazily from inside ocr() on the OCR
+        thread.  That keeps the same fallback as a missing engine: the page
+        is reloaded on this (the reading) thread and its text layer used.
+        """
+        try:
+            return future.result()
+        except (ImportError, ModuleNotFoundError):
+            logger.warning(
+                "PaddleOCR not available; falling back to PyMuPDF text "
+                "for page %d",
+                page_num,
+            )
+            # Table regions are recovered from the emitted table blocks.
+            table_bboxes = list(dict.fromkeys(b.bbox for b in table_blocks))
+            page = doc.load_page(page_num)
+            try:
+                return self._extract_prose(page, page_num, table_bboxes)
+            finally:
+                doc._forget_page(page_num)
 
     def _process_page(
         self,
         page: object,
         page_num: int,
         plumber_doc: object,
-        stitcher: PageStitcher,
         ocr_engine: object | None,
-    ) -> tuple[list[ExtractedBlock], object | None]:
+        ocr_stage: _OCRStage | None = None,
+        label: PageClass | None = None,
+    ) -> tuple[list[ExtractedBlock], list[ExtractedBlock] | Future, object | None]:
         """Classify the page and dispatch to the appropriate extraction path.
 
-        Returns (blocks, ocr_engine) — ocr_engine may be lazily created.
-        """
-        label = classify_page(page)
-        source = str(self.path)
+        label is the page's classification when already known (from the
+        onset scan); otherwise the page is classified here.
 
-        # Table extraction via pdfplumber (permitted for table detection only)
-        table_blocks, table_bboxes = self._extract_tables(
-            plumber_doc.pages[page_num], page_num
-        )
+        Returns (table_blocks, prose, ocr_engine) — ocr_engine may be lazily
+        created.  prose is a list of blocks, or a Future resolving to one
+        when the page was handed to ocr_stage for background OCR.
+        """
+        if label is None:
+            label = classify_page(page)
+        source = self._source
+
+        # Table extraction via pdfplumber (permitted for table detection only).
+        # Pages without ruling lines cannot yield a lines-strategy table, so
+        # pdfplumber's page is never even parsed for them.
+        if _has_ruling_lines(page):
+            table_blocks, table_bboxes = self._extract_tables(
+                plumber_doc.pages[page_num], page_num
+            )
+        else:
+            table_blocks, table_bboxes = [], []
 
         if label == "digital":
-            prose_blocks = self._extract_prose(page, page_num, table_bboxes)
+            prose = self._extract_prose(page, page_num, table_bboxes)
         else:
             # scanned or corrupted: render to raster image and OCR
             try:
                 if ocr_engine is None:
                     from app.readers.ocr import OCREngine
                     ocr_engine = OCREngine()
-                mat = fitz.Matrix(2, 2)  # 2× zoom improves OCR accuracy
-                pix = page.get_pixmap(matrix=mat)
-                prose_blocks = ocr_engine.ocr_page_image(pix, page_num, source)
+                if label == "corrupted":
+                    # Degraded pages: 2× RGB keeps the detail the damaged
+                    # text layer suggests the scan may lack.
+                    mat = fitz.Matrix(2, 2)
+                    pix = page.get_pixmap(matrix=mat)
+                else:
+                    # Clean scans: ~108 DPI grayscale is enough for the
+                    # colour-invariant detector at a fraction of the bytes.
+                    mat = fitz.Matrix(_OCR_ZOOM, _OCR_ZOOM)
+                    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+                # OCR reads the Pixmap's buffer in place — no raster copy.
+                raster = _pixmap_array(pix)
+                if ocr_stage is None:
+                    prose = ocr_engine.ocr_page_image(raster, page_num, source)
+                else:
+                    prose = ocr_stage.submit(
+                        ocr_engine, raster, page_num, source, owner=pix
+                    )
+                del pix, raster
             except (ImportError, ModuleNotFoundError):
                 # PaddleOCR not installed — fall back to whatever text
                 # PyMuPDF can extract (may be sparse but better than crashing)
@@ -157,14 +563,9 @@ class PDFReader(BaseReader):
                     "for %s page %d (classified as %s)",
                     label, page_num, label,
                 )
-                prose_blocks = self._extract_prose(page, page_num, table_bboxes)
-
-        # Feed prose text through the tail-buffer stitcher so cross-page PII
-        # boundaries are tracked for the downstream PII extraction stage.
-        page_text = "\n".join(b.text for b in prose_blocks)
-        stitcher.stitch(page_num, page_text)
+                prose = self._extract_prose(page, page_num, table_bboxes)
 
-        return table_blocks + prose_blocks, ocr_engine
+        return table_blocks, prose, ocr_engine
 
     def _extract_tables(
         self,
@@ -176,14 +577,18 @@ class PDFReader(BaseReader):
         Returns (blocks, table_bboxes).  table_bboxes is forwarded to
         _extract_prose so overlapping text blocks are excluded from prose.
         """
-        source = str(self.path)
+        source = self._source
         blocks: list[ExtractedBlock] = []
         table_bboxes: list[tuple[float, float, float, float]] = []
 
+        # One detection pass: extract_tables() would re-run find_tables()
+        # internally, so rows are pulled from each detected Table instead.
         detected_tables = plumber_page.find_tables()
-        all_table_data = plumber_page.extract_tables()
+        if not detected_tables:
+            return blocks, table_bboxes
 
-        for table_obj, rows in zip(detected_tables, all_table_data):
+        for table_obj in detected_tables:
+            rows = table_obj.extract()
             if not rows:
                 continue
 
@@ -195,38 +600,30 @@ class PDFReader(BaseReader):
             headers = [
                 str(cell) if cell is not None else "" for cell in rows[0]
             ]
-            for col_idx, cell_text in enumerate(headers):
-                blocks.append(ExtractedBlock(
-                    text=cell_text,
-                    page_or_sheet=page_num,
-                    source_path=source,
-                    file_type="pdf",
-                    block_type="table_header",
-                    bbox=bbox,
-                    row=0,
-                    column=col_idx,
-                    table_id=table_id,
-                    col_header=cell_text,
-                    row_index=0,
-                ))
-
-            # Rows 1+ are data rows
+            # Cells are built positionally, in ExtractedBlock field order:
+            # (text, page_or_sheet, source_path, file_type, block_type, bbox,
+            #  row, column, table_id, col_header, row_index).  One block per
+            # cell makes large tables the hot path; positional calls skip
+            # keyword matching on every construction.
+            blocks.extend([
+                ExtractedBlock(
+                    cell_text, page_num, source, "pdf", "table_header", bbox,
+                    0, col_idx, table_id, cell_text, 0,
+                )
+                for col_idx, cell_text in enumerate(headers)
+            ])
+
+            # Rows 1+ are data rows; cells past the header width get "".
             for row_idx, row in enumerate(rows[1:], start=1):
-                for col_idx, cell_text in enumerate(row):
-                    col_header = headers[col_idx] if col_idx < len(headers) else ""
-                    blocks.append(ExtractedBlock(
-                        text=str(cell_text) if cell_text is not None else "",
-                        page_or_sheet=page_num,
-                        source_path=source,
-                        file_type="pdf",
-                        block_type="table_cell",
-                        bbox=bbox,
-                        row=row_idx,
-                        column=col_idx,
-                        table_id=table_id,
-                        col_header=col_header,
-                        row_index=row_idx,
-                    ))
+                col_headers = headers + [""] * (len(row) - len(headers))
+                blocks.extend([
+                    ExtractedBlock(
+                        str(cell_text) if cell_text is not None else "",
+                        page_num, source, "pdf", "table_cell", bbox,
+                        row_idx, col_idx, table_id, col_header, row_idx,
+                    )
+                    for col_idx, (cell_text, col_header) in enumerate(zip(row, col_headers))
+                ])
 
         return blocks, table_bboxes
 
@@ -236,35 +633,27 @@ class PDFReader(BaseReader):
         page_num: int,
         table_bboxes: list[tuple[float, float, float, float]],
     ) -> list[ExtractedBlock]:
-        """Use PyMuPDF get_text('dict') to extract non-table text blocks.
+        """Use PyMuPDF get_text('blocks') to extract non-table text blocks.
 
         Blocks whose bounding box overlaps any detected table region are
         skipped — their content is already captured via _extract_tables.
         """
-        source = str(self.path)
+        source = self._source
         blocks: list[ExtractedBlock] = []
 
-        raw = page.get_text("dict")
-        for block in raw.get("blocks", []):
-            if block.get("type") != 0:  # 0 = text; 1 = image — skip images
-                continue
-
-            bbox = tuple(block["bbox"])
-            if any(_bbox_overlaps(bbox, tb) for tb in table_bboxes):
-                continue
+        # "blocks" yields (x0, y0, x1, y1, text, block_no, block_type) with
+        # each block's lines already joined by MuPDF.  block_type 0 = text;
+        # 1 = image — skip images.
+        text_blocks = [b for b in page.get_text("blocks") if b[6] == 0]
+        if table_bboxes and text_blocks:
+            in_table = _overlap_mask([b[:4] for b in text_blocks], table_bboxes)
+            text_blocks = [b for b, hit in zip(text_blocks, in_table) if not hit]
 
-            # Concatenate all span text within this block
-            lines_text: list[str] = []
-            for line in block.get("lines", []):
-                span_text = "".join(
-                    span.get("text", "") for span in line.get("spans", [])
-                )
-                if span_text:
-                    lines_text.append(span_text)
-
-            text = "\n".join(lines_text)
+        for x0, y0, x1, y1, raw_text, _block_no, _block_type in text_blocks:
+            text = raw_text.rstrip("\n")
             if not text:
                 continue
+            bbox = (x0, y0, x1, y1)
 
             blocks.append(ExtractedBlock(
                 text=text,
@@ -287,8 +676,9 @@ class PDFReader(BaseReader):
 
         Always updates the in-memory checkpoint dict.  When a db_session and
         db_document_id were provided at construction, also persists
-        last_completed_page to Document.metadata_json so crashed jobs can
-        resume from the correct page.
+        last_completed_page to Document.metadata_json every _ckpt_every
+        pages so crashed jobs can resume from (near) the correct page;
+        read_iter() flushes the remainder when reading stops.
 
         Schema: {"document_id": str, "last_completed_page": int}
         """
@@ -297,8 +687,17 @@ class PDFReader(BaseReader):
             "last_completed_page": page_num,
         }
 
+        self._pages_since_flush += 1
+        if self._pages_since_flush >= self._ckpt_every:
+            self._flush_checkpoint()
+
+    def _flush_checkpoint(self) -> None:
+        """Persist the latest in-memory checkpoint if any page is unflushed."""
+        if not self._pages_since_flush:
+            return
+        self._pages_since_flush = 0
         if self._db_session is not None and self._db_document_id is not None:
-            self._persist_checkpoint_to_db(page_num)
+            self._persist_checkpoint_to_db(self._checkpoint["last_completed_page"])
 
     def _persist_checkpoint_to_db(self, page_num: int) -> None:
         """Flush checkpoint to Document.metadata_json in the database.
@@ -19,6 +19,8 @@ Rules
 from __future__ import annotations
 
 import importlib
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from app.readers.base import BaseReader, ExtractedBlock  # noqa: F401 — re-exported
@@ -43,6 +45,7 @@ def register(extension: str, reader_cls: type[BaseReader]) -> None:
             "extension must be a non-empty string without a leading dot (e.g. 'pdf')"
         )
     _REGISTRY[extension.lower()] = reader_cls
+    _resolve_reader_cls.cache_clear()
 
 
 def get_reader(path: str | Path) -> BaseReader:
@@ -52,30 +55,38 @@ def get_reader(path: str | Path) -> BaseReader:
     for extensions that have no dedicated reader.  Raises ValueError when
     the file has no extension at all (e.g. "Makefile", "README").
     """
-    p = Path(path)
-    ext = p.suffix.lstrip(".").lower()
+    # String split (same rules as Path.suffix) — no Path allocation per call.
+    ext = os.path.splitext(os.fspath(path))[1][1:].lower()
     if not ext:
         raise ValueError(
-            f"Cannot determine file type: {p.name!r} has no file extension. "
+            f"Cannot determine file type: {os.path.basename(path)!r} has no file extension. "
             "Provide a file with an extension or register a default reader."
         )
+    return _resolve_reader_cls(ext)(path)
 
+
+@lru_cache(maxsize=64)
+def _resolve_reader_cls(ext: str) -> type[BaseReader]:
+    """Return the reader class for ext; cached per extension.
+
+    Resolution order: eagerly registered readers, then the lazy registry
+    (imported on first use), then TikaReader.  register() clears the cache.
+    """
     # Check eagerly registered readers first
     reader_cls = _REGISTRY.get(ext)
     if reader_cls is not None:
-        return reader_cls(p)
+        return reader_cls
 
     # Check lazy registry
     lazy_entry = _LAZY_REGISTRY.get(ext)
     if lazy_entry is not None:
         module_path, class_name = lazy_entry
         mod = importlib.import_module(module_path)
-        reader_cls = getattr(mod, class_name)
-        return reader_cls(p)
+        return getattr(mod, class_name)
 
     # Fallback to Tika
     from app.readers.tika_reader import TikaReader
-    return TikaReader(p)
+    return TikaReader
 
 
 def _register_defaults() -> None:
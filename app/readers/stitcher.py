@@ -24,6 +24,8 @@ bleeds across tab boundaries.
 """
 from __future__ import annotations
 
+from collections import deque
+
 TAIL_BUFFER_LINES: int = 5
 
 
@@ -34,7 +36,9 @@ class PageStitcher:
     """
 
     def __init__(self) -> None:
-        self._tail_buffer: list[str] = []
+        self._tail_buffer: deque[str] = deque(maxlen=TAIL_BUFFER_LINES)
+        # "\n".join(self._tail_buffer), cached so stitch() never rejoins.
+        self._tail_text: str = ""
 
     # ------------------------------------------------------------------
     # Public API
@@ -64,15 +68,16 @@ class PageStitcher:
             the boundary between page_num-1 and page_num.
             Zero on the first page or after reset().
         """
-        tail_text = "\n".join(self._tail_buffer)
+        tail_text = self._tail_text
         tail_buffer_len = len(tail_text)
 
         stitched = (tail_text + "\n" + page_text) if self._tail_buffer else page_text
 
         # Update tail buffer: keep only the last TAIL_BUFFER_LINES lines of
         # the current page so future pages can prepend them.
-        lines = page_text.splitlines()
-        self._tail_buffer = lines[-TAIL_BUFFER_LINES:] if lines else []
+        self._tail_buffer.clear()
+        self._tail_buffer.extend(_tail_lines(page_text))
+        self._tail_text = "\n".join(self._tail_buffer)
 
         return stitched, tail_buffer_len
 
@@ -83,7 +88,8 @@ class PageStitcher:
         - Between Excel worksheets (tab isolation rule)
         - Between documents when re-using the same instance
         """
-        self._tail_buffer = []
+        self._tail_buffer.clear()
+        self._tail_text = ""
 
     # ------------------------------------------------------------------
     # Inspection (tests and debugging only)
@@ -93,3 +99,20 @@ class PageStitcher:
     def tail_buffer(self) -> list[str]:
         """Read-only view of the current tail buffer (a copy)."""
         return list(self._tail_buffer)
+
+
+def _tail_lines(page_text: str) -> list[str]:
+    """Return the last TAIL_BUFFER_LINES lines of page_text.
+
+    Equivalent to ``page_text.splitlines()[-TAIL_BUFFER_LINES:]`` but only
+    splits the short suffix after the (TAIL_BUFFER_LINES + 1)-th last
+    newline, so the cost does not grow with the page size.  A "\n" is
+    always a clean line boundary, and any other separators splitlines()
+    honours only add lines inside the suffix, so the result is identical.
+    """
+    start = len(page_text)
+    for _ in range(TAIL_BUFFER_LINES + 1):
+        start = page_text.rfind("\n", 0, start)
+        if start == -1:
+            return page_text.splitlines()[-TAIL_BUFFER_LINES:]
+    return page_text[start + 1:].splitlines()[-TAIL_BUFFER_LINES:]
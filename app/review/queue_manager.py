@@ -8,10 +8,14 @@ Manages four queues:
 """
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.audit.audit_log import record_event
@@ -32,6 +36,20 @@ _DECISION_EVENT_MAP: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _as_uuid(value: str | UUID) -> UUID:
+    """Return *value* as a ``UUID``, parsing (and caching) string ids."""
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def _check_queue_type(queue_type: str) -> None:
+    if queue_type not in VALID_QUEUE_TYPES:
+        raise ValueError(
+            f"Unknown queue_type {queue_type!r}; "
+            f"must be one of {sorted(VALID_QUEUE_TYPES)}"
+        )
+
+
 class QueueManager:
     """Create, assign, and complete review tasks across queues."""
 
@@ -46,36 +64,80 @@ class QueueManager:
         subject_id: str,
     ) -> ReviewTask:
         """Create a ``ReviewTask`` for *subject_id* in *queue_type*."""
-        if queue_type not in VALID_QUEUE_TYPES:
-            raise ValueError(
-                f"Unknown queue_type {queue_type!r}; "
-                f"must be one of {sorted(VALID_QUEUE_TYPES)}"
-            )
+        _check_queue_type(queue_type)
 
-        # Duplicate check: no PENDING task for same subject + queue
-        sid = UUID(subject_id) if isinstance(subject_id, str) else subject_id
-        existing = self.db.execute(
-            select(ReviewTask).where(
-                ReviewTask.queue_type == queue_type,
-                ReviewTask.subject_id == sid,
-                ReviewTask.status == "PENDING",
+        # Duplicate check: the partial unique index review_task_pending_unique
+        # allows one PENDING task per subject + queue, so a conflicting
+        # insert returns no row — one round-trip and no check-then-insert race.
+        sid = _as_uuid(subject_id)
+        dialect_insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            dialect_insert(ReviewTask)
+            .values(
+                queue_type=queue_type,
+                subject_id=sid,
+                status="PENDING",
+                required_role=required_role_for_queue(queue_type),
+                # Client clock: tasks created in one transaction still get
+                # distinct, ordered timestamps (server now() is per-txn).
+                created_at=datetime.now(timezone.utc),
+            )
+            .on_conflict_do_nothing(
+                index_elements=["queue_type", "subject_id"],
+                index_where=ReviewTask.status == "PENDING",
             )
-        ).scalar_one_or_none()
-        if existing is not None:
+            .returning(ReviewTask)
+        )
+        task = self.db.scalars(stmt).one_or_none()
+        if task is None:
             raise ValueError(
                 f"Subject {subject_id} already has a PENDING task "
                 f"in queue {queue_type!r}"
             )
+        return task
 
-        task = ReviewTask(
-            queue_type=queue_type,
-            subject_id=sid,
-            status="PENDING",
-            required_role=required_role_for_queue(queue_type),
+    def create_tasks(
+        self,
+        bulk: Iterable[tuple[str, str | UUID]],
+    ) -> list[ReviewTask]:
+        """Create PENDING tasks for many ``(queue_type, subject_id)`` pairs.
+
+        Bulk counterpart of :meth:`create_task`: one multi-row INSERT with
+        the same ``ON CONFLICT DO NOTHING`` on review_task_pending_unique.
+        Pairs that already have a PENDING task (or repeat within *bulk*)
+        are skipped rather than raising, including when a concurrent caller
+        inserts them first.  Returns the created tasks in input order.
+        """
+        pairs: dict[tuple[str, UUID], None] = {}
+        for queue_type, subject_id in bulk:
+            _check_queue_type(queue_type)
+            pairs[(queue_type, _as_uuid(subject_id))] = None
+        if not pairs:
+            return []
+
+        rows = [
+            {
+                "queue_type": queue_type,
+                "subject_id": sid,
+                "status": "PENDING",
+                "required_role": required_role_for_queue(queue_type),
+                "created_at": datetime.now(timezone.utc),
+            }
+            for queue_type, sid in pairs
+        ]
+        dialect_insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            dialect_insert(ReviewTask)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["queue_type", "subject_id"],
+                index_where=ReviewTask.status == "PENDING",
+            )
+            .returning(ReviewTask)
         )
-        self.db.add(task)
-        self.db.flush()
-        return task
+        # RETURNING omits skipped rows and does not promise VALUES order.
+        created = {(t.queue_type, t.subject_id): t for t in self.db.scalars(stmt)}
+        return [created[pair] for pair in pairs if pair in created]
 
     # -- assign -------------------------------------------------------------
 
@@ -86,7 +148,7 @@ class QueueManager:
         role: str,
     ) -> ReviewTask:
         """Assign *task_id* to *reviewer_id* with *role*."""
-        tid = UUID(task_id) if isinstance(task_id, str) else task_id
+        tid = _as_uuid(task_id)
         task = self.db.get(ReviewTask, tid)
         if task is None:
             raise KeyError(f"ReviewTask {task_id} not found")
@@ -104,6 +166,45 @@ class QueueManager:
         self.db.flush()
         return task
 
+    def claim_next(
+        self,
+        queue_type: str,
+        reviewer_id: str,
+        role: str,
+    ) -> ReviewTask | None:
+        """Atomically assign the oldest PENDING task in *queue_type*.
+
+        Uses ``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent reviewers
+        each claim a different task without blocking on one another (the
+        locking clause is a no-op on SQLite).  Replaces the
+        get_queue + assign_task round-trips.  Returns ``None`` when the
+        queue has no claimable task.
+        """
+        _check_queue_type(queue_type)
+        if not can_action_queue(role, queue_type):
+            raise PermissionError(
+                f"Role {role!r} cannot action queue {queue_type!r}"
+            )
+
+        stmt = (
+            select(ReviewTask)
+            .where(
+                ReviewTask.queue_type == queue_type,
+                ReviewTask.status == "PENDING",
+            )
+            .order_by(ReviewTask.created_at.asc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        task = self.db.execute(stmt).scalar_one_or_none()
+        if task is None:
+            return None
+
+        task.assigned_to = reviewer_id
+        task.status = "IN_PROGRESS"
+        self.db.flush()
+        return task
+
     # -- complete -----------------------------------------------------------
 
     def complete_task(
@@ -130,7 +231,7 @@ class QueueManager:
                 "regulatory_basis is required for LEGAL_REVIEWER decisions"
             )
 
-        tid = UUID(task_id) if isinstance(task_id, str) else task_id
+        tid = _as_uuid(task_id)
         task = self.db.get(ReviewTask, tid)
         if task is None:
             raise KeyError(f"ReviewTask {task_id} not found")
@@ -163,9 +264,38 @@ class QueueManager:
         self,
         queue_type: str,
         status: str = "PENDING",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[ReviewTask]:
-        """Return tasks for *queue_type* filtered by *status*, oldest first."""
-        stmt = (
+        """Return tasks for *queue_type* filtered by *status*, oldest first.
+
+        *limit* / *offset* page through the queue in SQL so callers that
+        only need the first page never load the whole queue.
+        """
+        stmt = self._queue_stmt(queue_type, status).limit(limit).offset(offset)
+        return list(self.db.execute(stmt).scalars().all())
+
+    def iter_queue(
+        self,
+        queue_type: str,
+        status: str = "PENDING",
+        batch_size: int = 1000,
+    ) -> Iterator[ReviewTask]:
+        """Yield tasks for *queue_type* oldest first, *batch_size* rows at a time."""
+        stmt = self._queue_stmt(queue_type, status).execution_options(yield_per=batch_size)
+        yield from self.db.execute(stmt).scalars()
+
+    def count_queue(self, queue_type: str, status: str = "PENDING") -> int:
+        """Return the number of tasks in *queue_type* with *status*."""
+        stmt = select(func.count()).select_from(ReviewTask).where(
+            ReviewTask.queue_type == queue_type,
+            ReviewTask.status == status,
+        )
+        return self.db.execute(stmt).scalar_one()
+
+    @staticmethod
+    def _queue_stmt(queue_type: str, status: str) -> Select:
+        return (
             select(ReviewTask)
             .where(
                 ReviewTask.queue_type == queue_type,
@@ -173,4 +303,3 @@ class QueueManager:
             )
             .order_by(ReviewTask.created_at.asc())
         )
-        return list(self.db.execute(stmt).scalars().all())
@@ -6,10 +6,9 @@ for human QC validation (5–10% of approved output).
 from __future__ import annotations
 
 import logging
-import random
 from math import ceil
 
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.db.models import NotificationSubject, ReviewTask
@@ -54,28 +53,35 @@ class SamplingStrategy:
         self,
         queue_manager: QueueManager,
     ) -> list[ReviewTask]:
-        """Create ``qc_sampling`` review tasks for a random sample of AI_PENDING subjects."""
-        stmt = (
-            select(NotificationSubject)
+        """Create ``qc_sampling`` review tasks for a random sample of AI_PENDING subjects.
+
+        The sample is drawn in the database (``ORDER BY random() LIMIT k``),
+        so only the chosen rows are loaded.  The database RNG is not seeded
+        from Python's ``random``, so the selection is not reproducible.
+        """
+        count_stmt = lambda_stmt(
+            lambda: select(func.count())
+            .select_from(NotificationSubject)
             .where(NotificationSubject.review_status == "AI_PENDING")
-            .order_by(NotificationSubject.created_at.asc())
         )
-        subjects = list(self.db.execute(stmt).scalars().all())
-
-        sample_size = self.calculate_sample_size(len(subjects))
+        sample_size = self.calculate_sample_size(self.db.execute(count_stmt).scalar_one())
         if sample_size == 0:
             return []
 
-        sampled = random.sample(subjects, sample_size)
+        stmt = lambda_stmt(
+            lambda: select(NotificationSubject)
+            .where(NotificationSubject.review_status == "AI_PENDING")
+            .order_by(func.random())
+            .limit(sample_size)
+        )
+        sampled = self.db.execute(stmt).scalars().all()
 
-        tasks: list[ReviewTask] = []
-        for subj in sampled:
-            try:
-                task = queue_manager.create_task("qc_sampling", str(subj.subject_id))
-                tasks.append(task)
-            except ValueError:
-                logger.debug(
-                    "Subject %s already has a qc_sampling task — skipped",
-                    subj.subject_id,
-                )
+        tasks = queue_manager.create_tasks(
+            ("qc_sampling", subj.subject_id) for subj in sampled
+        )
+        if len(tasks) < sample_size:
+            logger.debug(
+                "%d sampled subjects already had a qc_sampling task — skipped",
+                sample_size - len(tasks),
+            )
         return tasks
@@ -8,10 +8,13 @@ Manages per-subject ``review_status`` transitions:
 """
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Iterator, Mapping
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from app.audit.audit_log import record_event
 from app.audit.events import (
@@ -24,22 +27,23 @@ from app.audit.events import (
 from app.db.models import NotificationSubject
 
 # Allowed transitions: current_status → {valid target statuses}
-_TRANSITIONS: dict[str, set[str]] = {
-    "AI_PENDING": {"HUMAN_REVIEW"},
-    "HUMAN_REVIEW": {"LEGAL_REVIEW", "APPROVED", "REJECTED"},
-    "LEGAL_REVIEW": {"APPROVED", "REJECTED"},
-    "APPROVED": {"NOTIFIED"},
-}
+_TRANSITIONS: Mapping[str, frozenset[str]] = MappingProxyType({
+    "AI_PENDING": frozenset({"HUMAN_REVIEW"}),
+    "HUMAN_REVIEW": frozenset({"LEGAL_REVIEW", "APPROVED", "REJECTED"}),
+    "LEGAL_REVIEW": frozenset({"APPROVED", "REJECTED"}),
+    "APPROVED": frozenset({"NOTIFIED"}),
+})
+_NO_TRANSITIONS: frozenset[str] = frozenset()
 
 # Map target status → audit event type
-_STATUS_EVENT_MAP: dict[str, str] = {
+_STATUS_EVENT_MAP: Mapping[str, str] = MappingProxyType({
     "AI_PENDING": EVENT_AI_EXTRACTION,
     "HUMAN_REVIEW": EVENT_HUMAN_REVIEW,
     "LEGAL_REVIEW": EVENT_ESCALATION,
     "APPROVED": EVENT_APPROVAL,
     "REJECTED": EVENT_HUMAN_REVIEW,
     "NOTIFIED": EVENT_NOTIFICATION_SENT,
-}
+})
 
 
 class WorkflowEngine:
@@ -50,7 +54,7 @@ class WorkflowEngine:
 
     def can_transition(self, current_status: str, to_status: str) -> bool:
         """Return whether *current_status* → *to_status* is allowed."""
-        return to_status in _TRANSITIONS.get(current_status, set())
+        return to_status in _TRANSITIONS.get(current_status, _NO_TRANSITIONS)
 
     def transition(
         self,
@@ -67,7 +71,7 @@ class WorkflowEngine:
             raise KeyError(f"NotificationSubject {subject_id} not found")
 
         current = subject.review_status
-        if not self.can_transition(current, to_status):
+        if to_status not in _TRANSITIONS.get(current, _NO_TRANSITIONS):
             raise ValueError(
                 f"Invalid transition {current!r} → {to_status!r}"
             )
@@ -92,9 +96,24 @@ class WorkflowEngine:
         status: str,
     ) -> list[NotificationSubject]:
         """Return subjects with *status*, ordered by created_at ascending."""
-        stmt = (
-            select(NotificationSubject)
+        return list(self.db.execute(self._status_stmt(status)).scalars().all())
+
+    def iter_subjects_by_status(
+        self,
+        status: str,
+        batch_size: int = 1000,
+    ) -> Iterator[NotificationSubject]:
+        """Yield subjects with *status* oldest first, *batch_size* rows at a time."""
+        yield from self.db.execute(
+            self._status_stmt(status),
+            execution_options={"yield_per": batch_size},
+        ).scalars()
+
+    @staticmethod
+    def _status_stmt(status: str) -> StatementLambdaElement:
+        # lambda_stmt caches the compiled SQL; *status* becomes a bound param
+        return lambda_stmt(
+            lambda: select(NotificationSubject)
             .where(NotificationSubject.review_status == status)
             .order_by(NotificationSubject.created_at.asc())
         )
-        return list(self.db.execute(stmt).scalars().all())
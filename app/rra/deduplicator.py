@@ -13,14 +13,20 @@ Canonical field selection strategy (``_best_value``):
 from __future__ import annotations
 
 from collections import Counter
+from itertools import chain
 from uuid import uuid4
 
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.db.models import NotificationSubject
-from app.normalization.name_normalizer import normalize_name
+from app.normalization.name_normalizer import normalize_name_cached
 from app.rra.entity_resolver import PIIRecord, ResolvedGroup
 
+# Values per SELECT ... WHERE canonical_* IN (...) statement; keeps bind
+# parameter counts under SQLite's limit and plans small on PostgreSQL.
+_IN_CHUNK = 500
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -28,17 +34,16 @@ from app.rra.entity_resolver import PIIRecord, ResolvedGroup
 
 def _best_value(values: list[str | None]) -> str | None:
     """Pick the canonical value from a list using frequency → length → alpha."""
-    cleaned = [v for v in values if v]
-    if not cleaned:
-        return None
-
-    counts = Counter(cleaned)
-    max_count = max(counts.values())
-    candidates = [v for v, c in counts.items() if c == max_count]
-
-    # Tie-break: longest, then alphabetically first
-    candidates.sort(key=lambda v: (-len(v), v))
-    return candidates[0]
+    best: str | None = None
+    best_count = best_len = 0
+    # Single scan: highest count, then longest, then alphabetically first
+    for v, c in Counter(v for v in values if v).items():
+        if (
+            c > best_count
+            or (c == best_count and (len(v) > best_len or (len(v) == best_len and v < best)))
+        ):
+            best, best_count, best_len = v, c, len(v)
+    return best
 
 
 def _best_address(addresses: list[dict | None]) -> dict | None:
@@ -78,18 +83,27 @@ class Deduplicator:
         Returns the list of persisted (or merged) subjects.  The session
         is flushed but **not** committed — the caller owns the transaction.
         """
-        subjects: list[NotificationSubject] = []
+        candidates = [self._build_one(group) for group in groups]
+        by_email, by_phone = self._prefetch_existing(candidates)
 
-        for group in groups:
-            ns = self._build_one(group)
-            existing = self._find_existing(ns)
+        subjects: list[NotificationSubject] = []
+        to_insert: list[NotificationSubject] = []
+        for ns in candidates:
+            existing = self._find_existing(ns, by_email, by_phone)
             if existing is not None:
                 self._merge_into(existing, ns)
                 subjects.append(existing)
             else:
-                self.db.add(ns)
-                self.db.flush()
+                to_insert.append(ns)
                 subjects.append(ns)
+                # Later groups in this batch may match the new subject
+                if ns.canonical_email:
+                    by_email.setdefault(ns.canonical_email, ns)
+                if ns.canonical_phone:
+                    by_phone.setdefault(ns.canonical_phone, ns)
+
+        self.db.add_all(to_insert)
+        self.db.flush()
         return subjects
 
     # ------------------------------------------------------------------
@@ -101,7 +115,7 @@ class Deduplicator:
 
         # --- Canonical name ---
         names = [
-            normalize_name(r.raw_name)
+            normalize_name_cached(r.raw_name)
             for r in records
             if r.raw_name
         ]
@@ -143,23 +157,59 @@ class Deduplicator:
             review_status=review_status,
         )
 
-    def _find_existing(self, ns: NotificationSubject) -> NotificationSubject | None:
+    def _prefetch_existing(
+        self,
+        candidates: list[NotificationSubject],
+    ) -> tuple[dict[str, NotificationSubject], dict[str, NotificationSubject]]:
+        """Load existing subjects matching any candidate, indexed by email and phone.
+
+        ``IN`` queries of up to ``_IN_CHUNK`` values replace one or two
+        lookups per group.
+        """
+        emails = list({ns.canonical_email for ns in candidates if ns.canonical_email})
+        phones = list({ns.canonical_phone for ns in candidates if ns.canonical_phone})
+
+        by_email: dict[str, NotificationSubject] = {}
+        for start in range(0, len(emails), _IN_CHUNK):
+            # A list, not a set: lambda_stmt binds it as an expanding IN parameter
+            chunk = emails[start:start + _IN_CHUNK]
+            for hit in self.db.execute(
+                lambda_stmt(
+                    lambda: select(NotificationSubject).where(
+                        NotificationSubject.canonical_email.in_(chunk)
+                    )
+                )
+            ).scalars():
+                by_email.setdefault(hit.canonical_email, hit)
+
+        by_phone: dict[str, NotificationSubject] = {}
+        for start in range(0, len(phones), _IN_CHUNK):
+            chunk = phones[start:start + _IN_CHUNK]
+            for hit in self.db.execute(
+                lambda_stmt(
+                    lambda: select(NotificationSubject).where(
+                        NotificationSubject.canonical_phone.in_(chunk)
+                    )
+                )
+            ).scalars():
+                by_phone.setdefault(hit.canonical_phone, hit)
+
+        return by_email, by_phone
+
+    @staticmethod
+    def _find_existing(
+        ns: NotificationSubject,
+        by_email: dict[str, NotificationSubject],
+        by_phone: dict[str, NotificationSubject],
+    ) -> NotificationSubject | None:
         """Look up by canonical_email first, then canonical_phone."""
         if ns.canonical_email:
-            hit = (
-                self.db.query(NotificationSubject)
-                .filter(NotificationSubject.canonical_email == ns.canonical_email)
-                .first()
-            )
+            hit = by_email.get(ns.canonical_email)
             if hit is not None:
                 return hit
 
         if ns.canonical_phone:
-            hit = (
-                self.db.query(NotificationSubject)
-                .filter(NotificationSubject.canonical_phone == ns.canonical_phone)
-                .first()
-            )
+            hit = by_phone.get(ns.canonical_phone)
             if hit is not None:
                 return hit
 
@@ -172,19 +222,14 @@ class Deduplicator:
     ) -> None:
         """Merge *incoming* fields into *existing* in place."""
         # Union pii_types_found
-        old_types = set(existing.pii_types_found or [])
-        new_types = set(incoming.pii_types_found or [])
-        existing.pii_types_found = sorted(old_types | new_types)
-
-        # Append source_records (dedup)
-        old_recs = list(existing.source_records or [])
-        new_recs = list(incoming.source_records or [])
-        seen = set(old_recs)
-        for r in new_recs:
-            if r not in seen:
-                old_recs.append(r)
-                seen.add(r)
-        existing.source_records = old_recs
+        existing.pii_types_found = sorted(
+            set(existing.pii_types_found or ()).union(incoming.pii_types_found or ())
+        )
+
+        # Append source_records (dedup, first-seen order)
+        existing.source_records = list(dict.fromkeys(
+            chain(existing.source_records or (), incoming.source_records or ())
+        ))
 
         # Keep lower merge_confidence (more conservative)
         inc_conf = incoming.merge_confidence if incoming.merge_confidence is not None else 1.0
@@ -24,15 +24,21 @@ Phase 5 Step 5 — Configurable dedup anchors:
 """
 from __future__ import annotations
 
+import os
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from multiprocessing import get_context
 
 from app.normalization.email_normalizer import normalize_email
-from app.rra.fuzzy import (
-    addresses_match,
-    dobs_match,
-    government_ids_match,
-    names_match,
+from app.rra.fuzzy import government_id_values_match, normalize_dob
+from app.rra.fuzzy_cache import (
+    FrozenAddress,
+    addresses_match_cached,
+    freeze_address,
+    names_match_cached,
 )
 
 # PII entity types that represent government-issued IDs
@@ -59,6 +65,23 @@ VALID_ANCHORS: frozenset[str] = frozenset({
 # Canonical name for "all anchors active" — same as passing None
 ALL_ANCHORS: frozenset[str] = VALID_ANCHORS
 
+# Bit per anchor: the pair loop tests ``mask & _SSN`` instead of hashing
+# the anchor name into a frozenset on every pair.
+_SSN, _EMAIL, _PHONE, _NAME_DOB, _NAME_ADDRESS, _NAME = 1, 2, 4, 8, 16, 32
+_ANCHOR_BITS: dict[str, int] = {
+    "ssn": _SSN,
+    "email": _EMAIL,
+    "phone": _PHONE,
+    "name_dob": _NAME_DOB,
+    "name_address": _NAME_ADDRESS,
+    "name": _NAME,
+}
+_NAME_SIGNALS = _NAME_DOB | _NAME_ADDRESS | _NAME
+
+# Candidate pairs per worker task when resolving with max_workers > 1.
+# Below one chunk the pool start-up costs more than it saves.
+_PARALLEL_CHUNK_PAIRS = 20_000
+
 
 # ---------------------------------------------------------------------------
 # Input dataclass
@@ -126,11 +149,20 @@ def _resolve_anchors(
     return anchors
 
 
+def _anchor_mask(anchors: frozenset[str]) -> int:
+    """Return the bitmask for a validated anchor set (see ``_ANCHOR_BITS``)."""
+    mask = 0
+    for name in anchors:
+        mask |= _ANCHOR_BITS[name]
+    return mask
+
+
 def build_confidence(
     r1: PIIRecord,
     r2: PIIRecord,
     *,
-    active_anchors: list[str] | frozenset[str] | None = None,
+    active_anchors: list[str] | frozenset[str] | int | None = None,
+    threshold: float | None = None,
 ) -> float:
     """Return the pairwise merge confidence for two records.
 
@@ -142,9 +174,74 @@ def build_confidence(
         Optional list of anchor names that controls which matching signals
         are evaluated.  When ``None`` (default), all signals are active.
         Valid values: ``"ssn"``, ``"email"``, ``"phone"``, ``"name_dob"``,
-        ``"name_address"``, ``"name"``.
+        ``"name_address"``, ``"name"``.  An ``int`` is taken as an
+        already-resolved anchor bitmask.
+    threshold:
+        Optional early-exit point for callers that only need to know
+        whether the pair reaches it.  Evaluation stops (skipping the fuzzy
+        comparisons) as soon as the running score is ``>= threshold``; the
+        returned value is then a lower bound that is itself ``>= threshold``.
     """
-    anchors = _resolve_anchors(active_anchors)
+    if isinstance(active_anchors, int):
+        mask = active_anchors
+    else:
+        mask = _anchor_mask(_resolve_anchors(active_anchors))
+    stop_at = 1.0 if threshold is None else threshold
+    ids: dict[str, int] = {}
+    return _pair_confidence(_features(r1, ids), _features(r2, ids), mask, stop_at)
+
+
+@dataclass(frozen=True, slots=True)
+class _Features:
+    """Per-record normalised fields, computed once per record, not per pair.
+
+    Fields compared only for equality are interned to integer ids (see
+    ``_intern``), shared by every record of the batch; ``-1`` means absent.
+    """
+
+    record: PIIRecord
+    email_id: int          # normalize_email(raw_email)
+    phone_id: int          # raw_phone
+    name_id: int           # raw_name
+    gov_type: str | None   # lower-cased entity_type for government-ID types, else None
+    gov_value: str         # normalized_value, stripped (meaningful only with gov_type)
+    dob_id: int            # normalize_dob(raw_dob, country); -1 when unparseable
+    address: FrozenAddress | None  # freeze_address(raw_address); None when absent
+
+
+def _intern(value: str | None, ids: dict[str, int]) -> int:
+    """Return the batch-wide integer id of *value*, or -1 when it is empty."""
+    if not value:
+        return -1
+    return ids.setdefault(value, len(ids))
+
+
+def _features(r: PIIRecord, ids: dict[str, int]) -> _Features:
+    return _Features(
+        record=r,
+        email_id=_intern(normalize_email(r.raw_email) if r.raw_email else None, ids),
+        phone_id=_intern(r.raw_phone, ids),
+        name_id=_intern(r.raw_name, ids),
+        gov_type=r.entity_type.lower() if r.entity_type.upper() in _GOV_ID_TYPES else None,
+        gov_value=r.normalized_value.strip(),
+        dob_id=_intern(normalize_dob(r.raw_dob, r.country) if r.raw_dob else None, ids),
+        address=freeze_address(r.raw_address) if r.raw_address else None,
+    )
+
+
+def _pair_confidence(
+    f1: _Features,
+    f2: _Features,
+    mask: int,
+    stop_at: float = 1.0,
+) -> float:
+    """build_confidence over precomputed features (see that function).
+
+    Signals only ever add to the score, so evaluation returns as soon as it
+    reaches *stop_at*.  With the default of 1.0 (the cap) the result is
+    exact; a lower *stop_at* yields a lower bound ``>= stop_at``.
+    """
+    r1, r2 = f1.record, f2.record
 
     # --- Cross-role merge prevention ---
     # If one record is primary_subject and the other is institutional,
@@ -158,60 +255,187 @@ def build_confidence(
     score = 0.0
 
     # --- Government ID match (+0.50) ---
-    if "ssn" in anchors:
-        if (
-            r1.entity_type.upper() in _GOV_ID_TYPES
-            and r2.entity_type.upper() in _GOV_ID_TYPES
-        ):
-            matched, _ = government_ids_match(
-                r1.entity_type, r1.normalized_value,
-                r2.entity_type, r2.normalized_value,
-            )
+    if mask & _SSN:
+        # Types are pre-lowered and values pre-stripped, so only the value
+        # comparison of government_ids_match is left to do per pair
+        if f1.gov_type is not None and f1.gov_type == f2.gov_type:
+            matched, _ = government_id_values_match(f1.gov_value, f2.gov_value)
             if matched:
                 score += 0.50
+                if score >= stop_at:
+                    return min(score, 1.0)
 
     # --- Email match (+0.40) ---
-    if "email" in anchors:
-        e1 = normalize_email(r1.raw_email) if r1.raw_email else None
-        e2 = normalize_email(r2.raw_email) if r2.raw_email else None
-        if e1 and e2 and e1 == e2:
+    if mask & _EMAIL:
+        if f1.email_id != -1 and f1.email_id == f2.email_id:
             score += 0.40
+            if score >= stop_at:
+                return min(score, 1.0)
 
     # --- Phone match (+0.35) ---
-    if "phone" in anchors:
-        if r1.raw_phone and r2.raw_phone:
-            if r1.raw_phone == r2.raw_phone:
-                score += 0.35
+    if mask & _PHONE:
+        if f1.phone_id != -1 and f1.phone_id == f2.phone_id:
+            score += 0.35
+            if score >= stop_at:
+                return min(score, 1.0)
 
     # --- Name-dependent signals ---
-    has_name_signal = anchors & {"name_dob", "name_address", "name"}
+    # Identical non-empty names always match, without a fuzzy lookup
     name_matched = False
-    if has_name_signal and r1.raw_name and r2.raw_name:
-        name_matched, _ = names_match(r1.raw_name, r2.raw_name)
+    if mask & _NAME_SIGNALS and f1.name_id != -1 and f2.name_id != -1:
+        name_matched = (
+            f1.name_id == f2.name_id
+            or names_match_cached(r1.raw_name, r2.raw_name)[0]
+        )
 
     if name_matched:
-        # Name + DOB (+0.35)
-        if "name_dob" in anchors and r1.raw_dob and r2.raw_dob:
-            dob_matched, _ = dobs_match(
-                r1.raw_dob, r1.country,
-                r2.raw_dob, r2.country,
-            )
-            if dob_matched:
-                score += 0.35
+        # Name + DOB (+0.35) — dobs_match is an exact ISO-date comparison
+        if mask & _NAME_DOB and f1.dob_id != -1 and f1.dob_id == f2.dob_id:
+            score += 0.35
+            if score >= stop_at:
+                return min(score, 1.0)
 
         # Name + address (+0.25)
-        if "name_address" in anchors and r1.raw_address and r2.raw_address:
-            addr_matched, _ = addresses_match(r1.raw_address, r2.raw_address)
+        if mask & _NAME_ADDRESS and f1.address and f2.address:
+            addr_matched, _ = addresses_match_cached(f1.address, f2.address)
             if addr_matched:
                 score += 0.25
+                if score >= stop_at:
+                    return min(score, 1.0)
 
         # Name alone (+0.10)
-        if "name" in anchors:
+        if mask & _NAME:
             score += 0.10
 
     return min(score, 1.0)
 
 
+# ---------------------------------------------------------------------------
+# Blocking
+# ---------------------------------------------------------------------------
+
+def _blocking_keys(f: _Features, mask: int) -> list[tuple]:
+    """Return the exact keys under which a record can match another record.
+
+    Every signal that can lift a pair to the merge threshold on its own
+    requires some exact equality, so two records that share no key cannot
+    merge:
+
+    * government ID — same type and value within one edit: the value and
+      each of its single-character deletions (symmetric-delete neighbourhood)
+    * email — normalised address; phone — raw value
+    * name + DOB — normalised ISO date (the name is matched fuzzily within)
+    * name + address — normalised postal code
+    """
+    r = f.record
+    keys: list[tuple] = []
+    if mask & _SSN and f.gov_type is not None:
+        id_type = f.gov_type
+        value = f.gov_value
+        keys.append(("gov", id_type, value))
+        keys.extend(
+            ("gov", id_type, value[:k] + value[k + 1:]) for k in range(len(value))
+        )
+    if mask & _EMAIL and f.email_id != -1:
+        keys.append(("email", f.email_id))
+    if mask & _PHONE and f.phone_id != -1:
+        keys.append(("phone", f.phone_id))
+    if f.name_id != -1:
+        if mask & _NAME_DOB and f.dob_id != -1:
+            keys.append(("dob", f.dob_id))
+        if mask & _NAME_ADDRESS and r.raw_address:
+            postal = r.raw_address.get("zip")
+            if postal:
+                keys.append(("zip", postal.replace(" ", "").upper()))
+    return keys
+
+
+def _candidate_pairs(
+    features: list[_Features],
+    mask: int,
+) -> list[tuple[int, int]]:
+    """Return sorted ``(i, j)`` index pairs (i < j) sharing a blocking key."""
+    buckets: dict[tuple, list[int]] = {}
+    for idx, f in enumerate(features):
+        for key in _blocking_keys(f, mask):
+            buckets.setdefault(key, []).append(idx)
+
+    pairs: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        # A record can land in one bucket twice via repeated deletion keys
+        members = sorted(set(members))
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                pairs.add((members[a], members[b]))
+    return sorted(pairs)
+
+
+def _content_key(f: _Features) -> tuple:
+    """Return every input of ``_pair_confidence`` for one record.
+
+    Two records with equal keys score identically against any third record,
+    in any batch, so the key identifies a record across batches.
+    """
+    r = f.record
+    return (
+        r.entity_role,
+        f.gov_type,
+        f.gov_value if f.gov_type is not None else "",
+        r.raw_email,
+        r.raw_phone,
+        r.raw_name,
+        r.raw_dob,
+        r.country if r.raw_dob else "",
+        f.address,
+    )
+
+
+def _score_pairs(
+    features: dict[int, _Features],
+    pairs: list[tuple[int, int]],
+    mask: int,
+) -> list[float]:
+    """Worker entry point: score *pairs* over the *features* they reference."""
+    return [_pair_confidence(features[i], features[j], mask) for i, j in pairs]
+
+
+def _group_min_confidence(
+    indices: list[int],
+    pair_conf: dict[tuple[int, int], float],
+    features: list[_Features],
+    mask: int,
+) -> float:
+    """Return the minimum pairwise confidence among *indices* (ascending).
+
+    Pairs scored in the main loop come from *pair_conf*; those are taken
+    first, so the minimum is already low when the rest are scored with an
+    early exit.  The rest were blocked out of the main loop: they share no
+    exact key, so at most a name match alone (+0.10) can fire for them.
+    Confidences never go below 0.0, so the scan stops there.
+    """
+    min_conf = 1.0
+    unscored: list[tuple[int, int]] = []
+    for pos, a in enumerate(indices):
+        for b in indices[pos + 1:]:
+            c = pair_conf.get((a, b))
+            if c is None:
+                unscored.append((a, b))
+            elif c < min_conf:
+                min_conf = c
+                if min_conf <= 0.0:
+                    return 0.0
+
+    for a, b in unscored:
+        # Stop scoring once the pair reaches the current minimum: beyond
+        # that it cannot lower it
+        c = _pair_confidence(features[a], features[b], mask, stop_at=min_conf)
+        if c < min_conf:
+            min_conf = c
+            if min_conf <= 0.0:
+                return 0.0
+    return min_conf
+
+
 # ---------------------------------------------------------------------------
 # Union-Find
 # ---------------------------------------------------------------------------
@@ -250,6 +474,36 @@ class EntityResolver:
     MERGE_THRESHOLD: float = 0.30
     REVIEW_THRESHOLD: float = 0.80
 
+    def __init__(self, max_workers: int | None = 1, cache_size: int = 0) -> None:
+        """Create a resolver.
+
+        Parameters
+        ----------
+        max_workers:
+            Number of worker processes used to score candidate pairs.
+            1 (default) scores in-process; None uses os.cpu_count().
+            Workers only pay off once blocking leaves more than
+            ``_PARALLEL_CHUNK_PAIRS`` candidate pairs.
+        cache_size:
+            Maximum number of pair confidences kept between ``resolve``
+            calls, least recently used evicted first.  Pairs of records
+            with the same content (see ``_content_key``) are then scored
+            once per resolver, within and across batches.  0 (default)
+            disables the cache.  Drop it with :meth:`clear_cache`.
+        """
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._cache_size = cache_size
+        self._conf_cache: OrderedDict[tuple[int, int, int], float] | None = (
+            OrderedDict() if cache_size > 0 else None
+        )
+        self._content_index: dict[tuple, int] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all pair confidences cached by this resolver."""
+        if self._conf_cache is not None:
+            self._conf_cache.clear()
+        self._content_index.clear()
+
     def resolve(
         self,
         records: list[PIIRecord],
@@ -270,26 +524,48 @@ class EntityResolver:
         Returns one ``ResolvedGroup`` per unique individual (including
         single-record groups for unmatched records).
         """
-        # Validate once, reuse the resolved frozenset for all pair comparisons
-        anchors = _resolve_anchors(active_anchors)
+        # Validate once, reuse the resolved bitmask for all pair comparisons
+        mask = _anchor_mask(_resolve_anchors(active_anchors))
 
         n = len(records)
         if n == 0:
             return []
 
+        # Per-record normalisation, done once instead of once per pair
+        ids: dict[str, int] = {}
+        features = [_features(r, ids) for r in records]
+
         uf = _UnionFind(n)
-        # Store pairwise confidences for pairs that were merged
+        # Every confidence scored below, merged or not, so the group
+        # min-conf pass reuses it instead of scoring the pair again
         pair_conf: dict[tuple[int, int], float] = {}
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                conf = build_confidence(
-                    records[i], records[j], active_anchors=anchors,
-                )
-                if conf >= self.MERGE_THRESHOLD:
-                    uf.union(i, j)
-                    key = (min(i, j), max(i, j))
-                    pair_conf[key] = conf
+        # Blocking: only pairs sharing an exact key can reach the merge
+        # threshold.  A name match alone (+0.10) has no exact key, so a
+        # threshold at or below it needs every pair compared.
+        parallel = False
+        if mask & _NAME and self.MERGE_THRESHOLD <= 0.10:
+            candidates = ((i, j) for i in range(n) for j in range(i + 1, n))
+        else:
+            candidates = _candidate_pairs(features, mask)
+            parallel = self._max_workers > 1 and len(candidates) > _PARALLEL_CHUNK_PAIRS
+
+        cache = self._conf_cache
+        if cache is not None:
+            content_ids = self._content_ids(features)
+            scored = self._cached_scores(features, content_ids, candidates, mask)
+        elif parallel:
+            scored = zip(candidates, self._score_parallel(features, candidates, mask))
+        else:
+            scored = (
+                ((i, j), _pair_confidence(features[i], features[j], mask))
+                for i, j in candidates
+            )
+
+        for (i, j), conf in scored:
+            pair_conf[(i, j)] = conf
+            if conf >= self.MERGE_THRESHOLD:
+                uf.union(i, j)
 
         # Collect groups by root
         groups: dict[int, list[int]] = {}
@@ -309,22 +585,7 @@ class EntityResolver:
                 ))
                 continue
 
-            # min pairwise confidence among all pairs in this group
-            min_conf = 1.0
-            for a in indices:
-                for b in indices:
-                    if a >= b:
-                        continue
-                    key = (min(a, b), max(a, b))
-                    if key in pair_conf:
-                        min_conf = min(min_conf, pair_conf[key])
-                    else:
-                        # Pair not directly merged but transitively linked
-                        c = build_confidence(
-                            records[a], records[b],
-                            active_anchors=anchors,
-                        )
-                        min_conf = min(min_conf, c)
+            min_conf = _group_min_confidence(indices, pair_conf, features, mask)
 
             result.append(ResolvedGroup(
                 records=group_records,
@@ -332,4 +593,88 @@ class EntityResolver:
                 needs_human_review=min_conf < self.REVIEW_THRESHOLD,
             ))
 
+        if cache is not None:
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
         return result
+
+    def _content_ids(self, features: list[_Features]) -> list[int]:
+        """Return the resolver-wide id of each record's ``_content_key``."""
+        index = self._content_index
+        if len(index) > self._cache_size:
+            # Ids are never evicted one by one, so start over instead
+            self.clear_cache()
+        return [index.setdefault(_content_key(f), len(index)) for f in features]
+
+    def _cached_scores(
+        self,
+        features: list[_Features],
+        ids: list[int],
+        candidates: Iterable[tuple[int, int]],
+        mask: int,
+    ) -> Iterator[tuple[tuple[int, int], float]]:
+        """Yield ``((i, j), confidence)`` for *candidates*, via the pair cache.
+
+        Misses are scored and cached as they come; with worker processes
+        they are collected and scored together after the scan instead.
+        The cache is trimmed back to ``cache_size`` by :meth:`resolve`.
+        """
+        cache = self._conf_cache
+        assert cache is not None
+        misses: list[tuple[int, int]] = []
+        for i, j in candidates:
+            a, b = ids[i], ids[j]
+            key = (a, b, mask) if a <= b else (b, a, mask)
+            conf = cache.get(key)
+            if conf is not None:
+                cache.move_to_end(key)
+            elif self._max_workers > 1:
+                misses.append((i, j))
+                continue
+            else:
+                conf = cache[key] = _pair_confidence(features[i], features[j], mask)
+            yield (i, j), conf
+
+        if not misses:
+            return
+        if len(misses) > _PARALLEL_CHUNK_PAIRS:
+            confs = self._score_parallel(features, misses, mask)
+        else:
+            confs = [_pair_confidence(features[i], features[j], mask) for i, j in misses]
+        for (i, j), conf in zip(misses, confs):
+            a, b = ids[i], ids[j]
+            cache[(a, b, mask) if a <= b else (b, a, mask)] = conf
+            yield (i, j), conf
+
+    def _score_parallel(
+        self,
+        features: list[_Features],
+        candidates: list[tuple[int, int]],
+        mask: int,
+    ) -> list[float]:
+        """Score *candidates* across worker processes, in candidate order.
+
+        Each task receives only the features its chunk of pairs refers to,
+        not the whole batch.  Union-find stays in the parent process.
+        """
+        chunks = [
+            candidates[k:k + _PARALLEL_CHUNK_PAIRS]
+            for k in range(0, len(candidates), _PARALLEL_CHUNK_PAIRS)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(chunks)),
+            mp_context=get_context("forkserver"),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _score_pairs,
+                    {idx: features[idx] for pair in chunk for idx in pair},
+                    chunk,
+                    mask,
+                )
+                for chunk in chunks
+            ]
+            confs: list[float] = []
+            for future in futures:
+                confs.extend(future.result())
+        return confs
@@ -18,7 +18,8 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime, date
+from datetime import date
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -35,32 +36,35 @@ _NON_LATIN_RANGES: tuple[tuple[int, int], ...] = (
     (0xAC00, 0xD7AF),  # Korean Hangul syllables
 )
 
+# One character class covering every range above; the scan runs in C
+_NON_LATIN_RE = re.compile(
+    "[" + "".join(f"\\u{start:04x}-\\u{end:04x}" for start, end in _NON_LATIN_RANGES) + "]"
+)
+
 
 def _has_non_latin_chars(text: str) -> bool:
-    for char in text:
-        cp = ord(char)
-        for start, end in _NON_LATIN_RANGES:
-            if start <= cp <= end:
-                return True
-    return False
+    return _NON_LATIN_RE.search(text) is not None
 
 
 # ---------------------------------------------------------------------------
 # Soundex
 # ---------------------------------------------------------------------------
 
-_SOUNDEX_TABLE: dict[str, str] = {
-    "b": "1", "f": "1", "p": "1", "v": "1",
-    "c": "2", "g": "2", "j": "2", "k": "2", "q": "2", "s": "2", "x": "2", "z": "2",
-    "d": "3", "t": "3",
-    "l": "4",
-    "m": "5", "n": "5",
-    "r": "6",
-}
+# Letter → Soundex digit; vowels and h/w/y map to "0", which separates
+# runs of the same digit and is dropped from the code.
+_SOUNDEX_TRANS = str.maketrans(
+    "bfpv" "cgjkqsxz" "dt" "l" "mn" "r" "aeiouyhw",
+    "1111" "22222222" "33" "4" "55" "6" "00000000",
+)
 
-_SOUNDEX_SKIP = frozenset("aeiouyhw")
+_NON_ALPHA_RE = re.compile(r"[^a-zA-Z]")
 
+# Soundex codes and parsed DOBs are pure functions of their inputs, and one
+# person's name or DOB recurs on every record extracted for them.
+_MEMO_SIZE = 4096
 
+
+@lru_cache(maxsize=_MEMO_SIZE)
 def soundex(name: str) -> str:
     """Return the American Soundex code for *name*.
 
@@ -78,25 +82,21 @@ def soundex(name: str) -> str:
         return "0000"
 
     # Keep only ASCII letters (Soundex is a Latin-alphabet algorithm)
-    letters = re.sub(r"[^a-zA-Z]", "", name.strip())
+    letters = _NON_ALPHA_RE.sub("", name.strip())
     if not letters:
         return "0000"
 
-    letters = letters.lower()
+    # Map every letter to its digit in one C-level pass; the loop then only
+    # compares characters (a "0" separator breaks a run of equal digits)
+    digits = letters.lower().translate(_SOUNDEX_TRANS)
     code = letters[0].upper()
-    prev_digit = _SOUNDEX_TABLE.get(letters[0], "")
-
-    for ch in letters[1:]:
-        if ch in _SOUNDEX_SKIP:
-            prev_digit = ""  # vowel acts as separator
-            continue
-        digit = _SOUNDEX_TABLE.get(ch, "")
-        if digit and digit != prev_digit:
+    prev_digit = digits[0]
+    for digit in digits[1:]:
+        if digit != prev_digit and digit != "0":
             code += digit
             if len(code) == 4:
                 break
         prev_digit = digit
-
     return code.ljust(4, "0")
 
 
@@ -118,34 +118,27 @@ def jaro(s1: str, s2: str) -> float:
     if match_dist < 0:
         match_dist = 0
 
-    s1_matches = [False] * len1
+    # For each s1 character, take the first unmatched equal character of s2
+    # inside the match window.  str.find does the window scan in C.
     s2_matches = [False] * len2
-    matches = 0
-    transpositions = 0
-
-    for i in range(len1):
-        start = max(0, i - match_dist)
+    s1_matched: list[str] = []
+    for i, ch in enumerate(s1):
         end = min(i + match_dist + 1, len2)
-        for j in range(start, end):
-            if s2_matches[j] or s1[i] != s2[j]:
-                continue
-            s1_matches[i] = True
+        j = s2.find(ch, max(0, i - match_dist), end)
+        while j != -1 and s2_matches[j]:
+            j = s2.find(ch, j + 1, end)
+        if j != -1:
             s2_matches[j] = True
-            matches += 1
-            break
+            s1_matched.append(ch)
 
+    matches = len(s1_matched)
     if matches == 0:
         return 0.0
 
-    k = 0
-    for i in range(len1):
-        if not s1_matches[i]:
-            continue
-        while not s2_matches[k]:
-            k += 1
-        if s1[i] != s2[k]:
-            transpositions += 1
-        k += 1
+    # Matched characters of s2 in order; half the positional mismatches
+    # between the two matched sequences are transpositions
+    s2_matched = [c for c, hit in zip(s2, s2_matches) if hit]
+    transpositions = sum(a != b for a, b in zip(s1_matched, s2_matched))
 
     m = matches
     return (m / len1 + m / len2 + (m - transpositions / 2) / m) / 3
@@ -320,9 +313,15 @@ def government_ids_match(
     if id1_type.lower() != id2_type.lower():
         return False, 0.0
 
-    v1 = id1_value.strip()
-    v2 = id2_value.strip()
+    return government_id_values_match(id1_value.strip(), id2_value.strip())
+
+
+def government_id_values_match(v1: str, v2: str) -> tuple[bool, float]:
+    """Value half of :func:`government_ids_match` for same-type IDs.
 
+    *v1* and *v2* must already be stripped; callers that compare many pairs
+    check the ID types and strip the values once per record, not per pair.
+    """
     if v1 == v2:
         return True, 0.95
 
@@ -339,8 +338,13 @@ def _edit_distance_one(a: str, b: str) -> bool:
         return False
 
     if la == lb:
-        # Exactly one substitution
-        diffs = sum(1 for x, y in zip(a, b) if x != y)
+        # Exactly one substitution; stop at the second mismatch
+        diffs = 0
+        for x, y in zip(a, b):
+            if x != y:
+                diffs += 1
+                if diffs > 1:
+                    return False
         return diffs == 1
 
     # One insertion/deletion — ensure shorter string is `a`
@@ -383,7 +387,46 @@ _DOB_FORMATS: list[str] = [
 # Countries where the default ambiguous order is MM/DD (US, Philippines …)
 _MMDD_COUNTRIES: frozenset[str] = frozenset({"US", "PH"})
 
+# The strptime formats normalize_dob accepts, compiled once.  Each group
+# mirrors the pattern strptime itself uses for the directive, so the same
+# strings are accepted: %d, %m, %Y, and %b / %B (English month names,
+# case-insensitive); a space in a format matches any run of whitespace.
+_MONTHS: dict[str, int] = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("january", "jan"), ("february", "feb"), ("march", "mar"),
+            ("april", "apr"), ("may",), ("june", "jun"), ("july", "jul"),
+            ("august", "aug"), ("september", "sep"), ("october", "oct"),
+            ("november", "nov"), ("december", "dec"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_DAY = r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_MONTH_NUM = r"(1[0-2]|0[1-9]|[1-9])"
+_MONTH_NAME = "(" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + ")"
+_YEAR = r"(\d\d\d\d)"
+
+# %Y-%m-%d
+_ISO_DOB_RE = re.compile(rf"{_YEAR}-{_MONTH_NUM}-{_DAY}")
+# %d %b %Y, %d %B %Y  |  %B %d, %Y, %b %d, %Y
+_NAMED_DOB_RE = re.compile(
+    rf"{_DAY}\s+{_MONTH_NAME}\s+{_YEAR}|{_MONTH_NAME}\s+{_DAY},\s+{_YEAR}",
+    re.IGNORECASE,
+)
+_DOB_SEPARATOR_RE = re.compile(r"[-./]")
 
+
+def _iso_date(year: int, month: int, day: int) -> str | None:
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
 def normalize_dob(raw: str, country: str = "US") -> str | None:
     """Return *raw* date-of-birth as an ISO 8601 string (``YYYY-MM-DD``).
 
@@ -408,24 +451,27 @@ def normalize_dob(raw: str, country: str = "US") -> str | None:
     text = raw.strip()
     use_mmdd = country.upper() in _MMDD_COUNTRIES
 
-    # Try ISO 8601 first (unambiguous)
-    try:
-        d = datetime.strptime(text, "%Y-%m-%d").date()
-        return d.isoformat()
-    except ValueError:
-        pass
-
-    # Try unambiguous named-month formats
-    for fmt in ["%d %b %Y", "%d %B %Y", "%B %d, %Y", "%b %d, %Y"]:
-        try:
-            d = datetime.strptime(text, fmt).date()
-            return d.isoformat()
-        except ValueError:
-            continue
+    # Try ISO 8601 first (unambiguous).  A well-formed but impossible date
+    # (e.g. Feb 30) falls through to the numeric path, which rejects it too.
+    m = _ISO_DOB_RE.fullmatch(text)
+    if m:
+        iso = _iso_date(int(m[1]), int(m[2]), int(m[3]))
+        if iso is not None:
+            return iso
+
+    # Try unambiguous named-month formats; an impossible date here cannot
+    # parse as numeric either (no - . / separators), so it is rejected
+    m = _NAMED_DOB_RE.fullmatch(text)
+    if m:
+        if m[1] is not None:
+            day, month, year = m[1], m[2], m[3]
+        else:
+            month, day, year = m[4], m[5], m[6]
+        return _iso_date(int(year), _MONTHS[month.lower()], int(day))
 
     # Try numeric formats — separator-agnostic via normalisation
     # Normalise separators to "/"
-    normalised = re.sub(r"[-./]", "/", text)
+    normalised = _DOB_SEPARATOR_RE.sub("/", text)
     parts = normalised.split("/")
 
     if len(parts) == 3:
@@ -0,0 +1,63 @@
+"""Memoised wrappers around the fuzzy comparators in ``app.rra.fuzzy``.
+
+Entity resolution compares the same name and address strings many times
+over (one person's name appears on every record extracted for them).
+The comparators are pure functions of their string inputs, so results are
+cached on the values themselves; arguments are put in a canonical order
+first because both comparisons are symmetric.
+
+Addresses are dicts and therefore unhashable; callers freeze them once per
+record with :func:`freeze_address` and pass the frozen form.
+
+Safety rule: cached values are kept in memory only — never logged.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from app.rra.fuzzy import addresses_match, names_match, normalize_dob, soundex
+
+FrozenAddress = tuple[tuple[str, str | None], ...]
+
+_CACHE_SIZE = 65536
+
+
+def freeze_address(addr: dict[str, str | None]) -> FrozenAddress:
+    """Return a hashable, order-independent form of an address dict."""
+    return tuple(sorted(addr.items()))
+
+
+def names_match_cached(name1: str, name2: str) -> tuple[bool, float]:
+    """Cached :func:`~app.rra.fuzzy.names_match`."""
+    if name2 < name1:
+        name1, name2 = name2, name1
+    return _names_match(name1, name2)
+
+
+def addresses_match_cached(
+    addr1: FrozenAddress,
+    addr2: FrozenAddress,
+) -> tuple[bool, float]:
+    """Cached :func:`~app.rra.fuzzy.addresses_match` over frozen addresses."""
+    # Values may be None, so order by hash rather than by comparing tuples
+    if hash(addr2) < hash(addr1):
+        addr1, addr2 = addr2, addr1
+    return _addresses_match(addr1, addr2)
+
+
+def clear_caches() -> None:
+    """Drop all memoised comparisons and the Soundex / DOB memos behind them."""
+    _names_match.cache_clear()
+    _addresses_match.cache_clear()
+    soundex.cache_clear()
+    normalize_dob.cache_clear()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _names_match(name1: str, name2: str) -> tuple[bool, float]:
+    return names_match(name1, name2)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _addresses_match(addr1: FrozenAddress, addr2: FrozenAddress) -> tuple[bool, float]:
+    return addresses_match(dict(addr1), dict(addr2))
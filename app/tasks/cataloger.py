@@ -18,9 +18,12 @@ existing ``QueueManager``.
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 from typing import Literal
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.models import Document
 
@@ -28,6 +31,13 @@ logger = logging.getLogger(__name__)
 
 StructureClass = Literal["structured", "semi-structured", "unstructured", "non-extractable"]
 
+# Catalog fields written for one document: (structure_class,
+# can_auto_process, manual_review_reason)
+_CatalogFields = tuple[StructureClass, bool, str | None]
+
+# Document ids per UPDATE ... WHERE id IN (...) statement
+_UPDATE_CHUNK = 500
+
 # ---- Extension classification map ----------------------------------------
 
 _STRUCTURED_EXTENSIONS: frozenset[str] = frozenset({
@@ -47,6 +57,13 @@ _ALL_KNOWN_EXTENSIONS: frozenset[str] = (
     _STRUCTURED_EXTENSIONS | _SEMI_STRUCTURED_EXTENSIONS | _UNSTRUCTURED_EXTENSIONS
 )
 
+# Flattened view of the three sets: one lookup per document
+_EXT_TO_CLASS: dict[str, StructureClass] = {
+    **dict.fromkeys(_STRUCTURED_EXTENSIONS, "structured"),
+    **dict.fromkeys(_SEMI_STRUCTURED_EXTENSIONS, "semi-structured"),
+    **dict.fromkeys(_UNSTRUCTURED_EXTENSIONS, "unstructured"),
+}
+
 
 def classify_extension(ext: str) -> StructureClass:
     """Return the structure class for a lowercase, dot-stripped extension.
@@ -62,14 +79,7 @@ def classify_extension(ext: str) -> StructureClass:
         One of ``"structured"``, ``"semi-structured"``, ``"unstructured"``,
         or ``"non-extractable"``.
     """
-    ext = ext.lower().strip()
-    if ext in _STRUCTURED_EXTENSIONS:
-        return "structured"
-    if ext in _SEMI_STRUCTURED_EXTENSIONS:
-        return "semi-structured"
-    if ext in _UNSTRUCTURED_EXTENSIONS:
-        return "unstructured"
-    return "non-extractable"
+    return _EXT_TO_CLASS.get(ext.lower().strip(), "non-extractable")
 
 
 # ---- CatalogerTask -------------------------------------------------------
@@ -85,7 +95,8 @@ class CatalogerTask:
 
     Each ``Document`` ORM object in *documents* is updated in-place with
     ``structure_class``, ``can_auto_process``, and ``manual_review_reason``.
-    The session is flushed once at the end.
+    Documents sharing the same catalog fields are written with one
+    ``UPDATE ... WHERE id IN (...)`` rather than one UPDATE per row.
     """
 
     def __init__(self, db_session: Session) -> None:
@@ -105,10 +116,15 @@ class CatalogerTask:
         list[Document]
             The same list, with catalog fields populated.
         """
+        # Pending Documents must be INSERTed before they can be UPDATEd
+        self.db.flush()
+
+        buckets: dict[_CatalogFields, list[Document]] = {}
         for doc in documents:
-            self._classify(doc)
+            buckets.setdefault(self._classify(doc), []).append(doc)
 
-        self.db.flush()
+        for fields, docs in buckets.items():
+            self._write_bucket(fields, docs)
 
         # Log summary
         counts: dict[str, int] = {}
@@ -125,20 +141,44 @@ class CatalogerTask:
 
     # ---- internal ---------------------------------------------------------
 
-    def _classify(self, doc: Document) -> None:
-        """Set structure_class, can_auto_process, manual_review_reason."""
+    @staticmethod
+    def _classify(doc: Document) -> _CatalogFields:
+        """Return (structure_class, can_auto_process, manual_review_reason)."""
         ext = (doc.file_type or "").lower().strip()
 
         structure_class = classify_extension(ext)
-        doc.structure_class = structure_class
-
         if structure_class == "non-extractable":
-            doc.can_auto_process = False
-            doc.manual_review_reason = (
+            reason = (
                 f"File type '.{ext}' is not supported for automated extraction"
                 if ext
                 else "File has no recognized extension"
             )
-        else:
-            doc.can_auto_process = True
-            doc.manual_review_reason = None
+            return structure_class, False, reason
+        return structure_class, True, None
+
+    def _write_bucket(self, fields: _CatalogFields, docs: list[Document]) -> None:
+        """Persist *fields* for *docs* with bulk UPDATEs and mirror them in memory."""
+        structure_class, can_auto_process, reason = fields
+        # Set explicitly (instead of the column's onupdate=now()) so the
+        # in-memory objects can be given the same timestamp the rows got.
+        updated_at = datetime.now(timezone.utc)
+        for start in range(0, len(docs), _UPDATE_CHUNK):
+            chunk = docs[start:start + _UPDATE_CHUNK]
+            self.db.execute(
+                update(Document)
+                .where(Document.id.in_([d.id for d in chunk]))
+                .values(
+                    structure_class=structure_class,
+                    can_auto_process=can_auto_process,
+                    manual_review_reason=reason,
+                    updated_at=updated_at,
+                ),
+                execution_options={"synchronize_session": False},
+            )
+        # The rows are already written: set the values as committed state
+        # so the objects are not dirtied into a second, per-row UPDATE
+        for doc in docs:
+            set_committed_value(doc, "structure_class", structure_class)
+            set_committed_value(doc, "can_auto_process", can_auto_process)
+            set_committed_value(doc, "manual_review_reason", reason)
+            set_committed_value(doc, "updated_at", updated_at)
@@ -18,13 +18,15 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from app.core.constants import get_entity_categories
+from app.core.constants import ENTITY_CATEGORY_MAP, get_entity_categories
 from app.db.models import DensitySummary, Extraction
 
 logger = logging.getLogger(__name__)
@@ -52,7 +54,7 @@ def classify_entity_type(entity_type: str) -> str:
     str
         Primary category (e.g. ``"PII"``, ``"PHI"``, ``"PFI"``).
     """
-    return classify_entity_categories(entity_type)[0]
+    return _entity_categories(entity_type)[0]
 
 
 def classify_entity_categories(entity_type: str) -> list[str]:
@@ -72,7 +74,25 @@ def classify_entity_categories(entity_type: str) -> list[str]:
     list[str]
         One or more category codes.  Unmapped types default to ``["PII"]``.
     """
-    return get_entity_categories(entity_type)
+    return list(_entity_categories(entity_type))
+
+
+# Every mapped type under its canonical spelling, built once at import
+_CATEGORY_TABLE: dict[str, tuple[str, ...]] = {
+    entity_type: tuple(categories)
+    for entity_type, categories in ENTITY_CATEGORY_MAP.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _entity_categories(entity_type: str) -> tuple[str, ...]:
+    """Memoised lookup of *entity_type* in the static ``_CATEGORY_TABLE``.
+
+    Spellings the table does not hold go through the case-insensitive
+    fallback of :func:`get_entity_categories` (unmapped types -> ``("PII",)``);
+    either way the immutable tuple is cached per spelling.
+    """
+    return _CATEGORY_TABLE.get(entity_type) or tuple(get_entity_categories(entity_type))
 
 
 # ---------------------------------------------------------------------------
@@ -106,30 +126,48 @@ def compute_confidence(
     -------
     ConfidenceResult
     """
-    if not confidence_scores:
-        return ConfidenceResult(label="high", notes=["No extractions to score"])
+    # One pass: missing, high (>= 0.75) and low (< 0.50) counts
+    missing_count = high_count = low_count = 0
+    for s in confidence_scores:
+        if s is None:
+            missing_count += 1
+        elif s >= 0.75:
+            high_count += 1
+        elif s < 0.50:
+            low_count += 1
+
+    return _confidence_from_counts(
+        len(confidence_scores), missing_count, high_count, low_count,
+    )
+
+
+def _confidence_from_counts(
+    total: int,
+    missing_count: int,
+    high_count: int,
+    low_count: int,
+) -> ConfidenceResult:
+    """:func:`compute_confidence` over score counts instead of the scores.
 
-    total = len(confidence_scores)
-    valid_scores = [s for s in confidence_scores if s is not None]
-    missing_count = total - len(valid_scores)
+    *high_count* and *low_count* count scores ``>= 0.75`` and ``< 0.50``
+    among the ``total - missing_count`` valid ones.
+    """
+    if not total:
+        return ConfidenceResult(label="high", notes=["No extractions to score"])
 
     notes: list[str] = []
 
     if missing_count > 0:
         notes.append(f"{missing_count} extraction(s) with no confidence score")
 
-    if not valid_scores:
+    valid_total = total - missing_count
+    if not valid_total:
         return ConfidenceResult(label="partial", notes=notes or ["All scores missing"])
 
-    high_count = sum(1 for s in valid_scores if s >= 0.75)
-    low_count = sum(1 for s in valid_scores if s < 0.50)
-
     if low_count > 0:
         notes.append(f"{low_count} low-confidence extraction(s)")
 
-    # Thresholds are based on all scores (valid only)
-    valid_total = len(valid_scores)
-
+    # Threshold ratios count scored extractions only; missing ones are excluded
     if high_count / valid_total > 0.80:
         label = "high"
     elif low_count / valid_total > 0.30:
@@ -145,7 +183,7 @@ def compute_confidence(
 # DensityTask
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractionInput:
     """Lightweight extraction data for density computation.
 
@@ -157,6 +195,71 @@ class ExtractionInput:
     confidence_score: float | None
 
 
+@dataclass(frozen=True, slots=True)
+class _TypeCounts:
+    """Extraction counts for one ``(document_id, pii_type)`` pair.
+
+    The unit density summaries are built from: per extraction in Python
+    (:func:`_count_by_type`) or per ``GROUP BY`` row in SQL
+    (``DensityTask._load_counts``).
+    """
+    document_id: UUID
+    pii_type: str
+    count: int
+    missing: int    # no confidence score
+    high: int       # score >= 0.75
+    low: int        # score < 0.50
+
+
+def _count_by_type(extractions: list[ExtractionInput]) -> list[_TypeCounts]:
+    """Tally *extractions* per ``(document_id, pii_type)``, in first-seen order."""
+    tally: dict[tuple[UUID, str], list[int]] = {}
+    for ext in extractions:
+        key = (ext.document_id, ext.pii_type or "UNKNOWN")
+        counts = tally.get(key)
+        if counts is None:
+            counts = tally[key] = [0, 0, 0, 0]
+        counts[0] += 1
+        s = ext.confidence_score
+        if s is None:
+            counts[1] += 1
+        elif s >= 0.75:
+            counts[2] += 1
+        elif s < 0.50:
+            counts[3] += 1
+    return [_TypeCounts(doc_id, pii_type, *counts) for (doc_id, pii_type), counts in tally.items()]
+
+
+def _density_from_counts(
+    rows: list[_TypeCounts],
+) -> tuple[int, dict[str, int], dict[str, int], ConfidenceResult]:
+    """Density metrics over *rows*, summed whatever their ``document_id``.
+
+    Entity types are classified once per row, not once per extraction.
+    """
+    by_type: Counter[str] = Counter()
+    by_category: Counter[str] = Counter()
+    missing = high = low = 0
+
+    for row in rows:
+        pii_type = row.pii_type or "UNKNOWN"
+        by_type[pii_type] += row.count
+
+        # by_category — a single entity may increment multiple categories
+        for category in _CATEGORY_TABLE.get(pii_type) or _entity_categories(pii_type):
+            by_category[category] += row.count
+
+        missing += row.missing
+        high += row.high
+        low += row.low
+
+    total_entities = sum(by_type.values())
+    confidence = _confidence_from_counts(total_entities, missing, high, low)
+
+    # Plain dicts for the JSON columns
+    return total_entities, dict(by_category), dict(by_type), confidence
+
+
 def _compute_density(
     extractions: list[ExtractionInput],
 ) -> tuple[int, dict[str, int], dict[str, int], ConfidenceResult]:
@@ -167,24 +270,7 @@ def _compute_density(
     tuple
         (total_entities, by_category, by_type, confidence_result)
     """
-    total_entities = len(extractions)
-    by_type: dict[str, int] = {}
-    by_category: dict[str, int] = {}
-
-    for ext in extractions:
-        # by_type
-        pii_type = ext.pii_type or "UNKNOWN"
-        by_type[pii_type] = by_type.get(pii_type, 0) + 1
-
-        # by_category — a single entity may increment multiple categories
-        categories = classify_entity_categories(pii_type)
-        for category in categories:
-            by_category[category] = by_category.get(category, 0) + 1
-
-    scores = [ext.confidence_score for ext in extractions]
-    confidence = compute_confidence(scores)
-
-    return total_entities, by_category, by_type, confidence
+    return _density_from_counts(_count_by_type(extractions))
 
 
 class DensityTask:
@@ -215,8 +301,9 @@ class DensityTask:
             The project to compute density for.
         extraction_inputs:
             Optional pre-built list of ``ExtractionInput``.  If ``None``,
-            extractions are queried from the DB via ingestion runs linked
-            to the project.
+            extractions are counted in the DB (grouped by document and
+            entity type) via ingestion runs linked to the project; the
+            rows themselves are never loaded.
 
         Returns
         -------
@@ -224,18 +311,20 @@ class DensityTask:
             All created summary rows (per-document + project-level).
         """
         if extraction_inputs is None:
-            extraction_inputs = self._load_extractions(project_id)
+            rows = self._load_counts(project_id)
+        else:
+            rows = _count_by_type(extraction_inputs)
 
         # Group by document
-        by_doc: dict[UUID, list[ExtractionInput]] = {}
-        for ext in extraction_inputs:
-            by_doc.setdefault(ext.document_id, []).append(ext)
+        by_doc: dict[UUID, list[_TypeCounts]] = {}
+        for row in rows:
+            by_doc.setdefault(row.document_id, []).append(row)
 
         summaries: list[DensitySummary] = []
 
         # Per-document summaries
-        for doc_id, doc_extractions in by_doc.items():
-            total, by_cat, by_typ, conf = _compute_density(doc_extractions)
+        for doc_id, doc_rows in by_doc.items():
+            total, by_cat, by_typ, conf = _density_from_counts(doc_rows)
             ds = DensitySummary(
                 project_id=project_id,
                 document_id=doc_id,
@@ -245,11 +334,11 @@ class DensityTask:
                 confidence=conf.label,
                 confidence_notes=json.dumps(conf.notes),
             )
-            self.db.add(ds)
             summaries.append(ds)
 
-        # Project-level summary (document_id=NULL)
-        total, by_cat, by_typ, conf = _compute_density(extraction_inputs)
+        # Project-level summary (document_id=NULL), over the same per-type
+        # counts rather than every extraction again
+        total, by_cat, by_typ, conf = _density_from_counts(rows)
         project_ds = DensitySummary(
             project_id=project_id,
             document_id=None,
@@ -259,9 +348,11 @@ class DensityTask:
             confidence=conf.label,
             confidence_notes=json.dumps(conf.notes),
         )
-        self.db.add(project_ds)
         summaries.append(project_ds)
 
+        # Ids are generated client-side, so one flush sends every row in a
+        # single batched INSERT
+        self.db.add_all(summaries)
         self.db.flush()
 
         doc_count = len(by_doc)
@@ -277,26 +368,38 @@ class DensityTask:
 
     # ---- internal ---------------------------------------------------------
 
-    def _load_extractions(self, project_id: UUID) -> list[ExtractionInput]:
-        """Query extractions from DB via ingestion runs linked to the project."""
+    def _load_counts(self, project_id: UUID) -> list[_TypeCounts]:
+        """Count the project's extractions per document and entity type in SQL.
+
+        Returns one row per ``(document_id, pii_type)`` with the score
+        buckets ``compute_confidence`` needs, instead of one per extraction.
+        """
         from app.db.models import Document, IngestionRun
 
+        score = Extraction.confidence_score
         rows = self.db.execute(
             select(
                 Extraction.document_id,
                 Extraction.pii_type,
-                Extraction.confidence_score,
+                func.count(),
+                func.count(score),
+                func.sum(case((score >= 0.75, 1), else_=0)),
+                func.sum(case((score < 0.50, 1), else_=0)),
             )
             .join(Document, Extraction.document_id == Document.id)
             .join(IngestionRun, Document.ingestion_run_id == IngestionRun.id)
             .where(IngestionRun.project_id == project_id)
+            .group_by(Extraction.document_id, Extraction.pii_type)
         ).all()
 
         return [
-            ExtractionInput(
-                document_id=row.document_id,
-                pii_type=row.pii_type,
-                confidence_score=row.confidence_score,
+            _TypeCounts(
+                document_id=document_id,
+                pii_type=pii_type or "UNKNOWN",
+                count=count,
+                missing=count - scored,
+                high=high,
+                low=low,
             )
-            for row in rows
+            for document_id, pii_type, count, scored, high, low in rows
         ]
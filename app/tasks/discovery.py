@@ -22,7 +22,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypedDict
 
@@ -36,6 +39,36 @@ _KNOWN_EXTENSIONS: frozenset[str] = frozenset({
 })
 
 
+def _walk_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield a directory entry for every file below *root*.
+
+    Same selection as ``root.rglob("*")`` filtered by ``is_file()``:
+    symlinks to files are included, symlinked directories are not
+    descended into.  ``DirEntry`` answers both checks from the directory
+    listing, without a stat call per entry.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        yield entry
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logger.warning("Skipping directory %s: %s", directory, exc)
+
+
+def _extension(name: str) -> str:
+    """Lower-case extension of a file name, without the dot (as ``Path.suffix``)."""
+    dot = name.rfind(".")
+    return name[dot + 1:].lower() if 0 < dot < len(name) - 1 else ""
+
+
 class DocumentInfo(TypedDict):
     """Minimal document descriptor returned by every connector."""
     source_path: str
@@ -67,46 +100,92 @@ class FilesystemConnector(DataSourceConnector):
     root:
         Root directory to scan recursively.
     extensions:
-        If provided, only files with these (lowercase, no-dot) extensions are
-        discovered.  Defaults to all _KNOWN_EXTENSIONS.
+        If provided, only files with these extensions are discovered; case
+        and a leading dot are ignored.  An empty set discovers every file.
+        Defaults to all _KNOWN_EXTENSIONS.
+    max_workers:
+        Number of threads reading and hashing files; hashlib releases the
+        GIL while hashing.  1 (default) hashes in the calling thread; None
+        uses os.cpu_count().
+    digest_cache:
+        Optional mapping of ``(path, st_mtime_ns, st_size)`` to SHA-256,
+        shared across scans: files whose key is present are not read
+        again.  Filled in as files are hashed.  Must tolerate concurrent
+        writes when ``max_workers > 1`` (a plain dict does).
     """
 
     def __init__(
         self,
         root: str | Path,
         extensions: frozenset[str] | None = None,
+        max_workers: int | None = 1,
+        digest_cache: MutableMapping[tuple[str, int, int], str] | None = None,
     ) -> None:
         self.root = Path(root)
-        self.extensions = extensions if extensions is not None else _KNOWN_EXTENSIONS
+        # Normalised once here to match _extension(), not per file
+        self.extensions = (
+            frozenset(e.lstrip(".").lower() for e in extensions)
+            if extensions is not None
+            else _KNOWN_EXTENSIONS
+        )
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.digest_cache = digest_cache
 
     def list_documents(self) -> list[DocumentInfo]:
         """Recursively walk root and return a DocumentInfo for every matching file."""
-        docs: list[DocumentInfo] = []
-        for path in sorted(self.root.rglob("*")):
-            if not path.is_file():
-                continue
-            ext = path.suffix.lstrip(".").lower()
-            if self.extensions and ext not in self.extensions:
-                continue
-            try:
-                docs.append(self._describe(path))
-            except OSError as exc:
-                logger.warning("Skipping %s: %s", path, exc)
-        return docs
+        # Path objects only for matching files; sorted as rglob's were
+        extensions = self.extensions
+        paths = sorted(
+            Path(entry.path)
+            for entry in _walk_files(self.root)
+            if not extensions or _extension(entry.name) in extensions
+        )
+
+        if self.max_workers > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as pool:
+                described = list(pool.map(self._try_describe, paths))
+        else:
+            described = [self._try_describe(path) for path in paths]
+        return [doc for doc in described if doc is not None]
 
     def fetch_document(self, doc_id: str) -> bytes:
         """Read and return the bytes of the file at doc_id (treated as a path)."""
         return Path(doc_id).read_bytes()
 
+    def _try_describe(self, path: Path) -> DocumentInfo | None:
+        """``_describe``, logging and returning None for unreadable files."""
+        try:
+            return self._describe(path, self.digest_cache)
+        except OSError as exc:
+            logger.warning("Skipping %s: %s", path, exc)
+            return None
+
     @staticmethod
-    def _describe(path: Path) -> DocumentInfo:
-        content = path.read_bytes()
+    def _describe(
+        path: Path,
+        digest_cache: MutableMapping[tuple[str, int, int], str] | None = None,
+    ) -> DocumentInfo:
+        sha256 = None
+        if digest_cache is not None:
+            st = path.stat()
+            sha256 = digest_cache.get((str(path), st.st_mtime_ns, st.st_size))
+            size = st.st_size
+        if sha256 is None:
+            # file_digest streams the file through a reused buffer, never
+            # holding it in memory whole
+            with path.open("rb") as f:
+                st = os.fstat(f.fileno())
+                sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+            size = st.st_size
+            if digest_cache is not None:
+                # Keyed on the stat of the bytes actually hashed
+                digest_cache[(str(path), st.st_mtime_ns, st.st_size)] = sha256
         return DocumentInfo(
             source_path=str(path.resolve()),
             file_name=path.name,
             file_type=path.suffix.lstrip(".").lower(),
-            size_bytes=len(content),
-            sha256=hashlib.sha256(content).hexdigest(),
+            size_bytes=size,
+            sha256=sha256,
         )
 
 
@@ -152,8 +231,8 @@ class DiscoveryTask:
         list[DocumentInfo]
             Unique documents ordered by source_path, deduplicated by sha256.
         """
-        seen_hashes: set[str] = set()
-        all_docs: list[DocumentInfo] = []
+        # First document seen for each sha256 wins
+        unique: dict[str, DocumentInfo] = {}
 
         for connector in connectors:
             try:
@@ -163,15 +242,12 @@ class DiscoveryTask:
                 continue
 
             for doc in docs:
-                if doc["sha256"] in seen_hashes:
+                if unique.setdefault(doc["sha256"], doc) is not doc:
                     logger.debug(
                         "Skipping duplicate sha256=%s path=%s",
                         doc["sha256"][:12],
                         doc["source_path"],
                     )
-                    continue
-                seen_hashes.add(doc["sha256"])
-                all_docs.append(doc)
 
-        logger.info("Discovery complete: %d unique documents found.", len(all_docs))
-        return sorted(all_docs, key=lambda d: d["source_path"])
+        logger.info("Discovery complete: %d unique documents found.", len(unique))
+        return sorted(unique.values(), key=lambda d: d["source_path"])
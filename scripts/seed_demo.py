@@ -11,7 +11,7 @@ import sys
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import Session
 
 # Ensure project root is on sys.path
@@ -23,9 +23,12 @@ from app.db.models import AuditEvent, NotificationList, NotificationSubject
 
 
 def seed(session: Session) -> None:
-    """Insert demo notification subjects, a notification list, and audit events."""
+    """Insert demo notification subjects, a notification list, and audit events.
+
+    Ids are generated up front, so every table is written with one bulk
+    INSERT of plain row dicts; no ORM objects are built.
+    """
 
-    subjects: list[NotificationSubject] = []
     now = datetime.now(timezone.utc)
 
     demo_people = [
@@ -42,36 +45,36 @@ def seed(session: Session) -> None:
         ("James Brown", "james.b@example.com", "+12025551007", "US", ["ssn", "financial_account", "name"], "NOTIFIED"),
     ]
 
-    for name, email, phone, country, pii_types, status in demo_people:
-        subj = NotificationSubject(
-            subject_id=uuid4(),
-            canonical_name=name,
-            canonical_email=email,
-            canonical_phone=phone,
-            canonical_address={"country": country},
-            pii_types_found=pii_types,
-            source_records=[str(uuid4())],
-            merge_confidence=0.92,
-            notification_required=(status in ("APPROVED", "NOTIFIED")),
-            review_status=status,
-        )
-        session.add(subj)
-        subjects.append(subj)
-
-    session.flush()
+    subjects = [
+        {
+            "subject_id": uuid4(),
+            "canonical_name": name,
+            "canonical_email": email,
+            "canonical_phone": phone,
+            "canonical_address": {"country": country},
+            "pii_types_found": pii_types,
+            "source_records": [str(uuid4())],
+            "merge_confidence": 0.92,
+            "notification_required": status in ("APPROVED", "NOTIFIED"),
+            "review_status": status,
+        }
+        for name, email, phone, country, pii_types, status in demo_people
+    ]
+    session.execute(insert(NotificationSubject), subjects)
 
     # Notification list for HIPAA — includes the APPROVED + NOTIFIED subjects
-    approved_ids = [str(s.subject_id) for s in subjects if s.review_status in ("APPROVED", "NOTIFIED")]
-    nl = NotificationList(
-        notification_list_id=uuid4(),
-        job_id="demo-job-001",
-        protocol_id="hipaa_breach_rule",
-        subject_ids=approved_ids,
-        status="APPROVED",
-        approved_at=now,
-        approved_by="demo-admin",
-    )
-    session.add(nl)
+    approved_ids = [
+        str(s["subject_id"]) for s in subjects if s["review_status"] in ("APPROVED", "NOTIFIED")
+    ]
+    session.execute(insert(NotificationList), [{
+        "notification_list_id": uuid4(),
+        "job_id": "demo-job-001",
+        "protocol_id": "hipaa_breach_rule",
+        "subject_ids": approved_ids,
+        "status": "APPROVED",
+        "approved_at": now,
+        "approved_by": "demo-admin",
+    }])
 
     # Audit events — one per subject
     event_map = {
@@ -80,16 +83,17 @@ def seed(session: Session) -> None:
         "APPROVED": "approval",
         "NOTIFIED": "notification_sent",
     }
-    for subj in subjects:
-        evt = AuditEvent(
-            audit_event_id=uuid4(),
-            event_type=event_map[subj.review_status],
-            actor="demo-seed" if subj.review_status == "AI_PENDING" else "demo-reviewer",
-            subject_id=str(subj.subject_id),
-            decision=subj.review_status.lower(),
-            rationale=f"Demo seed — {subj.review_status}",
-        )
-        session.add(evt)
+    session.execute(insert(AuditEvent), [
+        {
+            "audit_event_id": uuid4(),
+            "event_type": event_map[subj["review_status"]],
+            "actor": "demo-seed" if subj["review_status"] == "AI_PENDING" else "demo-reviewer",
+            "subject_id": str(subj["subject_id"]),
+            "decision": subj["review_status"].lower(),
+            "rationale": f"Demo seed — {subj['review_status']}",
+        }
+        for subj in subjects
+    ])
 
     session.commit()
     print(f"Seeded {len(subjects)} NotificationSubjects, 1 NotificationList, {len(subjects)} AuditEvents.")
@@ -21,7 +21,7 @@ import pytest
 from fastapi import FastAPI
 from fastapi.responses import PlainTextResponse
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -44,43 +44,91 @@ from app.db.models import (
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def db_session():
-    """In-memory SQLite session with all tables created."""
+@pytest.fixture(scope="module")
+def _engine():
+    """In-memory SQLite engine with all tables created, shared by the module.
+
+    pysqlite's own transaction handling is disabled so SQLAlchemy emits
+    BEGIN itself; otherwise SAVEPOINTs do not nest inside the outer
+    transaction each test rolls back.
+    """
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _no_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-    session = SessionLocal()
-    yield session
-    session.close()
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture()
-def client(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> TestClient:
-    """TestClient with get_db overridden to use the in-memory session."""
-    monkeypatch.setenv("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+def db_session(_engine):
+    """Session inside a transaction that is rolled back after each test.
 
-    from app.core.settings import get_settings
+    Commits made by the test or the routes under test release a SAVEPOINT
+    rather than the outer transaction, so every test starts from empty tables.
+    """
+    connection = _engine.connect()
+    trans = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield session
+    session.close()
+    trans.rollback()
+    connection.close()
 
-    get_settings.cache_clear()
+
+@pytest.fixture(scope="module")
+def _app() -> FastAPI:
+    """The API app, imported once per module with the in-memory database URL."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
     from app.api.main import app
 
-    def _override_db():
-        yield db_session
+    yield app
+    mp.undo()
+
 
-    app.dependency_overrides[get_db] = _override_db
-    with TestClient(app, raise_server_exceptions=False) as c:
+@pytest.fixture(scope="module")
+def _client(_app: FastAPI) -> TestClient:
+    """One TestClient, and one lifespan cycle, for every test in the module."""
+    with TestClient(_app, raise_server_exceptions=False) as c:
         yield c
-    app.dependency_overrides.clear()
-    get_settings.cache_clear()
 
 
 @pytest.fixture()
+def client(
+    _client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> TestClient:
+    """TestClient with get_db overridden to use the in-memory session.
+
+    Settings are re-read per test by the autouse fixture in conftest.py.
+    """
+    monkeypatch.setenv("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+    def _override_db():
+        yield db_session
+
+    _client.app.dependency_overrides[get_db] = _override_db
+    yield _client
+    _client.app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="module")
 def pii_client() -> TestClient:
     """Minimal test app that exercises PIIFilterMiddleware in isolation."""
     from app.api.middleware.pii_filter import PIIFilterMiddleware
@@ -117,6 +165,7 @@ def _make_subject(
     phone: str | None = "+12025551234",
     status: str = "AI_PENDING",
     notification_required: bool = True,
+    flush: bool = True,
 ) -> NotificationSubject:
     ns = NotificationSubject(
         subject_id=uuid4(),
@@ -129,7 +178,8 @@ def _make_subject(
         review_status=status,
     )
     db_session.add(ns)
-    db_session.flush()
+    if flush:
+        db_session.flush()
     return ns
 
 
@@ -137,6 +187,7 @@ def _make_notification_list(
     db_session: Session,
     job_id: str,
     subject_ids: list[str],
+    flush: bool = True,
 ) -> NotificationList:
     nl = NotificationList(
         notification_list_id=uuid4(),
@@ -146,7 +197,8 @@ def _make_notification_list(
         status="PENDING",
     )
     db_session.add(nl)
-    db_session.flush()
+    if flush:
+        db_session.flush()
     return nl
 
 
@@ -155,6 +207,7 @@ def _make_review_task(
     subject_id,
     queue_type: str = "low_confidence",
     role: str = "REVIEWER",
+    flush: bool = True,
 ) -> ReviewTask:
     task = ReviewTask(
         review_task_id=uuid4(),
@@ -164,18 +217,18 @@ def _make_review_task(
         required_role=role,
     )
     db_session.add(task)
-    db_session.flush()
+    if flush:
+        db_session.flush()
     return task
 
 
-def _make_audit_event(
-    db_session: Session,
+def _audit_event(
     subject_id: str,
     event_type: str = "human_review",
     actor: str = "reviewer-1",
     rationale: str = "Confirmed correct",
 ) -> AuditEvent:
-    ev = AuditEvent(
+    return AuditEvent(
         audit_event_id=uuid4(),
         event_type=event_type,
         actor=actor,
@@ -184,11 +237,35 @@ def _make_audit_event(
         immutable=True,
         timestamp=datetime.now(timezone.utc),
     )
+
+
+def _make_audit_event(
+    db_session: Session,
+    subject_id: str,
+    event_type: str = "human_review",
+    actor: str = "reviewer-1",
+    rationale: str = "Confirmed correct",
+    flush: bool = True,
+) -> AuditEvent:
+    ev = _audit_event(subject_id, event_type, actor, rationale)
     db_session.add(ev)
-    db_session.flush()
+    if flush:
+        db_session.flush()
     return ev
 
 
+def _make_audit_events(
+    db_session: Session,
+    subject_id: str,
+    specs: list[tuple[str, str, str]],
+) -> list[AuditEvent]:
+    """Add ``(event_type, actor, rationale)`` events in order with one flush."""
+    events = [_audit_event(subject_id, *spec) for spec in specs]
+    db_session.add_all(events)
+    db_session.flush()
+    return events
+
+
 # ===========================================================================
 # Health endpoint
 # ===========================================================================
@@ -319,8 +396,8 @@ class TestReviewQueues:
         assert data["rra_review"] == 0
 
     def test_with_tasks(self, db_session: Session, client: TestClient) -> None:
-        subj = _make_subject(db_session)
-        _make_review_task(db_session, subj.subject_id, "low_confidence")
+        subj = _make_subject(db_session, flush=False)
+        _make_review_task(db_session, subj.subject_id, "low_confidence", flush=False)
         _make_review_task(db_session, subj.subject_id, "escalation", role="LEGAL_REVIEWER")
         resp = client.get("/review/queues")
         data = resp.json()
@@ -347,6 +424,15 @@ class TestReviewQueueList:
         resp = client.get("/review/queues/invalid_queue")
         assert resp.status_code == 400
 
+    def test_limit_and_offset(self, db_session: Session, client: TestClient) -> None:
+        for _ in range(3):
+            subj = _make_subject(db_session, flush=False)
+            _make_review_task(db_session, subj.subject_id, "low_confidence", flush=False)
+        db_session.flush()
+        resp = client.get("/review/queues/low_confidence?limit=2&offset=2")
+        assert resp.status_code == 200
+        assert len(resp.json()) == 1
+
 
 # ===========================================================================
 # POST /review/tasks/{task_id}/assign
@@ -382,6 +468,33 @@ class TestReviewAssign:
         assert resp.status_code == 404
 
 
+class TestReviewClaim:
+    def test_claims_pending_task(self, db_session: Session, client: TestClient) -> None:
+        subj = _make_subject(db_session)
+        task = _make_review_task(db_session, subj.subject_id, "low_confidence")
+        resp = client.post(
+            "/review/queues/low_confidence/claim",
+            json={"reviewer_id": "rev-1", "role": "REVIEWER"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["review_task_id"] == str(task.review_task_id)
+        assert resp.json()["status"] == "IN_PROGRESS"
+
+    def test_empty_queue(self, client: TestClient) -> None:
+        resp = client.post(
+            "/review/queues/low_confidence/claim",
+            json={"reviewer_id": "rev-1", "role": "REVIEWER"},
+        )
+        assert resp.status_code == 404
+
+    def test_wrong_role(self, client: TestClient) -> None:
+        resp = client.post(
+            "/review/queues/escalation/claim",
+            json={"reviewer_id": "rev-1", "role": "REVIEWER"},
+        )
+        assert resp.status_code == 400
+
+
 # ===========================================================================
 # POST /review/tasks/{task_id}/complete
 # ===========================================================================
@@ -487,8 +600,11 @@ class TestReviewComplete:
 class TestAuditHistory:
     def test_returns_events_in_order(self, db_session: Session, client: TestClient) -> None:
         sid = str(uuid4())
-        _make_audit_event(db_session, sid, "human_review", "system", "triage")
-        _make_audit_event(db_session, sid, "approval", "rev-1", "confirmed")
+        _make_audit_events(
+            db_session,
+            sid,
+            [("human_review", "system", "triage"), ("approval", "rev-1", "confirmed")],
+        )
         resp = client.get(f"/audit/{sid}/history")
         assert resp.status_code == 200
         events = resp.json()
@@ -224,6 +224,70 @@ class TestCatalogerTask:
         assert result[2].structure_class == "unstructured"
         assert result[3].structure_class == "non-extractable"
 
+    def test_one_update_per_catalog_bucket(self, db_session: Session) -> None:
+        """Documents with identical catalog fields share one UPDATE."""
+        from sqlalchemy import event
+
+        run = _make_ingestion_run(db_session)
+        docs = [
+            _make_document(db_session, run.id, f"f{i}.{ext}", ext)
+            for i, ext in enumerate(["pdf", "docx", "csv", "xlsx", "pdf", "dat", "dat"])
+        ]
+        updates: list[str] = []
+
+        def _count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("UPDATE"):
+                updates.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            CatalogerTask(db_session).run(docs)
+            db_session.flush()
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        # unstructured, structured, and one non-extractable reason for .dat
+        assert len(updates) == 3
+        assert not db_session.dirty
+        db_session.expire_all()
+        assert [d.structure_class for d in docs] == [
+            "unstructured", "unstructured", "structured", "structured",
+            "unstructured", "non-extractable", "non-extractable",
+        ]
+
+    def test_updated_at_in_memory_matches_database(self, db_session: Session) -> None:
+        run = _make_ingestion_run(db_session)
+        doc = _make_document(db_session, run.id, "a.pdf", "pdf")
+        before = doc.updated_at
+
+        # No commit: expire_on_commit would reload and hide a stale value
+        CatalogerTask(db_session).run([doc])
+        db_session.flush()
+        in_memory = doc.updated_at
+        db_session.expire(doc, ["updated_at"])
+
+        assert in_memory != before
+        # SQLite returns naive datetimes; compare the wall-clock value
+        assert doc.updated_at.replace(tzinfo=None) == in_memory.replace(tzinfo=None)
+
+    def test_pending_documents_are_inserted_first(self, db_session: Session) -> None:
+        run = _make_ingestion_run(db_session)
+        doc = Document(
+            id=uuid4(),
+            ingestion_run_id=run.id,
+            source_path="/tmp/new.csv",
+            file_name="new.csv",
+            file_type="csv",
+            sha256=hashlib.sha256(b"new").hexdigest(),
+            status="discovered",
+        )
+        db_session.add(doc)
+        CatalogerTask(db_session).run([doc])
+        db_session.commit()
+        db_session.expire_all()
+        assert db_session.get(Document, doc.id).structure_class == "structured"
+
     def test_empty_list(self, db_session: Session) -> None:
         """Running on an empty list should not fail."""
         result = CatalogerTask(db_session).run([])
@@ -15,7 +15,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from app.readers.classifier import classify_page, PageClass
+from app.readers.classifier import classify_page, classify_text, PageClass
 
 
 # ---------------------------------------------------------------------------
@@ -146,3 +146,11 @@ def test_classify_all_valid_labels():
     for n in (0, 1, 5, 6, 50, 51, 200):
         label = classify_page(_page_words(n))
         assert label in valid, f"Unexpected label {label!r} for {n} words"
+
+
+@pytest.mark.parametrize("words", [0, 5, 6, 50, 51])
+def test_classify_text_matches_classify_page(words):
+    text = "word " * words
+    page = MagicMock()
+    page.get_text.return_value = text
+    assert classify_text(text) == classify_page(page)
@@ -94,6 +94,19 @@ class TestBestValue:
     def test_empty_strings_ignored(self):
         assert _best_value(["", "alice", ""]) == "alice"
 
+    def test_matches_sort_based_selection(self):
+        import random as _random
+
+        rng = _random.Random(3)
+        pool = ["a", "b", "ab", "ba", "abc", "cab", None, ""]
+        for _ in range(500):
+            values = [rng.choice(pool) for _ in range(rng.randint(0, 12))]
+            cleaned = [v for v in values if v]
+            expected = None
+            if cleaned:
+                expected = min(set(cleaned), key=lambda v: (-cleaned.count(v), -len(v), v))
+            assert _best_value(values) == expected
+
 
 class TestBestAddress:
     def test_most_frequent_zip_wins(self):
@@ -290,3 +303,99 @@ class TestBuildSubjects:
         db_session.commit()
 
         assert subjects[0].merge_confidence == pytest.approx(0.73)
+
+    def test_merges_into_subject_from_earlier_run(self, db_session):
+        dedup = Deduplicator(db_session)
+        dedup.build_subjects([_group([
+            _rec(record_id="r1", raw_phone="+15551234567", entity_type="A"),
+        ])])
+        db_session.commit()
+
+        subjects = dedup.build_subjects([
+            _group([_rec(record_id="r2", raw_phone="+15551234567", entity_type="B")]),
+            _group([_rec(record_id="r3", raw_email="new@x.com", entity_type="C")]),
+        ])
+        db_session.commit()
+
+        assert db_session.query(NotificationSubject).count() == 2
+        assert set(subjects[0].source_records) == {"r1", "r2"}
+        assert subjects[1].source_records == ["r3"]
+
+    def test_existing_subjects_fetched_in_two_queries(self, db_session):
+        from sqlalchemy import event
+
+        groups = [
+            _group([_rec(
+                record_id=f"r{i}",
+                raw_email=f"user{i}@x.com",
+                raw_phone=f"+1555000{i:04d}",
+            )])
+            for i in range(20)
+        ]
+        selects: list[str] = []
+
+        def _count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            Deduplicator(db_session).build_subjects(groups)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        assert len(selects) == 2
+
+    def test_existing_subject_lookup_is_chunked(self, db_session, monkeypatch):
+        from sqlalchemy import event
+
+        import app.rra.deduplicator as dedup_mod
+
+        dedup = Deduplicator(db_session)
+        dedup.build_subjects([
+            _group([_rec(record_id=f"old{i}", raw_email=f"user{i}@x.com")])
+            for i in range(5)
+        ])
+        db_session.commit()
+
+        monkeypatch.setattr(dedup_mod, "_IN_CHUNK", 2)
+        selects: list[str] = []
+
+        def _count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            subjects = dedup.build_subjects([
+                _group([_rec(record_id=f"new{i}", raw_email=f"user{i}@x.com")])
+                for i in range(5)
+            ])
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        # 5 emails in chunks of 2 -> 3 SELECTs; every group found its subject
+        assert len(selects) == 3
+        assert db_session.query(NotificationSubject).count() == 5
+        assert all(len(ns.source_records) == 2 for ns in subjects)
+
+    def test_new_subjects_inserted_in_single_flush(self, db_session):
+        from sqlalchemy import event
+
+        groups = [_group([_rec(record_id=f"r{i}", raw_email=f"u{i}@x.com")]) for i in range(10)]
+        flushes: list[int] = []
+
+        def _count(session, ctx, instances):
+            flushes.append(len(session.new))
+
+        event.listen(db_session, "before_flush", _count)
+        try:
+            subjects = Deduplicator(db_session).build_subjects(groups)
+        finally:
+            event.remove(db_session, "before_flush", _count)
+
+        assert flushes == [10]
+        assert [s.source_records for s in subjects] == [[f"r{i}"] for i in range(10)]
+
@@ -196,6 +196,11 @@ class TestClassifyEntityCategories:
     def test_unknown_defaults_to_pii(self) -> None:
         assert classify_entity_categories("UNKNOWN") == ["PII"]
 
+    def test_returns_fresh_list_per_call(self) -> None:
+        cats = classify_entity_categories("SSN")
+        cats.append("MUTATED")
+        assert "MUTATED" not in classify_entity_categories("SSN")
+
 
 # ===========================================================================
 # compute_confidence() — pure function tests
@@ -327,6 +332,17 @@ class TestComputeDensity:
         assert by_typ == {"SSN": 3}
         # SSN -> PII + SPII, so 3 of each
         assert by_cat == {"PII": 3, "SPII": 3}
+        # Plain dicts, not Counters, go to the JSON columns
+        assert type(by_cat) is dict and type(by_typ) is dict
+
+    def test_category_counts_match_mapping_for_any_spelling(self) -> None:
+        from app.core.constants import ENTITY_CATEGORY_MAP, get_entity_categories
+
+        doc_id = uuid4()
+        for entity_type in [*ENTITY_CATEGORY_MAP, "ssn", "Credit_Card", "NOT_MAPPED"]:
+            inputs = [ExtractionInput(document_id=doc_id, pii_type=entity_type, confidence_score=0.9)]
+            _, by_cat, _, _ = _compute_density(inputs)
+            assert by_cat == dict.fromkeys(get_entity_categories(entity_type), 1)
 
     def test_all_phi_types(self) -> None:
         doc_id = uuid4()
@@ -339,6 +355,12 @@ class TestComputeDensity:
         assert by_cat == {"PHI": 3}
         assert "PII" not in by_cat
 
+    def test_extraction_input_is_slotted_and_immutable(self) -> None:
+        ext = ExtractionInput(document_id=uuid4(), pii_type="SSN", confidence_score=0.9)
+        assert not hasattr(ext, "__dict__")
+        with pytest.raises(AttributeError):
+            ext.pii_type = "EMAIL"  # type: ignore[misc]
+
 
 # ===========================================================================
 # DensityTask.run() — ORM integration
@@ -491,6 +513,99 @@ class TestDensityTask:
         project_summary = [s for s in summaries if s.document_id is None][0]
         assert project_summary.total_entities == 2
 
+    def test_project_summary_folded_from_documents(self, db_session: Session) -> None:
+        """The project row matches a direct computation over all inputs,
+        and is built from the per-type counts, not the extractions."""
+        from unittest.mock import patch
+        from app.tasks import density
+
+        project = _make_project(db_session)
+        run = _make_ingestion_run(db_session, project_id=project.id)
+        docs = [_make_document(db_session, run.id, f"{k}.pdf", "pdf") for k in range(3)]
+        types = ["SSN", "EMAIL", "MRN", "CREDIT_CARD", "PASSWORD", None]
+        scores = [0.30, 0.60, 0.90, None]
+        inputs = [
+            ExtractionInput(
+                document_id=docs[k % 3].id,
+                pii_type=types[k % len(types)],
+                confidence_score=scores[k % len(scores)],
+            )
+            for k in range(40)
+        ]
+
+        with (
+            patch.object(density, "_count_by_type", wraps=density._count_by_type) as counted,
+            patch.object(density, "_density_from_counts", wraps=density._density_from_counts) as built,
+        ):
+            summaries = DensityTask(db_session).run(project.id, extraction_inputs=inputs)
+        assert counted.call_count == 1
+        assert built.call_count == len(docs) + 1
+
+        total, by_cat, by_typ, conf = _compute_density(inputs)
+        project_summary = [s for s in summaries if s.document_id is None][0]
+        assert project_summary.total_entities == total
+        assert project_summary.by_category == by_cat
+        assert project_summary.by_type == by_typ
+        assert project_summary.confidence == conf.label
+        assert json.loads(project_summary.confidence_notes) == conf.notes
+
+    def test_summaries_written_in_one_insert(self, db_session: Session) -> None:
+        from sqlalchemy import event
+
+        project = _make_project(db_session)
+        run = _make_ingestion_run(db_session, project_id=project.id)
+        docs = [_make_document(db_session, run.id, f"{k}.pdf", "pdf") for k in range(5)]
+        inputs = [
+            ExtractionInput(document_id=doc.id, pii_type="SSN", confidence_score=0.90)
+            for doc in docs
+        ]
+        db_session.flush()
+
+        inserts: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO density_summaries"):
+                inserts.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            summaries = DensityTask(db_session).run(project.id, extraction_inputs=inputs)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        assert len(summaries) == 6
+        assert len(inserts) == 1
+
+    def test_db_counts_match_in_memory_inputs(self, db_session: Session) -> None:
+        """The SQL GROUP BY path yields the same summaries as the same
+        extractions passed in as ExtractionInput."""
+        project = _make_project(db_session)
+        run = _make_ingestion_run(db_session, project_id=project.id)
+        docs = [_make_document(db_session, run.id, f"{k}.pdf", "pdf") for k in range(3)]
+        types = ["SSN", "EMAIL", "MRN", "CREDIT_CARD", "ssn", ""]
+        scores = [0.30, 0.50, 0.60, 0.75, 0.90, None]
+        inputs = []
+        for k in range(50):
+            doc_id = docs[k % 3].id
+            pii_type = types[k % len(types)]
+            score = scores[(k * 7) % len(scores)]
+            _make_extraction(db_session, doc_id, pii_type, score)
+            inputs.append(ExtractionInput(document_id=doc_id, pii_type=pii_type, confidence_score=score))
+
+        def _rows(summaries):
+            return sorted(
+                (
+                    str(s.document_id), s.total_entities, s.by_category, s.by_type,
+                    s.confidence, s.confidence_notes,
+                )
+                for s in summaries
+            )
+
+        from_db = DensityTask(db_session).run(project.id, extraction_inputs=None)
+        from_inputs = DensityTask(db_session).run(project.id, extraction_inputs=inputs)
+        assert _rows(from_db) == _rows(from_inputs)
+
     def test_low_confidence_persisted(self, db_session: Session) -> None:
         """A batch of low-confidence extractions gets 'low' label."""
         project = _make_project(db_session)
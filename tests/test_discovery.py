@@ -58,6 +58,14 @@ class TestFilesystemConnector:
         docs = conn.list_documents()
         assert all(d["file_type"] == "pdf" for d in docs)
 
+    def test_extension_filter_ignores_case_and_leading_dot(self, tmp_path: Path):
+        (tmp_path / "a.pdf").write_bytes(b"a")
+        (tmp_path / "b.CSV").write_bytes(b"b")
+        (tmp_path / "c.txt").write_bytes(b"c")
+        conn = FilesystemConnector(tmp_path, extensions=frozenset({"PDF", ".csv"}))
+        assert conn.extensions == frozenset({"pdf", "csv"})
+        assert [d["file_name"] for d in conn.list_documents()] == ["a.pdf", "b.CSV"]
+
     def test_extension_filter_defaults_to_known_extensions(self, tmp_path: Path):
         (tmp_path / "doc.pdf").write_bytes(b"pdf")
         (tmp_path / "unknown.xyz").write_bytes(b"xyz")
@@ -85,6 +93,15 @@ class TestFilesystemConnector:
         docs = conn.list_documents()
         assert docs[0]["size_bytes"] == 5
 
+    def test_multi_chunk_file_hashed_and_sized(self, tmp_path: Path):
+        # Larger than one file_digest read buffer (256 KiB)
+        content = bytes(range(256)) * 4097
+        (tmp_path / "big.csv").write_bytes(content)
+        conn = FilesystemConnector(tmp_path, extensions=frozenset({"csv"}))
+        [doc] = conn.list_documents()
+        assert doc["sha256"] == hashlib.sha256(content).hexdigest()
+        assert doc["size_bytes"] == len(content)
+
     def test_file_name_is_basename(self, tmp_path: Path):
         f = tmp_path / "my_report.xlsx"
         f.write_bytes(b"data")
@@ -140,6 +157,76 @@ class TestFilesystemConnector:
         assert docs == []
         mock_warn.assert_called_once()
 
+    def test_walk_matches_rglob_selection_and_order(self, tmp_path: Path):
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a-c").mkdir()
+        (tmp_path / "real").mkdir()
+        for rel in ("a/b/x.csv", "a-c/q.csv", "real/y.csv", ".hidden.csv", ".csv", "noext"):
+            (tmp_path / rel).write_bytes(rel.encode())
+        (tmp_path / "linkdir").symlink_to(tmp_path / "real", target_is_directory=True)
+        (tmp_path / "link.csv").symlink_to(tmp_path / "real" / "y.csv")
+
+        for extensions in (frozenset({"csv"}), frozenset()):
+            expected = [
+                str(p.resolve())
+                for p in sorted(tmp_path.rglob("*"))
+                if p.is_file() and (not extensions or p.suffix.lstrip(".").lower() in extensions)
+            ]
+            conn = FilesystemConnector(tmp_path, extensions=extensions, max_workers=1)
+            assert [d["source_path"] for d in conn.list_documents()] == expected
+
+    def test_missing_root_returns_empty_list(self, tmp_path: Path):
+        assert FilesystemConnector(tmp_path / "missing").list_documents() == []
+
+    def test_threaded_hashing_matches_serial_in_order(self, tmp_path: Path):
+        for k in range(12):
+            sub = tmp_path / f"d{k % 3}"
+            sub.mkdir(exist_ok=True)
+            (sub / f"f{k}.csv").write_bytes(str(k).encode() * (k + 1))
+        serial = FilesystemConnector(tmp_path, max_workers=1).list_documents()
+        threaded = FilesystemConnector(tmp_path, max_workers=4).list_documents()
+        assert len(serial) == 12
+        assert threaded == serial
+
+    def test_serial_by_default(self, tmp_path: Path):
+        assert FilesystemConnector(tmp_path).max_workers == 1
+
+    def test_os_error_skips_only_that_file_when_threaded(self, tmp_path: Path):
+        for name in ("a.csv", "b.csv", "c.csv"):
+            (tmp_path / name).write_bytes(name.encode())
+        describe = FilesystemConnector._describe
+
+        def _flaky(path: Path, *args):
+            if path.name == "b.csv":
+                raise OSError("permission denied")
+            return describe(path, *args)
+
+        conn = FilesystemConnector(tmp_path, max_workers=3)
+        with patch.object(FilesystemConnector, "_describe", side_effect=_flaky):
+            docs = conn.list_documents()
+        assert [d["file_name"] for d in docs] == ["a.csv", "c.csv"]
+
+    def test_digest_cache_skips_unchanged_files(self, tmp_path: Path):
+        import os
+        a = tmp_path / "a.csv"
+        b = tmp_path / "b.csv"
+        a.write_bytes(b"alpha")
+        b.write_bytes(b"beta")
+        cache: dict[tuple[str, int, int], str] = {}
+        conn = FilesystemConnector(tmp_path, max_workers=1, digest_cache=cache)
+        first = conn.list_documents()
+        assert len(cache) == 2
+
+        # Content changes size and mtime; the cached digest for b no longer applies
+        b.write_bytes(b"beta, edited")
+        os.utime(b, ns=(0, 1))
+        with patch("app.tasks.discovery.hashlib.file_digest", wraps=hashlib.file_digest) as hashed:
+            second = conn.list_documents()
+        assert hashed.call_count == 1
+        assert second[0] == first[0]
+        assert second[1]["sha256"] == hashlib.sha256(b"beta, edited").hexdigest()
+        assert second[1]["size_bytes"] == len(b"beta, edited")
+
     # -----------------------------------------------------------------------
     # fetch_document
     # -----------------------------------------------------------------------
@@ -209,14 +296,16 @@ class TestDiscoveryTask:
         assert len(result) == 1
 
     def test_deduplication_across_connectors(self):
-        d1 = self._doc("/a/file.pdf", sha="bbb")
-        d2 = self._doc("/b/file.pdf", sha="bbb")  # same content via second connector
+        d1 = self._doc("/b/file.pdf", sha="bbb")
+        d2 = self._doc("/a/file.pdf", sha="bbb")  # same content via second connector
         task = DiscoveryTask()
         result = task.run([
             self._make_connector([d1]),
             self._make_connector([d2]),
         ])
         assert len(result) == 1
+        # The first connector's copy is the one kept
+        assert result[0]["source_path"] == "/b/file.pdf"
 
     def test_different_sha256_both_included(self):
         d1 = self._doc("/a/x.pdf", sha="ccc")
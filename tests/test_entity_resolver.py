@@ -168,6 +168,11 @@ class TestBuildConfidence:
         r2 = _rec(entity_type="US_PASSPORT", normalized_value="123-45-6789", record_id="r2")
         assert build_confidence(r1, r2) == 0.0
 
+    def test_gov_id_type_case_insensitive_and_value_stripped(self):
+        r1 = _rec(entity_type="us_ssn", normalized_value=" 123-45-6789")
+        r2 = _rec(entity_type="US_SSN", normalized_value="123-45-6789 ", record_id="r2")
+        assert build_confidence(r1, r2) == pytest.approx(0.50)
+
     def test_names_dont_match_no_name_signals(self):
         """Different names → no name-dependent signals fire."""
         r1 = _rec(raw_name="Alice Zhang", raw_dob="1990-01-01")
@@ -218,6 +223,19 @@ class TestResolve:
         assert len(merged) == 1
         assert {r.record_id for r in merged[0].records} == {"a", "b", "c"}
 
+    def test_transitive_group_confidence_covers_unlinked_pair(self):
+        """A and C share nothing, so the chain group is flagged for review
+        even though every merge edge applied was strong."""
+        a = _rec(record_id="a", raw_email="shared@x.com", raw_phone="+15550000001")
+        b = _rec(record_id="b", raw_email="shared@x.com", raw_phone="+15551234567")
+        c = _rec(record_id="c", raw_email="other@x.com", raw_phone="+15551234567")
+        class LooseResolver(EntityResolver):
+            MERGE_THRESHOLD = 0.35
+
+        [group] = [g for g in LooseResolver().resolve([a, b, c]) if len(g.records) == 3]
+        assert group.merge_confidence == 0.0
+        assert group.needs_human_review is True
+
     def test_below_threshold_separate_groups(self):
         """Name-only match (0.10) is below 0.60 → separate groups."""
         r1 = _rec(record_id="r1", raw_name="John Smith")
@@ -642,3 +660,285 @@ class TestResolveWithAnchors:
         assert len(merged) == 1
         assert merged[0].merge_confidence == pytest.approx(0.40)
         assert merged[0].needs_human_review is True  # 0.40 < 0.80
+
+
+# ---------------------------------------------------------------------------
+# Blocking — must produce the same groups as comparing every pair
+# ---------------------------------------------------------------------------
+
+def _brute_force_groups(records, anchors, threshold=EntityResolver.MERGE_THRESHOLD):
+    parent = list(range(len(records)))
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    for i in range(len(records)):
+        for j in range(i + 1, len(records)):
+            if build_confidence(records[i], records[j], active_anchors=anchors) >= threshold:
+                parent[find(j)] = find(i)
+    groups: dict[int, set[str]] = {}
+    for i, r in enumerate(records):
+        groups.setdefault(find(i), set()).add(r.record_id)
+    return sorted(sorted(g) for g in groups.values())
+
+
+def _random_records(seed: int, n: int = 60) -> list[PIIRecord]:
+    import random
+    rng = random.Random(seed)
+    names = ["john smith", "jon smith", "jane doe", "jayne doe", "maria garcia", "mario garcia"]
+    ssns = ["123-45-6789", "123-45-6788", "12345-6789", "987-65-4321"]
+    dobs = ["1990-01-15", "01/15/1990", "1985-03-02", None]
+    zips = ["62701", "627 01", "10001", None]
+    records = []
+    for k in range(n):
+        is_gov = rng.random() < 0.3
+        z = rng.choice(zips)
+        records.append(_rec(
+            record_id=f"r{k}",
+            entity_type=rng.choice(["US_SSN", "us_ssn", "PASSPORT"]) if is_gov else "PERSON",
+            normalized_value=rng.choice(ssns) if is_gov else "",
+            raw_name=rng.choice(names + [None]),
+            raw_email=rng.choice(["a@x.com", "A@X.com ", "b@y.com", None, None]),
+            raw_phone=rng.choice(["5551234567", "5559999999", None, None]),
+            raw_dob=rng.choice(dobs),
+            raw_address=_addr(street=rng.choice(["1 main st", "1 main street"]), zip_code=z) if z else None,
+        ))
+    return records
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("anchors", [None, ["ssn"], ["name_dob", "name"], ["name_address"], ["email", "phone"]])
+def test_blocking_matches_all_pairs(seed, anchors):
+    records = _random_records(seed)
+    resolved = EntityResolver().resolve(records, active_anchors=anchors)
+    got = sorted(sorted(r.record_id for r in g.records) for g in resolved)
+    assert got == _brute_force_groups(records, _resolve_anchors(anchors))
+
+
+def test_gov_id_one_edit_apart_still_compared():
+    a = _rec(record_id="a", entity_type="US_SSN", normalized_value="123456789")
+    b = _rec(record_id="b", entity_type="US_SSN", normalized_value="12345678")
+    groups = EntityResolver().resolve([a, b], active_anchors=["ssn"])
+    assert len(groups) == 1
+
+
+def test_low_threshold_falls_back_to_all_pairs():
+    class LooseResolver(EntityResolver):
+        MERGE_THRESHOLD = 0.10
+
+    a = _rec(record_id="a", raw_name="john smith")
+    b = _rec(record_id="b", raw_name="john smith")
+    assert len(LooseResolver().resolve([a, b])) == 1
+    assert len(EntityResolver().resolve([a, b])) == 2
+
+
+# ---------------------------------------------------------------------------
+# Early exit
+# ---------------------------------------------------------------------------
+
+def test_threshold_skips_fuzzy_name_comparison():
+    from unittest.mock import patch
+    a = _rec(record_id="a", raw_email="x@y.com", raw_name="john smith")
+    b = _rec(record_id="b", raw_email="x@y.com", raw_name="john smith")
+    with patch("app.rra.entity_resolver.names_match_cached") as names:
+        assert build_confidence(a, b, threshold=0.30) == pytest.approx(0.40)
+    names.assert_not_called()
+    assert build_confidence(a, b) == pytest.approx(0.50)
+
+
+def test_score_at_cap_stops_without_changing_result():
+    from unittest.mock import patch
+    a = _rec(record_id="a", entity_type="US_SSN", normalized_value="123456789",
+             raw_email="x@y.com", raw_phone="555", raw_name="john smith")
+    b = _rec(record_id="b", entity_type="US_SSN", normalized_value="123456789",
+             raw_email="x@y.com", raw_phone="555", raw_name="john smith")
+    with patch("app.rra.entity_resolver.names_match_cached") as names:
+        assert build_confidence(a, b) == 1.0
+    names.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Group confidence reuses scored pairs
+# ---------------------------------------------------------------------------
+
+def test_group_min_conf_reuses_main_loop_scores():
+    from unittest.mock import patch
+    from app.rra import entity_resolver as er
+
+    # All three share an email, so every pair is scored in the main loop
+    records = [
+        _rec(record_id=rid, raw_email="x@y.com", raw_phone=phone)
+        for rid, phone in (("a", "555"), ("b", "555"), ("c", "777"))
+    ]
+    with patch.object(er, "_pair_confidence", wraps=er._pair_confidence) as scored:
+        (group,) = EntityResolver().resolve(records)
+    assert scored.call_count == 3
+    assert group.merge_confidence == pytest.approx(0.40)
+    assert group.needs_human_review
+
+
+def test_build_confidence_accepts_anchor_mask():
+    from app.rra.entity_resolver import _anchor_mask
+
+    a = _rec(record_id="a", raw_email="x@y.com", raw_phone="555", raw_name="john smith")
+    b = _rec(record_id="b", raw_email="x@y.com", raw_phone="555", raw_name="john smith")
+    for anchors in (["email"], ["phone", "name"], list(VALID_ANCHORS)):
+        mask = _anchor_mask(_resolve_anchors(anchors))
+        assert build_confidence(a, b, active_anchors=mask) == build_confidence(
+            a, b, active_anchors=anchors
+        )
+    assert _anchor_mask(VALID_ANCHORS) == 0b111111
+
+
+# ---------------------------------------------------------------------------
+# Parallel pair scoring (max_workers > 1)
+# ---------------------------------------------------------------------------
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs submissions in-process."""
+
+    def __init__(self, max_workers=None, mp_context=None):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        fut = Future()
+        fut.set_result(fn(*args))
+        return fut
+
+
+def _grouping(resolved):
+    return sorted(
+        (sorted(r.record_id for r in g.records), round(g.merge_confidence, 6))
+        for g in resolved
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_parallel_scoring_matches_sequential(seed, monkeypatch):
+    from app.rra import entity_resolver as er
+
+    records = _random_records(seed)
+    expected = _grouping(EntityResolver().resolve(records))
+
+    monkeypatch.setattr(er, "_PARALLEL_CHUNK_PAIRS", 7)
+    monkeypatch.setattr(er, "ProcessPoolExecutor", _InlineExecutor)
+    assert _grouping(EntityResolver(max_workers=4).resolve(records)) == expected
+
+
+def test_parallel_scoring_in_worker_processes(monkeypatch):
+    from app.rra import entity_resolver as er
+
+    records = _random_records(5, n=40)
+    expected = _grouping(EntityResolver().resolve(records))
+
+    monkeypatch.setattr(er, "_PARALLEL_CHUNK_PAIRS", 50)
+    assert _grouping(EntityResolver(max_workers=2).resolve(records)) == expected
+
+
+def test_small_batches_stay_in_process(monkeypatch):
+    from app.rra import entity_resolver as er
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("pool should not start below one chunk of pairs")
+
+    monkeypatch.setattr(er, "ProcessPoolExecutor", _no_pool)
+    EntityResolver(max_workers=8).resolve(_random_records(0))
+
+
+def test_group_min_conf_stops_at_zero():
+    from unittest.mock import patch
+    from app.rra import entity_resolver as er
+
+    # Chain a–b (email), b–c (phone), c–d (email); the other pairs share
+    # nothing, so the first of them scored pins the minimum at 0.0
+    records = [
+        _rec(record_id="a", raw_email="a@x.com"),
+        _rec(record_id="b", raw_email="a@x.com", raw_phone="555"),
+        _rec(record_id="c", raw_phone="555", raw_email="c@x.com"),
+        _rec(record_id="d", raw_email="c@x.com"),
+    ]
+    with patch.object(er, "_pair_confidence", wraps=er._pair_confidence) as scored:
+        (group,) = EntityResolver().resolve(records)
+    assert group.merge_confidence == 0.0
+    assert group.needs_human_review
+    assert scored.call_count == 3 + 1
+
+
+def test_identical_names_skip_fuzzy_lookup():
+    from unittest.mock import patch
+    from app.rra import entity_resolver as er
+
+    a = _rec(record_id="a", raw_name="李雷", raw_dob="1990-01-15")
+    b = _rec(record_id="b", raw_name="李雷", raw_dob="1990-01-15")
+    with patch.object(er, "names_match_cached", wraps=er.names_match_cached) as fuzzy:
+        assert build_confidence(a, b) == pytest.approx(0.45)
+        assert fuzzy.call_count == 0
+        c = _rec(record_id="c", raw_name="Li Lei", raw_dob="1990-01-15")
+        build_confidence(a, c)
+        assert fuzzy.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Cross-batch pair cache (cache_size > 0)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("anchors", [None, ["ssn"], ["name_dob", "name"]])
+def test_cached_resolver_matches_uncached(anchors):
+    resolver = EntityResolver(cache_size=10_000)
+    for seed in range(4):
+        records = _random_records(seed)
+        expected = _grouping(EntityResolver().resolve(records, active_anchors=anchors))
+        assert _grouping(resolver.resolve(records, active_anchors=anchors)) == expected
+
+
+def test_cached_parallel_scoring_matches_sequential(monkeypatch):
+    from app.rra import entity_resolver as er
+
+    monkeypatch.setattr(er, "_PARALLEL_CHUNK_PAIRS", 7)
+    monkeypatch.setattr(er, "ProcessPoolExecutor", _InlineExecutor)
+    resolver = EntityResolver(max_workers=4, cache_size=10_000)
+    for seed in (0, 1, 0):
+        records = _random_records(seed)
+        assert _grouping(resolver.resolve(records)) == _grouping(EntityResolver().resolve(records))
+
+
+def test_repeated_batch_skips_main_loop_scoring():
+    from unittest.mock import patch
+    from app.rra import entity_resolver as er
+
+    # Same content under new record ids still hits the cache
+    records = [
+        _rec(record_id=rid, raw_email="x@y.com", raw_phone=phone)
+        for rid, phone in (("a", "555"), ("b", "555"), ("c", "777"))
+    ]
+    again = [_rec(record_id=r.record_id + "2", raw_email=r.raw_email, raw_phone=r.raw_phone)
+             for r in records]
+    resolver = EntityResolver(cache_size=100)
+    resolver.resolve(records)
+    with patch.object(er, "_pair_confidence", wraps=er._pair_confidence) as scored:
+        (group,) = resolver.resolve(again)
+    assert scored.call_count == 0
+    assert group.merge_confidence == pytest.approx(0.40)
+
+    resolver.clear_cache()
+    with patch.object(er, "_pair_confidence", wraps=er._pair_confidence) as scored:
+        resolver.resolve(again)
+    # a and b have the same content, so a–c and b–c share one entry
+    assert scored.call_count == 2
+
+
+def test_pair_cache_is_bounded():
+    resolver = EntityResolver(cache_size=5)
+    for seed in range(3):
+        resolver.resolve(_random_records(seed))
+        assert len(resolver._conf_cache) <= 5
+    assert EntityResolver()._conf_cache is None
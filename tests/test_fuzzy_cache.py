@@ -0,0 +1,65 @@
+"""Tests for app/rra/fuzzy_cache.py — memoised fuzzy comparators."""
+from __future__ import annotations
+
+import pytest
+
+from app.rra.fuzzy import addresses_match, names_match
+from app.rra.fuzzy_cache import (
+    addresses_match_cached,
+    clear_caches,
+    freeze_address,
+    names_match_cached,
+    _names_match,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.mark.parametrize("a,b", [
+    ("john smith", "jon smith"),
+    ("Maria Garcia", "maria garcia"),
+    ("robert", "rupert"),
+    ("alice", "bob"),
+    ("", "x"),
+])
+def test_names_match_cached_equals_uncached(a, b):
+    assert names_match_cached(a, b) == names_match(a, b)
+    assert names_match_cached(b, a) == names_match(a, b)
+
+
+def test_names_cache_shared_across_argument_order():
+    names_match_cached("john smith", "jon smith")
+    names_match_cached("jon smith", "john smith")
+    info = _names_match.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_addresses_match_cached_handles_none_fields():
+    a = {"street": "1 main st", "city": None, "zip": "62701", "country": "US"}
+    b = {"street": "1 main street", "city": "springfield", "zip": "62701", "country": None}
+    expected = addresses_match(a, b)
+    assert addresses_match_cached(freeze_address(a), freeze_address(b)) == expected
+    assert addresses_match_cached(freeze_address(b), freeze_address(a)) == expected
+
+
+def test_freeze_address_ignores_key_order():
+    assert freeze_address({"zip": "1", "street": "x"}) == freeze_address({"street": "x", "zip": "1"})
+
+
+def test_soundex_and_dob_memoised_and_cleared():
+    from app.rra.fuzzy import normalize_dob, soundex
+
+    for _ in range(3):
+        assert soundex("Robert") == "R163"
+        assert normalize_dob("01/15/1990", "US") == "1990-01-15"
+    assert soundex.cache_info().hits == 2
+    assert normalize_dob.cache_info().hits == 2
+
+    clear_caches()
+    assert soundex.cache_info().currsize == 0
+    assert normalize_dob.cache_info().currsize == 0
@@ -5,7 +5,11 @@ import pytest
 
 from app.normalization.phone_normalizer import normalize_phone
 from app.normalization.email_normalizer import normalize_email
-from app.normalization.name_normalizer import normalize_name, is_western_reversed
+from app.normalization.name_normalizer import (
+    is_western_reversed,
+    normalize_name,
+    normalize_name_cached,
+)
 from app.normalization.address_normalizer import normalize_address, detect_country
 
 
@@ -203,6 +207,19 @@ class TestNameNormalizerTitleCase:
         assert result == "Mary O'Brien"
 
 
+class TestNameNormalizerCached:
+    def test_matches_uncached(self) -> None:
+        for raw in ("smith, john", "Dr. Jane  Doe", "mary o'brien", "  ", "王 小明"):
+            assert normalize_name_cached(raw) == normalize_name(raw)
+
+    def test_repeated_name_hits_cache(self) -> None:
+        normalize_name_cached.cache_clear()
+        for _ in range(5):
+            normalize_name_cached("jane doe")
+        info = normalize_name_cached.cache_info()
+        assert (info.hits, info.misses) == (4, 1)
+
+
 # ---------------------------------------------------------------------------
 # Address normalizer
 # ---------------------------------------------------------------------------
@@ -375,6 +392,15 @@ class TestNameNonLatin:
     def test_non_latin_whitespace_collapsed(self) -> None:
         assert normalize_name("张   伟") == "张 伟"
 
+    def test_non_latin_range_boundaries(self) -> None:
+        from app.normalization.name_normalizer import _NON_LATIN_RANGES, _has_non_latin_chars
+
+        for start, end in _NON_LATIN_RANGES:
+            assert _has_non_latin_chars(f"ab{chr(start)}")
+            assert _has_non_latin_chars(f"{chr(end)}cd")
+            assert not _has_non_latin_chars(f"x{chr(start - 1)}{chr(end + 1)}y")
+        assert not _has_non_latin_chars("José Müller-Lüdenscheidt")
+
     def test_mumbai_india_not_reversed(self) -> None:
         # Location string must not be treated as reversed personal name
         assert normalize_name("Mumbai, India") == "Mumbai, India"
@@ -20,6 +20,7 @@ Covers:
   - use_angle_cls=False, show_log=False passed to PaddleOCR constructor
   - lang parameter forwarded correctly
   - det_model_dir / rec_model_dir forwarded when provided
+  - rec_batch_num defaults to 16 and is forwarded
   - Whitespace-only detections are dropped
   - cls=False passed to every ocr() call
 """
@@ -33,11 +34,15 @@ import pytest
 # ---------------------------------------------------------------------------
 # Stub heavy dependencies in sys.modules BEFORE importing the module so that
 # top-level `import numpy as np` and `from paddleocr import PaddleOCR`
-# succeed without those packages installed.
+# succeed without those packages installed.  Real numpy is preferred when
+# available: pdf_reader.py does real array math with it.
 # ---------------------------------------------------------------------------
 _NUMPY_STUB = MagicMock(name="numpy_stub")
 _PADDLEOCR_STUB = MagicMock(name="paddleocr_stub")
-sys.modules.setdefault("numpy", _NUMPY_STUB)
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    sys.modules.setdefault("numpy", _NUMPY_STUB)
 sys.modules.setdefault("paddleocr", _PADDLEOCR_STUB)
 
 from app.readers.ocr import OCREngine  # noqa: E402
@@ -316,6 +321,20 @@ def test_custom_lang_forwarded():
     assert kwargs["lang"] == "ch"
 
 
+def test_default_rec_batch_num_batches_recognition():
+    with patch("app.readers.ocr.PaddleOCR") as MockPaddleOCR:
+        OCREngine()
+    kwargs = MockPaddleOCR.call_args.kwargs
+    assert kwargs["rec_batch_num"] == 16
+
+
+def test_custom_rec_batch_num_forwarded():
+    with patch("app.readers.ocr.PaddleOCR") as MockPaddleOCR:
+        OCREngine(rec_batch_num=32)
+    kwargs = MockPaddleOCR.call_args.kwargs
+    assert kwargs["rec_batch_num"] == 32
+
+
 def test_det_model_dir_forwarded_when_given():
     with patch("app.readers.ocr.PaddleOCR") as MockPaddleOCR:
         OCREngine(det_model_dir="/models/det")
@@ -381,3 +400,13 @@ def test_page_num_forwarded_to_each_block():
 
     assert all(b.page_or_sheet == 3 for b in blocks_p3)
     assert all(b.page_or_sheet == 9 for b in blocks_p9)
+
+
+def test_ndarray_image_passed_to_paddle_without_conversion():
+    np = pytest.importorskip("numpy")
+    if isinstance(np, MagicMock):
+        pytest.skip("numpy not installed")
+    engine, mock_paddle = _engine_with_result(_PADDLE_RESULT_ONE_LINE)
+    arr = np.zeros((10, 20, 1), dtype=np.uint8)
+    engine.ocr_page_image(arr, 0, "test.pdf")
+    assert mock_paddle.ocr.call_args.args[0] is arr
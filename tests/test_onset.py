@@ -189,6 +189,15 @@ def test_forget_page_called_on_matching_page():
     doc._forget_page.assert_called_once_with(0)
 
 
+def test_labels_recorded_for_every_scanned_page():
+    """Pages read by the onset scan are classified from the same text."""
+    doc = _doc(["cover", "Name: " + "word " * 60, "never read"])
+    labels = {}
+    assert find_data_onset(doc, labels) == 0
+    assert labels == {0: "scanned", 1: "digital"}
+    assert doc.load_page.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # ONSET_SIGNALS constant
 # ---------------------------------------------------------------------------
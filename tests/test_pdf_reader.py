@@ -8,8 +8,8 @@ test is imported so that `import fitz` / `import pdfplumber` at the top of
 pdf_reader.py succeeds without those packages being installed.
 
 Covers:
-  - Digital page → prose ExtractedBlock objects via get_text("dict")
-  - Scanned/corrupted page → OCREngine called, not get_text("dict")
+  - Digital page → prose ExtractedBlock objects via get_text("blocks")
+  - Scanned/corrupted page → OCREngine called, not get_text("blocks")
   - Table page → table_header + table_cell blocks with correct fields
   - table_id is shared across all blocks from the same table
   - doc._forget_page called once per processed page
@@ -21,9 +21,12 @@ Covers:
 """
 from __future__ import annotations
 
+import os
 import sys
+from contextlib import contextmanager
 from unittest.mock import MagicMock, Mock, call, patch
 
+import numpy as np
 import pytest
 
 # ---------------------------------------------------------------------------
@@ -35,25 +38,36 @@ _FITZ_STUB = MagicMock(name="fitz_stub")
 _PLUMBER_STUB = MagicMock(name="pdfplumber_stub")
 sys.modules.setdefault("fitz", _FITZ_STUB)
 sys.modules.setdefault("pdfplumber", _PLUMBER_STUB)
-# ocr.py (imported by pdf_reader) needs paddleocr + numpy
+# ocr.py (imported by pdf_reader) needs paddleocr.  numpy is a real
+# dependency of pdf_reader's bbox overlap test and is not stubbed.
 sys.modules.setdefault("paddleocr", MagicMock(name="paddleocr_stub"))
-sys.modules.setdefault("numpy", MagicMock(name="numpy_stub"))
 
+import app.readers.pdf_reader as pdf_reader_module  # noqa: E402
 from app.readers.pdf_reader import PDFReader, _bbox_overlaps  # noqa: E402
 
+_REAL_MAPPED_PDF = pdf_reader_module._mapped_pdf
+
+
+@pytest.fixture(autouse=True)
+def _stub_mapping_for_missing_files(monkeypatch):
+    """Most tests name a non-existent "test.pdf"; hand them a dummy mapping."""
+    @contextmanager
+    def mapped(path):
+        if os.path.exists(path):
+            with _REAL_MAPPED_PDF(path) as mapping:
+                yield mapping
+        else:
+            yield MagicMock(name="mmap"), MagicMock(name="view")
+
+    monkeypatch.setattr(pdf_reader_module, "_mapped_pdf", mapped)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-_PROSE_DICT_BLOCK = {
-    "type": 0,
-    "bbox": (10.0, 20.0, 200.0, 40.0),
-    "lines": [
-        {"spans": [{"text": "Hello world"}]},
-        {"spans": [{"text": "Second line"}]},
-    ],
-}
+# get_text("blocks") tuple: (x0, y0, x1, y1, text, block_no, block_type)
+_PROSE_BLOCK = (10.0, 20.0, 200.0, 40.0, "Hello world\nSecond line\n", 0, 0)
 
 _TABLE_BBOX = (5.0, 5.0, 205.0, 105.0)
 _TABLE_ROWS = [
@@ -62,14 +76,25 @@ _TABLE_ROWS = [
 ]
 
 
-def _make_fitz_mock(num_pages: int = 1, page_dict: dict | None = None):
+def _make_pixmap_mock(width: int = 4, height: int = 3, n: int = 3) -> MagicMock:
+    """Return a Pixmap mock with a real sample buffer."""
+    pix = MagicMock(name="pixmap")
+    pix.width, pix.height, pix.n = width, height, n
+    pix.samples_mv = memoryview(bytearray(width * height * n))
+    return pix
+
+
+def _make_fitz_mock(num_pages: int = 1, page_blocks: list | None = None):
     """Return (mock_fitz, mock_doc, mock_page)."""
     mock_fitz = MagicMock(name="fitz")
     mock_doc = MagicMock()
     mock_doc.__len__ = Mock(return_value=num_pages)
     mock_page = MagicMock()
-    if page_dict is not None:
-        mock_page.get_text.return_value = page_dict
+    mock_page.get_pixmap.return_value = _make_pixmap_mock()
+    # One ruled rectangle: enough vector edges for the table pre-check
+    mock_page.get_cdrawings.return_value = [{"items": [("re", (0, 0, 10, 10), 1)]}]
+    if page_blocks is not None:
+        mock_page.get_text.return_value = page_blocks
     mock_doc.load_page.return_value = mock_page
     mock_fitz.open.return_value = mock_doc
     return mock_fitz, mock_doc, mock_page
@@ -79,14 +104,15 @@ def _make_plumber_mock(tables=None, table_data=None):
     """Return (mock_plumber, mock_plumber_page).
 
     tables     : list of mock Table objects with .bbox attribute
-    table_data : list of row-lists returned by extract_tables()
+    table_data : list of row-lists returned by each table's extract()
     """
     tables = tables or []
     table_data = table_data or []
     mock_plumber = MagicMock(name="pdfplumber")
     mock_plumber_page = MagicMock()
     mock_plumber_page.find_tables.return_value = tables
-    mock_plumber_page.extract_tables.return_value = table_data
+    for table, rows in zip(tables, table_data):
+        table.extract.return_value = rows
     mock_plumber_doc = MagicMock()
     mock_plumber_doc.pages = [mock_plumber_page]  # index by page_num
     mock_plumber.open.return_value.__enter__.return_value = mock_plumber_doc
@@ -99,16 +125,16 @@ def _run_reader(
     num_pages: int = 1,
     onset: int = 0,
     classify_returns: str = "digital",
-    page_dict: dict | None = None,
+    page_blocks: list | None = None,
     tables=None,
     table_data=None,
     ocr_blocks=None,
 ) -> tuple[PDFReader, list, dict]:
     """Run PDFReader.read() with fully mocked deps; return (reader, blocks, mocks)."""
-    if page_dict is None:
-        page_dict = {"blocks": [_PROSE_DICT_BLOCK]}
+    if page_blocks is None:
+        page_blocks = [_PROSE_BLOCK]
 
-    mock_fitz, mock_doc, mock_page = _make_fitz_mock(num_pages, page_dict)
+    mock_fitz, mock_doc, mock_page = _make_fitz_mock(num_pages, page_blocks)
     mock_plumber, mock_plumber_page = _make_plumber_mock(tables, table_data)
 
     # For multi-page docs each page needs the same plumber page mock
@@ -206,38 +232,28 @@ def test_digital_page_does_not_call_ocr():
     mocks["ocr"].ocr_page_image.assert_not_called()
 
 
-def test_digital_page_calls_get_text_dict():
+def test_digital_page_calls_get_text_blocks():
     _, _, mocks = _run_reader(classify_returns="digital")
-    mocks["page"].get_text.assert_called_with("dict")
+    mocks["page"].get_text.assert_called_with("blocks")
 
 
 def test_image_blocks_are_skipped():
-    page_dict = {
-        "blocks": [
-            {"type": 1, "bbox": (0, 0, 100, 100), "lines": []},   # image
-            _PROSE_DICT_BLOCK,
-        ]
-    }
-    _, blocks, _ = _run_reader(classify_returns="digital", page_dict=page_dict)
+    page_blocks = [
+        (0, 0, 100, 100, "<image: DeviceRGB, width: 10, height: 10, bpc: 8>", 0, 1),
+        _PROSE_BLOCK,
+    ]
+    _, blocks, _ = _run_reader(classify_returns="digital", page_blocks=page_blocks)
     assert len([b for b in blocks if b.block_type == "prose"]) == 1
 
 
 def test_empty_span_text_blocks_skipped():
-    page_dict = {
-        "blocks": [
-            {
-                "type": 0,
-                "bbox": (0, 0, 100, 20),
-                "lines": [{"spans": [{"text": ""}]}],
-            }
-        ]
-    }
-    _, blocks, _ = _run_reader(classify_returns="digital", page_dict=page_dict)
+    page_blocks = [(0, 0, 100, 20, "\n", 0, 0)]
+    _, blocks, _ = _run_reader(classify_returns="digital", page_blocks=page_blocks)
     assert blocks == []
 
 
 # ---------------------------------------------------------------------------
-# 2. Scanned/corrupted page → OCREngine called, not get_text("dict")
+# 2. Scanned/corrupted page → OCREngine called, not get_text("blocks")
 # ---------------------------------------------------------------------------
 
 def test_scanned_page_calls_ocr():
@@ -250,11 +266,11 @@ def test_corrupted_page_calls_ocr():
     mocks["ocr"].ocr_page_image.assert_called_once()
 
 
-def test_scanned_page_does_not_call_get_text_dict():
+def test_scanned_page_does_not_call_get_text_blocks():
     _, _, mocks = _run_reader(classify_returns="scanned")
-    # get_text("dict") must not be called for scanned pages
+    # get_text("blocks") must not be called for scanned pages
     for call_args in mocks["page"].get_text.call_args_list:
-        assert call_args != call("dict"), "get_text('dict') called on scanned page"
+        assert call_args != call("blocks"), "get_text('blocks') called on scanned page"
 
 
 def test_scanned_page_calls_get_pixmap():
@@ -267,6 +283,7 @@ def test_scanned_page_get_pixmap_receives_matrix():
     mock_doc = MagicMock()
     mock_doc.__len__ = Mock(return_value=1)
     mock_page = MagicMock()
+    mock_page.get_pixmap.return_value = _make_pixmap_mock()
     mock_doc.load_page.return_value = mock_page
     mock_fitz.open.return_value = mock_doc
     mock_plumber, _ = _make_plumber_mock()
@@ -281,9 +298,25 @@ def test_scanned_page_get_pixmap_receives_matrix():
     ):
         PDFReader("test.pdf").read()
 
-    mock_fitz.Matrix.assert_called_with(2, 2)
+    mock_fitz.Matrix.assert_called_with(1.5, 1.5)
     matrix_instance = mock_fitz.Matrix.return_value
-    mock_page.get_pixmap.assert_called_once_with(matrix=matrix_instance)
+    mock_page.get_pixmap.assert_called_once_with(
+        matrix=matrix_instance, colorspace=mock_fitz.csGRAY, alpha=False
+    )
+
+
+def test_corrupted_page_renders_2x_rgb():
+    _, _, mocks = _run_reader(classify_returns="corrupted")
+    mocks["fitz"].Matrix.assert_called_with(2, 2)
+    mocks["page"].get_pixmap.assert_called_once_with(
+        matrix=mocks["fitz"].Matrix.return_value
+    )
+
+
+def test_grayscale_pixmap_array_is_two_dimensional():
+    from app.readers.pdf_reader import _pixmap_array
+    arr = _pixmap_array(_make_pixmap_mock(width=5, height=2, n=1))
+    assert arr.shape == (2, 5)
 
 
 def test_scanned_page_ocr_result_returned():
@@ -311,7 +344,7 @@ def _make_table_mock(bbox=_TABLE_BBOX):
 def test_table_page_produces_table_header_blocks():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},  # no prose
+        page_blocks=[],  # no prose
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -322,7 +355,7 @@ def test_table_page_produces_table_header_blocks():
 def test_table_page_produces_table_cell_blocks():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -333,7 +366,7 @@ def test_table_page_produces_table_cell_blocks():
 def test_table_header_block_fields():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -348,7 +381,7 @@ def test_table_header_block_fields():
 def test_table_cell_has_correct_col_header():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -361,7 +394,7 @@ def test_table_cell_has_correct_col_header():
 def test_table_cell_value_col_header():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -374,7 +407,7 @@ def test_none_cell_text_becomes_empty_string():
     rows = [["A", "B"], [None, "data"]]
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[rows],
     )
@@ -389,7 +422,7 @@ def test_none_cell_text_becomes_empty_string():
 def test_table_id_shared_within_one_table():
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -402,7 +435,7 @@ def test_table_id_is_uuid_string():
     import re
     mock_table = _make_table_mock()
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -419,7 +452,7 @@ def test_two_tables_have_different_table_ids():
     rows_a = [["Col1"], ["v1"]]
     rows_b = [["Col2"], ["v2"]]
     _, blocks, _ = _run_reader(
-        page_dict={"blocks": []},
+        page_blocks=[],
         tables=[mock_table_a, mock_table_b],
         table_data=[rows_a, rows_b],
     )
@@ -465,8 +498,7 @@ def test_onset_2_skips_pages_0_and_1():
     mock_fitz, mock_doc, mock_page = _make_fitz_mock(num_pages=4)
     mock_plumber, _ = _make_plumber_mock()
     mock_plumber.open.return_value.__enter__.return_value.pages = [
-        MagicMock(find_tables=Mock(return_value=[]),
-                  extract_tables=Mock(return_value=[])),
+        MagicMock(find_tables=Mock(return_value=[])),
     ] * 4
 
     with (
@@ -477,7 +509,7 @@ def test_onset_2_skips_pages_0_and_1():
         patch("app.readers.ocr.OCREngine", return_value=MagicMock()),
         patch("app.readers.pdf_reader.PageStitcher", return_value=MagicMock()),
     ):
-        mock_page.get_text.return_value = {"blocks": []}
+        mock_page.get_text.return_value = []
         PDFReader("test.pdf").read()
 
     loaded = [c.args[0] for c in mock_doc.load_page.call_args_list]
@@ -560,15 +592,12 @@ def test_checkpoint_returns_copy():
 
 def test_prose_block_inside_table_bbox_excluded():
     """A prose block whose bbox is fully inside a table region must be dropped."""
-    prose_inside_table = {
-        "type": 0,
-        "bbox": (10.0, 10.0, 100.0, 50.0),   # inside _TABLE_BBOX
-        "lines": [{"spans": [{"text": "inside table"}]}],
-    }
+    # bbox inside _TABLE_BBOX
+    prose_inside_table = (10.0, 10.0, 100.0, 50.0, "inside table\n", 0, 0)
     mock_table = _make_table_mock(bbox=_TABLE_BBOX)
     _, blocks, _ = _run_reader(
         classify_returns="digital",
-        page_dict={"blocks": [prose_inside_table]},
+        page_blocks=[prose_inside_table],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -577,15 +606,12 @@ def test_prose_block_inside_table_bbox_excluded():
 
 def test_prose_block_outside_table_bbox_included():
     """A prose block clearly outside all table regions must be kept."""
-    prose_outside = {
-        "type": 0,
-        "bbox": (300.0, 300.0, 500.0, 320.0),  # far from _TABLE_BBOX
-        "lines": [{"spans": [{"text": "outside table"}]}],
-    }
+    # bbox far from _TABLE_BBOX
+    prose_outside = (300.0, 300.0, 500.0, 320.0, "outside table\n", 1, 0)
     mock_table = _make_table_mock(bbox=_TABLE_BBOX)
     _, blocks, _ = _run_reader(
         classify_returns="digital",
-        page_dict={"blocks": [prose_outside]},
+        page_blocks=[prose_outside],
         tables=[mock_table],
         table_data=[_TABLE_ROWS],
     )
@@ -599,7 +625,7 @@ def test_prose_block_outside_table_bbox_included():
 def _run_reader_with_db(db_session, db_document_id, *, num_pages=1):
     """Like _run_reader but passes a DB session to PDFReader.__init__."""
     mock_fitz, mock_doc, mock_page = _make_fitz_mock(
-        num_pages, {"blocks": [_PROSE_DICT_BLOCK]}
+        num_pages, [_PROSE_BLOCK]
     )
     mock_plumber, _ = _make_plumber_mock()
     mock_plumber.open.return_value.__enter__.return_value.pages = [MagicMock()] * num_pages
@@ -663,8 +689,8 @@ def test_db_checkpoint_handles_db_error_gracefully():
     assert isinstance(blocks, list)
 
 
-def test_db_checkpoint_updated_per_page():
-    """metadata_json.last_completed_page advances with each page."""
+def test_db_checkpoint_flushed_once_for_short_document():
+    """Fewer than _CHECKPOINT_EVERY_PAGES pages → one final DB write."""
     mock_doc_record = MagicMock()
     mock_doc_record.metadata_json = {}
     mock_session = MagicMock()
@@ -673,5 +699,450 @@ def test_db_checkpoint_updated_per_page():
     with patch.dict(sys.modules, {"app.db.models": MagicMock()}):
         reader, _ = _run_reader_with_db(mock_session, "uuid-2", num_pages=3)
 
-    assert mock_session.flush.call_count == 3
+    assert mock_session.flush.call_count == 1
     assert mock_doc_record.metadata_json["last_completed_page"] == 2
+
+
+def test_db_checkpoint_batched_every_k_pages():
+    """DB writes happen every K pages plus once for the remainder."""
+    written = []
+    mock_session = MagicMock()
+    mock_session.get.return_value.metadata_json = {}
+    mock_session.flush.side_effect = lambda: written.append(
+        mock_session.get.return_value.metadata_json["last_completed_page"]
+    )
+
+    with (
+        patch.dict(sys.modules, {"app.db.models": MagicMock()}),
+        patch("app.readers.pdf_reader._CHECKPOINT_EVERY_PAGES", 2),
+    ):
+        reader, _ = _run_reader_with_db(mock_session, "uuid-3", num_pages=5)
+
+    assert written == [1, 3, 4]
+    assert reader.checkpoint["last_completed_page"] == 4
+
+
+def test_db_checkpoint_flushed_when_stream_abandoned():
+    """Stopping read_iter() early still persists the last completed page."""
+    mock_session = MagicMock()
+    mock_session.get.return_value.metadata_json = {}
+    patches, _ = _streaming_patches(num_pages=3)
+
+    with (
+        patch.dict(sys.modules, {"app.db.models": MagicMock()}),
+        patches[0], patches[1], patches[2], patches[3], patches[4],
+    ):
+        stream = PDFReader(
+            "test.pdf", db_session=mock_session, db_document_id="uuid-4"
+        ).read_iter()
+        next(stream)
+        stream.close()
+
+    mock_session.flush.assert_called_once()
+    assert mock_session.get.return_value.metadata_json["last_completed_page"] == 0
+
+
+# ---------------------------------------------------------------------------
+# 11. Parallel mode (max_workers > 1)
+# ---------------------------------------------------------------------------
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs submissions in-process."""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None):
+        self.max_workers = max_workers
+        # One in-process "worker": run its initializer once, like a real pool.
+        if initializer is not None:
+            initializer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        fut = Future()
+        fut.set_result(fn(*args))
+        return fut
+
+
+def test_shard_pages_contiguous_and_complete():
+    from app.readers.pdf_reader import _shard_pages
+    shards = _shard_pages(2, 9, 3)
+    assert shards == [[2, 3, 4], [5, 6, 7], [8]]
+
+
+def test_shard_pages_short_and_empty_ranges():
+    from app.readers.pdf_reader import _shard_pages
+    assert _shard_pages(0, 2, 8) == [[0, 1]]
+    assert _shard_pages(3, 3, 4) == []
+
+
+def _run_parallel_reader(
+    num_pages: int, max_workers: int, classify_returns: str = "digital"
+):
+    mock_fitz, mock_doc, _ = _make_fitz_mock(num_pages, [_PROSE_BLOCK])
+    mock_plumber, mock_plumber_page = _make_plumber_mock()
+    mock_plumber.open.return_value.__enter__.return_value.pages = (
+        [mock_plumber_page] * num_pages
+    )
+    mock_stitcher = MagicMock()
+
+    with (
+        patch("app.readers.pdf_reader.fitz", mock_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", mock_plumber),
+        patch("app.readers.pdf_reader.find_data_onset", return_value=0),
+        patch("app.readers.pdf_reader.classify_page", return_value=classify_returns),
+        patch("app.readers.pdf_reader.PageStitcher", return_value=mock_stitcher),
+        patch("app.readers.pdf_reader.ProcessPoolExecutor", _InlineExecutor),
+    ):
+        reader = PDFReader("test.pdf", max_workers=max_workers)
+        blocks = reader.read()
+    return reader, blocks, mock_stitcher
+
+
+def test_parallel_read_returns_blocks_in_page_order():
+    _, blocks, _ = _run_parallel_reader(num_pages=5, max_workers=2)
+    assert [b.page_or_sheet for b in blocks] == [0, 1, 2, 3, 4]
+    assert all(b.text == "Hello world\nSecond line" for b in blocks)
+
+
+def test_parallel_read_stitches_sequentially():
+    _, _, stitcher = _run_parallel_reader(num_pages=4, max_workers=3)
+    assert [c.args[0] for c in stitcher.stitch.call_args_list] == [0, 1, 2, 3]
+
+
+def test_parallel_read_checkpoints_final_page():
+    reader, _, _ = _run_parallel_reader(num_pages=4, max_workers=2)
+    assert reader.checkpoint["last_completed_page"] == 3
+
+
+def test_parallel_read_checkpoints_every_page():
+    with patch.object(PDFReader, "_write_checkpoint") as mock_ckpt:
+        _run_parallel_reader(num_pages=20, max_workers=2)
+    assert [c.args[1] for c in mock_ckpt.call_args_list] == list(range(20))
+
+
+def test_parallel_worker_reuses_ocr_engine_across_shards():
+    mock_ocr = MagicMock()
+    mock_ocr.return_value.ocr_page_image.return_value = []
+    with patch("app.readers.ocr.OCREngine", mock_ocr):
+        # 20 pages -> three 8-page shards on the single in-process worker.
+        _run_parallel_reader(num_pages=20, max_workers=2, classify_returns="scanned")
+    mock_ocr.assert_called_once()
+
+
+def test_parallel_read_real_process_pool(tmp_path):
+    """Exercise pickling + forkserver workers against a generated PDF."""
+    real_fitz = pytest.importorskip("pymupdf")
+    # The module-level stubs above may shadow the real pdfplumber; import it
+    # directly so this test runs against the installed packages.
+    stub = sys.modules.pop("pdfplumber", None)
+    try:
+        real_plumber = pytest.importorskip("pdfplumber")
+    finally:
+        if stub is not None:
+            sys.modules["pdfplumber"] = stub
+
+    path = tmp_path / "multi.pdf"
+    doc = real_fitz.open()
+    for i in range(10):
+        page = doc.new_page()
+        for line in range(12):
+            page.insert_text(
+                (72, 72 + 14 * line),
+                f"Page {i} line {line} account holder name record entry",
+            )
+    doc.save(str(path))
+    doc.close()
+
+    with (
+        patch("app.readers.pdf_reader.fitz", real_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", real_plumber),
+    ):
+        sequential = PDFReader(path).read()
+        parallel_reader = PDFReader(path, max_workers=2)
+        parallel = parallel_reader.read()
+
+    assert [(b.page_or_sheet, b.text) for b in parallel] == [
+        (b.page_or_sheet, b.text) for b in sequential
+    ]
+    assert parallel_reader.checkpoint["last_completed_page"] == 9
+
+
+# ---------------------------------------------------------------------------
+# 12. Background OCR stage
+# ---------------------------------------------------------------------------
+
+def test_ocr_stage_runs_engine_off_thread():
+    import threading
+    from app.readers.pdf_reader import _OCRStage
+
+    seen_threads = []
+    engine = MagicMock()
+    engine.ocr_page_image.side_effect = (
+        lambda img, n, src: seen_threads.append(threading.current_thread().name) or [n]
+    )
+    stage = _OCRStage()
+    image = np.zeros((1, 1, 1), dtype=np.uint8)
+    futures = [stage.submit(engine, image, n, "x.pdf") for n in range(3)]
+    stage.close()
+
+    assert [f.result() for f in futures] == [[0], [1], [2]]
+    assert seen_threads == ["pdf-ocr"] * 3
+
+
+def test_ocr_stage_propagates_engine_errors():
+    from app.readers.pdf_reader import _OCRStage
+
+    engine = MagicMock()
+    engine.ocr_page_image.side_effect = RuntimeError("inference failed")
+    stage = _OCRStage()
+    future = stage.submit(engine, np.zeros((0, 0, 1), dtype=np.uint8), 0, "x.pdf")
+    stage.close()
+
+    with pytest.raises(RuntimeError):
+        future.result()
+
+
+def test_ocr_receives_zero_copy_array_over_pixmap():
+    _, _, mocks = _run_reader(classify_returns="scanned")
+    image = mocks["ocr"].ocr_page_image.call_args.args[0]
+    pix = mocks["page"].get_pixmap.return_value
+    assert isinstance(image, np.ndarray)
+    assert image.shape == (pix.height, pix.width, pix.n)
+    assert np.shares_memory(image, np.frombuffer(pix.samples_mv, dtype=np.uint8))
+
+
+def test_pipelined_ocr_preserves_page_order():
+    from app.readers.base import ExtractedBlock
+
+    mock_fitz, mock_doc, _ = _make_fitz_mock(num_pages=6, page_blocks=[])
+    mock_plumber, mock_plumber_page = _make_plumber_mock()
+    mock_plumber.open.return_value.__enter__.return_value.pages = [mock_plumber_page] * 6
+    mock_ocr = MagicMock()
+    mock_ocr.ocr_page_image.side_effect = lambda img, n, src: [
+        ExtractedBlock(text=f"p{n}", page_or_sheet=n, source_path=src, file_type="pdf")
+    ]
+    mock_stitcher = MagicMock()
+
+    with (
+        patch("app.readers.pdf_reader.fitz", mock_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", mock_plumber),
+        patch("app.readers.pdf_reader.find_data_onset", return_value=0),
+        patch("app.readers.pdf_reader.classify_page", return_value="scanned"),
+        patch("app.readers.ocr.OCREngine", return_value=mock_ocr),
+        patch("app.readers.pdf_reader.PageStitcher", return_value=mock_stitcher),
+    ):
+        reader = PDFReader("test.pdf")
+        blocks = reader.read()
+
+    assert [b.text for b in blocks] == [f"p{n}" for n in range(6)]
+    assert [c.args for c in mock_stitcher.stitch.call_args_list] == [
+        (n, f"p{n}") for n in range(6)
+    ]
+    assert reader.checkpoint["last_completed_page"] == 5
+
+
+def test_ocr_import_error_during_inference_falls_back_to_text():
+    """ImportError raised lazily inside ocr() falls back to PyMuPDF prose."""
+    mock_fitz, mock_doc, mock_page = _make_fitz_mock(
+        num_pages=2, page_blocks=[_PROSE_BLOCK]
+    )
+    mock_plumber, mock_plumber_page = _make_plumber_mock()
+    mock_plumber.open.return_value.__enter__.return_value.pages = [mock_plumber_page] * 2
+    mock_ocr = MagicMock()
+    mock_ocr.ocr_page_image.side_effect = ImportError("paddle backend missing")
+
+    with (
+        patch("app.readers.pdf_reader.fitz", mock_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", mock_plumber),
+        patch("app.readers.pdf_reader.find_data_onset", return_value=0),
+        patch("app.readers.pdf_reader.classify_page", return_value="scanned"),
+        patch("app.readers.ocr.OCREngine", return_value=mock_ocr),
+        patch("app.readers.pdf_reader.PageStitcher", return_value=MagicMock()),
+    ):
+        reader = PDFReader("test.pdf")
+        blocks = reader.read()
+
+    assert [b.text for b in blocks] == ["Hello world\nSecond line"] * 2
+    assert reader.checkpoint["last_completed_page"] == 1
+
+
+# ---------------------------------------------------------------------------
+# 13. Single pdfplumber detection pass
+# ---------------------------------------------------------------------------
+
+def test_tables_detected_once_and_extracted_per_table():
+    mock_table = _make_table_mock()
+    _, _, mocks = _run_reader(
+        page_blocks=[],
+        tables=[mock_table],
+        table_data=[_TABLE_ROWS],
+    )
+    mocks["plumber_page"].find_tables.assert_called_once()
+    mocks["plumber_page"].extract_tables.assert_not_called()
+    mock_table.extract.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# 14. Table pre-check skips pdfplumber on pages without ruling lines
+# ---------------------------------------------------------------------------
+
+def test_has_ruling_lines_counts_edges():
+    from app.readers.pdf_reader import _has_ruling_lines
+    page = MagicMock()
+    page.get_cdrawings.return_value = [
+        {"items": [("l", (0, 0), (1, 0))]},
+        {"items": [("l", (0, 0), (0, 1)), ("c", 1, 2, 3, 4)]},
+    ]
+    assert _has_ruling_lines(page) is False
+    page.get_cdrawings.return_value = [{"items": [("l", 1, 2)] * 4}]
+    assert _has_ruling_lines(page) is True
+    page.get_cdrawings.return_value = [{"items": [("re", (0, 0, 5, 5), 1)]}]
+    assert _has_ruling_lines(page) is True
+
+
+def test_page_without_drawings_skips_pdfplumber():
+    mock_fitz, _, mock_page = _make_fitz_mock(1, [_PROSE_BLOCK])
+    mock_page.get_cdrawings.return_value = []
+    mock_plumber = MagicMock(name="pdfplumber")
+    plumber_doc = MagicMock()
+    mock_plumber.open.return_value.__enter__.return_value = plumber_doc
+
+    with (
+        patch("app.readers.pdf_reader.fitz", mock_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", mock_plumber),
+        patch("app.readers.pdf_reader.find_data_onset", return_value=0),
+        patch("app.readers.pdf_reader.classify_page", return_value="digital"),
+        patch("app.readers.pdf_reader.PageStitcher", return_value=MagicMock()),
+    ):
+        blocks = PDFReader("test.pdf").read()
+
+    plumber_doc.pages.__getitem__.assert_not_called()
+    assert [b.block_type for b in blocks] == ["prose"]
+
+
+def test_source_path_stringified_once_at_construction():
+    from pathlib import Path
+    reader = PDFReader(Path("/data/report.pdf"))
+    assert reader._source == "/data/report.pdf"
+
+
+def test_overlap_mask_matches_scalar_helper():
+    from app.readers.pdf_reader import _overlap_mask
+    tables = [(10, 10, 100, 100), (200, 200, 300, 300)]
+    blocks = [
+        (20, 20, 50, 50),      # inside first table
+        (0, 0, 10, 100),       # touches first table's edge only
+        (250, 150, 260, 210),  # dips into second table
+        (400, 400, 500, 500),  # clear of both
+    ]
+    mask = _overlap_mask(blocks, tables)
+    expected = [any(_bbox_overlaps(b, t) for t in tables) for b in blocks]
+    assert mask.tolist() == expected == [True, False, True, False]
+
+
+# ---------------------------------------------------------------------------
+# read_iter streaming
+# ---------------------------------------------------------------------------
+
+def _streaming_patches(num_pages: int):
+    mock_fitz, mock_doc, _ = _make_fitz_mock(num_pages, [_PROSE_BLOCK])
+    mock_plumber, plumber_page = _make_plumber_mock()
+    mock_plumber.open.return_value.__enter__.return_value.pages = (
+        [plumber_page] * num_pages
+    )
+    patches = (
+        patch("app.readers.pdf_reader.fitz", mock_fitz),
+        patch("app.readers.pdf_reader.pdfplumber", mock_plumber),
+        patch("app.readers.pdf_reader.find_data_onset", return_value=0),
+        patch("app.readers.pdf_reader.classify_page", return_value="digital"),
+        patch("app.readers.pdf_reader.PageStitcher", return_value=MagicMock()),
+    )
+    return patches, mock_doc
+
+
+def test_read_iter_yields_each_page_before_reading_the_next():
+    patches, mock_doc = _streaming_patches(num_pages=3)
+    with patches[0], patches[1], patches[2], patches[3], patches[4]:
+        reader = PDFReader("test.pdf")
+        stream = reader.read_iter()
+        first = next(stream)
+        assert first.page_or_sheet == 0
+        assert reader.checkpoint["last_completed_page"] == 0
+        assert mock_doc.load_page.call_count == 1
+        rest = list(stream)
+    assert [b.page_or_sheet for b in rest] == [1, 2]
+
+
+def test_read_iter_closes_document_when_abandoned():
+    patches, mock_doc = _streaming_patches(num_pages=3)
+    with patches[0], patches[1], patches[2], patches[3], patches[4]:
+        stream = PDFReader("test.pdf").read_iter()
+        next(stream)
+        stream.close()
+    mock_doc.close.assert_called_once()
+    assert mock_doc.load_page.call_count == 1
+
+
+def test_read_matches_read_iter():
+    _, blocks, _ = _run_reader(num_pages=2)
+    patches, _ = _streaming_patches(num_pages=2)
+    with patches[0], patches[1], patches[2], patches[3], patches[4]:
+        streamed = list(PDFReader("test.pdf").read_iter())
+    assert [(b.text, b.page_or_sheet) for b in streamed] == [
+        (b.text, b.page_or_sheet) for b in blocks
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped open
+# ---------------------------------------------------------------------------
+
+def test_parsers_open_the_mapping_not_the_path():
+    mapping, view = MagicMock(name="mmap"), MagicMock(name="view")
+
+    @contextmanager
+    def mapped(path):
+        yield mapping, view
+
+    with patch("app.readers.pdf_reader._mapped_pdf", mapped):
+        _, _, mocks = _run_reader(num_pages=1)
+
+    mocks["fitz"].open.assert_called_once_with(stream=view, filetype="pdf")
+    mocks["plumber"].open.assert_called_once_with(mapping)
+
+
+def test_mapped_pdf_releases_view_and_mapping(tmp_path):
+    path = tmp_path / "x.pdf"
+    path.write_bytes(b"%PDF-1.4 payload")
+    with _REAL_MAPPED_PDF(str(path)) as (mm, view):
+        assert bytes(view[:8]) == b"%PDF-1.4"
+        assert mm.read(4) == b"%PDF"
+    assert mm.closed
+    with pytest.raises(ValueError):
+        view.tobytes()
+
+
+# ---------------------------------------------------------------------------
+# Onset-scan labels
+# ---------------------------------------------------------------------------
+
+def test_pages_labelled_by_onset_scan_are_not_reclassified():
+    def onset(doc, labels):
+        labels.update({0: "digital", 1: "digital"})
+        return 0
+
+    patches, _ = _streaming_patches(num_pages=3)
+    with (
+        patches[0], patches[1], patches[3], patches[4],
+        patch("app.readers.pdf_reader.find_data_onset", side_effect=onset),
+        patch("app.readers.pdf_reader.classify_page", return_value="digital") as classify,
+    ):
+        blocks = PDFReader("test.pdf").read()
+
+    assert classify.call_count == 1  # only page 2, past the onset scan
+    assert [b.page_or_sheet for b in blocks] == [0, 1, 2]
@@ -4,7 +4,7 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.db.base import Base
@@ -116,6 +116,32 @@ class TestCreateTask:
         with pytest.raises(ValueError, match="already has a PENDING task"):
             qm.create_task("low_confidence", str(subj.subject_id))
 
+    def test_completed_task_does_not_block_new_pending(self, db_session):
+        subj = _make_subject(db_session)
+        qm = QueueManager(db_session)
+        first = qm.create_task("low_confidence", str(subj.subject_id))
+        first.status = "COMPLETED"
+        db_session.flush()
+
+        second = qm.create_task("low_confidence", str(subj.subject_id))
+
+        assert second.review_task_id != first.review_task_id
+        assert second.status == "PENDING"
+
+    def test_duplicate_pending_rejected_by_unique_index(self, db_session):
+        from sqlalchemy.exc import IntegrityError
+
+        subj = _make_subject(db_session)
+        QueueManager(db_session).create_task("low_confidence", str(subj.subject_id))
+        db_session.add(ReviewTask(
+            queue_type="low_confidence",
+            subject_id=subj.subject_id,
+            status="PENDING",
+            required_role="REVIEWER",
+        ))
+        with pytest.raises(IntegrityError):
+            db_session.flush()
+
     def test_same_subject_different_queue_ok(self, db_session):
         subj = _make_subject(db_session)
         qm = QueueManager(db_session)
@@ -133,6 +159,70 @@ class TestCreateTask:
             qm.create_task("bogus", str(subj.subject_id))
 
 
+class TestCreateTasks:
+    def test_bulk_creates_pending_tasks_in_order(self, db_session):
+        subjects = [_make_subject(db_session) for _ in range(3)]
+        qm = QueueManager(db_session)
+
+        tasks = qm.create_tasks(
+            [("low_confidence", str(s.subject_id)) for s in subjects]
+            + [("escalation", subjects[0].subject_id)]
+        )
+
+        assert [(t.queue_type, t.subject_id) for t in tasks] == [
+            ("low_confidence", s.subject_id) for s in subjects
+        ] + [("escalation", subjects[0].subject_id)]
+        assert all(t.status == "PENDING" for t in tasks)
+        assert tasks[-1].required_role == "LEGAL_REVIEWER"
+        assert all(t.review_task_id is not None for t in tasks)
+
+    def test_skips_existing_and_repeated_pairs(self, db_session):
+        a, b = _make_subject(db_session), _make_subject(db_session)
+        qm = QueueManager(db_session)
+        qm.create_task("qc_sampling", str(a.subject_id))
+
+        tasks = qm.create_tasks([
+            ("qc_sampling", str(a.subject_id)),
+            ("qc_sampling", str(b.subject_id)),
+            ("qc_sampling", str(b.subject_id)),
+        ])
+
+        assert [t.subject_id for t in tasks] == [b.subject_id]
+        assert len(qm.get_queue("qc_sampling")) == 2
+
+    def test_single_conflict_tolerant_insert(self, db_session):
+        a, b = _make_subject(db_session), _make_subject(db_session)
+        qm = QueueManager(db_session)
+        qm.create_task("rra_review", str(a.subject_id))
+        db_session.flush()
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            tasks = qm.create_tasks([
+                ("rra_review", a.subject_id),
+                ("rra_review", b.subject_id),
+            ])
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert [t.subject_id for t in tasks] == [b.subject_id]
+        assert len(statements) == 1
+        assert "ON CONFLICT" in statements[0].upper()
+
+    def test_invalid_queue_type_raises(self, db_session):
+        qm = QueueManager(db_session)
+        with pytest.raises(ValueError, match="Unknown queue_type"):
+            qm.create_tasks([("bogus", str(uuid4()))])
+
+    def test_empty_input(self, db_session):
+        assert QueueManager(db_session).create_tasks([]) == []
+
+
 # ===========================================================================
 # QueueManager.assign_task
 # ===========================================================================
@@ -180,6 +270,37 @@ class TestAssignTask:
             qm.assign_task(str(task.review_task_id), "rev-2", "REVIEWER")
 
 
+class TestClaimNext:
+    def test_claims_oldest_pending(self, db_session):
+        s1, s2 = _make_subject(db_session), _make_subject(db_session)
+        qm = QueueManager(db_session)
+        first = qm.create_task("low_confidence", str(s1.subject_id))
+        qm.create_task("low_confidence", str(s2.subject_id))
+
+        task = qm.claim_next("low_confidence", "rev-1", "REVIEWER")
+
+        assert task.review_task_id == first.review_task_id
+        assert task.status == "IN_PROGRESS"
+        assert task.assigned_to == "rev-1"
+
+    def test_successive_claims_take_different_tasks(self, db_session):
+        s1, s2 = _make_subject(db_session), _make_subject(db_session)
+        qm = QueueManager(db_session)
+        qm.create_task("low_confidence", str(s1.subject_id))
+        qm.create_task("low_confidence", str(s2.subject_id))
+
+        a = qm.claim_next("low_confidence", "rev-1", "REVIEWER")
+        b = qm.claim_next("low_confidence", "rev-2", "REVIEWER")
+
+        assert a.review_task_id != b.review_task_id
+        assert qm.claim_next("low_confidence", "rev-3", "REVIEWER") is None
+
+    def test_wrong_role_raises_permission(self, db_session):
+        qm = QueueManager(db_session)
+        with pytest.raises(PermissionError, match="cannot action queue"):
+            qm.claim_next("escalation", "rev-1", "REVIEWER")
+
+
 # ===========================================================================
 # QueueManager.complete_task
 # ===========================================================================
@@ -327,3 +448,38 @@ class TestGetQueue:
     def test_empty_queue(self, db_session):
         qm = QueueManager(db_session)
         assert qm.get_queue("escalation") == []
+
+    def test_limit_and_offset_page_oldest_first(self, db_session):
+        subjects = [_make_subject(db_session) for _ in range(4)]
+        qm = QueueManager(db_session)
+        for s in subjects:
+            qm.create_task("low_confidence", str(s.subject_id))
+
+        page = qm.get_queue("low_confidence", limit=2, offset=1)
+
+        assert [t.subject_id for t in page] == [
+            subjects[1].subject_id, subjects[2].subject_id,
+        ]
+
+    def test_iter_queue_streams_same_order(self, db_session):
+        subjects = [_make_subject(db_session) for _ in range(3)]
+        qm = QueueManager(db_session)
+        for s in subjects:
+            qm.create_task("low_confidence", str(s.subject_id))
+
+        streamed = list(qm.iter_queue("low_confidence", batch_size=2))
+
+        assert [t.review_task_id for t in streamed] == [
+            t.review_task_id for t in qm.get_queue("low_confidence")
+        ]
+
+    def test_count_queue(self, db_session):
+        s1, s2 = _make_subject(db_session), _make_subject(db_session)
+        qm = QueueManager(db_session)
+        t1 = qm.create_task("low_confidence", str(s1.subject_id))
+        qm.create_task("low_confidence", str(s2.subject_id))
+        qm.assign_task(str(t1.review_task_id), "rev-1", "REVIEWER")
+
+        assert qm.count_queue("low_confidence") == 1
+        assert qm.count_queue("low_confidence", status="IN_PROGRESS") == 1
+        assert qm.count_queue("escalation") == 0
@@ -4,6 +4,7 @@ Covers:
 - ExtractedBlock instantiation with required and optional fields
 - bbox=None is valid for non-visual formats
 - block_type defaults and __post_init__ validation
+- ExtractedBlock is slotted (no per-instance __dict__)
 - Registry maps every supported extension to the correct reader class
 - Registry is case-insensitive for extensions
 - Registry falls back to TikaReader for unknown extensions
@@ -15,7 +16,7 @@ from __future__ import annotations
 import pytest
 
 from app.readers.base import BaseReader, BlockType, ExtractedBlock
-from app.readers.registry import get_reader, register, _REGISTRY
+from app.readers.registry import get_reader, register, _REGISTRY, _resolve_reader_cls
 
 
 # ---------------------------------------------------------------------------
@@ -141,6 +142,14 @@ def test_empty_file_type_raises_value_error():
         ExtractedBlock(text="x", page_or_sheet=0, source_path="/f", file_type="")
 
 
+def test_extracted_block_is_slotted():
+    b = ExtractedBlock(text="x", page_or_sheet=0, source_path="/f", file_type="pdf")
+    assert not hasattr(b, "__dict__")
+    b.col_header = "Name"  # declared fields remain mutable
+    with pytest.raises(AttributeError):
+        b.undeclared = 1
+
+
 # ---------------------------------------------------------------------------
 # Registry — correct reader class per extension
 # ---------------------------------------------------------------------------
@@ -250,6 +259,29 @@ def test_register_whitespace_extension_raises():
         register("   ", BR)
 
 
+def test_register_overrides_previously_resolved_extension():
+    from app.readers.base import BaseReader as BR
+
+    class CustomReader(BR):
+        pass
+
+    assert type(get_reader("a.rtf")).__name__ == "TikaReader"  # now cached
+    register("rtf", CustomReader)
+    try:
+        assert type(get_reader("a.rtf")) is CustomReader
+    finally:
+        _REGISTRY.pop("rtf", None)
+        _resolve_reader_cls.cache_clear()
+
+
+def test_extension_resolved_once_per_suffix():
+    _resolve_reader_cls.cache_clear()
+    get_reader("one.CSV")
+    get_reader("/dir.with.dots/two.csv")
+    info = _resolve_reader_cls.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
 # ---------------------------------------------------------------------------
 # Reader stubs — read() raises NotImplementedError
 # ---------------------------------------------------------------------------
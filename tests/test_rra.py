@@ -109,6 +109,16 @@ class TestJaroWinkler:
         s1, s2 = "richard", "richarde"
         assert abs(jaro_winkler(s1, s2) - jaro_winkler(s2, s1)) < 1e-9
 
+    @pytest.mark.parametrize("s1,s2,expected", [
+        ("martha", "marhta", 0.944444),
+        ("dixon", "dicksonx", 0.766667),
+        ("jellyfish", "smellyfish", 0.896296),
+        ("aabab", "babaa", 0.733333),
+    ])
+    def test_textbook_jaro_values(self, s1, s2, expected):
+        from app.rra.fuzzy import jaro
+        assert jaro(s1, s2) == pytest.approx(expected, abs=1e-6)
+
 
 # ===========================================================================
 # names_match
@@ -306,6 +316,16 @@ class TestGovernmentIdsMatch:
         matched, conf = government_ids_match("SSN", "111-11-1111", "SSN", "999-99-9999")
         assert matched is False
 
+    @pytest.mark.parametrize("v1,v2", [
+        ("123-45-6789", "123-45-6789"),
+        ("123-45-6789", "123-45-6788"),
+        ("123456789", "12345678"),
+        ("111-11-1111", "999-99-9999"),
+    ])
+    def test_values_match_agrees_with_full_check(self, v1, v2):
+        from app.rra.fuzzy import government_id_values_match
+        assert government_id_values_match(v1, v2) == government_ids_match("SSN", v1, "ssn", v2)
+
 
 # ===========================================================================
 # _edit_distance_one (internal helper)
@@ -333,6 +353,15 @@ class TestEditDistanceOne:
     def test_empty_vs_empty(self):
         assert _edit_distance_one("", "") is False
 
+    def test_substitutions_match_full_count(self):
+        import random
+        rng = random.Random(7)
+        for _ in range(2000):
+            a = "".join(rng.choice("0123") for _ in range(9))
+            b = "".join(rng.choice((c, rng.choice("0123"))) for c in a)
+            expected = sum(x != y for x, y in zip(a, b)) == 1
+            assert _edit_distance_one(a, b) is expected
+
 
 # ===========================================================================
 # normalize_dob
@@ -400,6 +429,18 @@ class TestNormalizeDob:
     def test_two_digit_year_1900s(self):
         assert normalize_dob("15/01/30", "GB") == "1930-01-15"
 
+    # --- Named months: strptime %b / %B semantics ---
+    @pytest.mark.parametrize("raw,expected", [
+        ("JANUARY 5, 1990", "1990-01-05"),
+        ("5\tsep   1990", "1990-09-05"),
+        ("May 31, 1990", "1990-05-31"),
+        ("31 Feb 1990", None),
+        ("5 Sept 1990", None),
+        ("1990-1-5", "1990-01-05"),
+    ])
+    def test_named_and_unpadded_formats(self, raw, expected):
+        assert normalize_dob(raw) == expected
+
 
 # ===========================================================================
 # dobs_match
@@ -178,3 +178,22 @@ class TestGenerateQcSample:
         tasks = ss.generate_qc_sample(qm)
         subject_ids = [str(t.subject_id) for t in tasks]
         assert len(subject_ids) == len(set(subject_ids))
+
+    def test_only_sampled_rows_loaded(self, db_session):
+        from sqlalchemy import event
+
+        _make_subjects(db_session, 40)
+        db_session.expunge_all()
+        loaded: list[NotificationSubject] = []
+
+        def _on_load(target, ctx):
+            loaded.append(target)
+
+        event.listen(NotificationSubject, "load", _on_load)
+        try:
+            ss = SamplingStrategy(db_session, sample_rate=0.10)
+            tasks = ss.generate_qc_sample(QueueManager(db_session))
+        finally:
+            event.remove(NotificationSubject, "load", _on_load)
+        assert len(tasks) == 4
+        assert len(loaded) == 4
@@ -541,3 +541,53 @@ def test_two_phase_server_defaults():
     # document_analysis_reviews.status defaults to 'pending_review'
     dar_cols = {c["name"]: c for c in inspector.get_columns("document_analysis_reviews")}
     _assert_default_contains(dar_cols["status"]["default"], "pending_review")
+
+
+def test_review_tasks_pending_partial_unique_index():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    inspector = inspect(engine)
+
+    indexes = {ix["name"]: ix for ix in inspector.get_indexes("review_tasks")}
+    ix = indexes["review_task_pending_unique"]
+    assert ix["unique"]
+    assert ix["column_names"] == ["queue_type", "subject_id"]
+    assert "PENDING" in str(ix["dialect_options"]["sqlite_where"])
+
+
+def test_notification_subjects_lookup_indexes():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    inspector = inspect(engine)
+
+    indexes = {ix["name"]: ix for ix in inspector.get_indexes("notification_subjects")}
+    assert indexes["ix_ns_status_created"]["column_names"] == ["review_status", "created_at"]
+    for column in ("canonical_email", "canonical_phone"):
+        ix = indexes[f"ix_ns_{column}"]
+        assert ix["column_names"] == [column]
+        assert not ix["unique"]
+        assert "IS NOT NULL" in str(ix["dialect_options"]["sqlite_where"])
+
+
+def test_notification_subject_lookups_use_indexes():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+
+    queries = {
+        "ix_ns_status_created": (
+            "SELECT * FROM notification_subjects "
+            "WHERE review_status = 'AI_PENDING' ORDER BY created_at"
+        ),
+        "ix_ns_canonical_email": (
+            "SELECT * FROM notification_subjects WHERE canonical_email IN ('a@x.com', 'b@x.com')"
+        ),
+        "ix_ns_canonical_phone": (
+            "SELECT * FROM notification_subjects WHERE canonical_phone = '+15550000000'"
+        ),
+    }
+    with engine.connect() as conn:
+        for index_name, query in queries.items():
+            plan = " ".join(
+                str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}")
+            )
+            assert index_name in plan, plan
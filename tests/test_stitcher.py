@@ -380,3 +380,21 @@ def test_three_page_sequence(stitcher):
 def test_new_instance_starts_with_empty_buffer():
     s = PageStitcher()
     assert s.tail_buffer == []
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "\n",
+    "no newline",
+    "a\nb\nc\nd\ne\nf\ng\n",
+    "a\n\n\n\n\n\n\n",
+    "a\r\nb\r\nc\r\nd\r\ne\r\nf\r\ng",
+    "x\ny z\x0cw\rv\nu\nt",
+    "\n".join(f"row {i}" for i in range(10_000)),
+])
+def test_tail_matches_splitlines(text):
+    stitcher = PageStitcher()
+    stitcher.stitch(0, text)
+    assert stitcher.tail_buffer == text.splitlines()[-TAIL_BUFFER_LINES:]
+    _, tail_len = stitcher.stitch(1, "next")
+    assert tail_len == len("\n".join(text.splitlines()[-TAIL_BUFFER_LINES:]))
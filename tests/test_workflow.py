@@ -243,3 +243,22 @@ class TestGetSubjectsByStatus:
         wf = WorkflowEngine(db_session)
 
         assert wf.get_subjects_by_status("NONEXISTENT") == []
+
+    def test_iter_matches_list_across_batches(self, db_session):
+        for status in ("AI_PENDING", "APPROVED") * 5:
+            _make_subject(db_session, status=status)
+        wf = WorkflowEngine(db_session)
+
+        streamed = list(wf.iter_subjects_by_status("AI_PENDING", batch_size=2))
+        assert streamed == wf.get_subjects_by_status("AI_PENDING")
+        assert len(streamed) == 5
+
+
+def test_transition_tables_are_read_only():
+    from app.review.workflow import _STATUS_EVENT_MAP, _TRANSITIONS
+
+    with pytest.raises(TypeError):
+        _TRANSITIONS["REJECTED"] = frozenset({"APPROVED"})  # type: ignore[index]
+    with pytest.raises(TypeError):
+        _STATUS_EVENT_MAP["REJECTED"] = "x"  # type: ignore[index]
+    assert all(isinstance(v, frozenset) for v in _TRANSITIONS.values())